@@ -2,4 +2,117 @@
 #
 # Copyright (c) 2026 Alexandre Loeblein Heinen
 
-"""Dubins path generation and visualization tools."""
+"""Dubins path generation and visualization tools.
+
+Importing the package is cheap: the submodules, and NumPy or Matplotlib with
+them, are only imported when one of their names is first accessed, e.g.
+`dubins.shortest_dubins_path` or `dubins.plot2`.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Public names, by submodule
+_exports = {
+    "path_type": (
+        "CCC_PATH_TYPES",
+        "CSC_PATH_TYPES",
+        "Direction",
+        "InvalidReason",
+        "PathType",
+        "directions_from_path_type",
+        "path_type_from_directions",
+    ),
+    "dubins2": (
+        "DubinsPath",
+        "get_backend",
+        "set_backend",
+        "shortest_dubins_path",
+        "try_dubins_path",
+    ),
+    "batch2": (
+        "DubinsPathBatch",
+        "invalid_reasons",
+        "iterate_dubins_paths",
+        "pose_at",
+        "sample_dubins_paths",
+        "shortest_dubins_batch",
+        "shortest_dubins_lengths",
+        "solve_dubins_batch",
+    ),
+    "canonical2": (
+        "canonical_path",
+        "canonical_poses",
+        "canonical_queries",
+        "canonical_query",
+        "shortest_canonical_path",
+        "to_world_path",
+    ),
+    "cache2": ("CacheInfo", "DubinsPathCache"),
+    "table2": ("DubinsLengthTable",),
+    "bound2": ("dubins_lower_bounds", "shortest_length_with_cutoff"),
+    "matrix2": ("dubins_distance_matrix",),
+    "parallel2": ("ParallelDubinsExecutor",),
+    "collision2": (
+        "any_collision",
+        "collide_boxes",
+        "collide_circles",
+        "path_bounding_boxes",
+    ),
+    "index2": ("DubinsPathIndex", "segment_bounding_boxes"),
+    "incremental2": ("IncrementalDubinsSolver",),
+    "chain2": ("DubinsChain", "plan_dubins_chain", "sample_dubins_chain"),
+    "serialize2": (
+        "DubinsPathRecords",
+        "load_paths",
+        "paths_from_bytes",
+        "paths_to_bytes",
+        "save_paths",
+    ),
+    "instrument2": ("profile",),
+    "stream2": (
+        "iterate_pose_pair_chunks",
+        "solve_pose_pair_chunks",
+        "stream_shortest_lengths",
+    ),
+    "plot2": (
+        "plot_dubins_batch",
+        "plot_dubins_path",
+        "plot_dubins_paths",
+        "render_dubins_batch",
+    ),
+}
+_submodules = (*_exports, "benchmark", "scalar2")
+_modules_by_name = {
+    name: module for module, names in _exports.items() for name in names
+}
+
+__all__ = [name for names in _exports.values() for name in names]
+
+
+def __getattr__(name: str):
+    """
+    Import the submodule defining a public name on its first access.
+
+    Args:
+        name: Name of a submodule or of a public object.
+
+    Returns:
+        The submodule or the object.
+    """
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name in _modules_by_name:
+        module = importlib.import_module(f".{_modules_by_name[name]}", __name__)
+        value = getattr(module, name)
+        # Cache the object so that later accesses skip this function
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_submodules, *__all__})
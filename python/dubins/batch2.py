@@ -0,0 +1,864 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Vectorized 2D Dubins path generation for batches of pose pairs.
+
+The radius is either a scalar shared by the whole batch, or an array giving
+one radius per row, e.g. the minimum turning radius of each vehicle of a
+fleet. The geometry is the same code path in both cases: the radius is simply
+broadcast against the rows, and the feasibility of each row is checked with
+its own radius.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from . import instrument2
+from .path_type import (
+    CCC_PATH_TYPES,
+    InvalidReason,
+    PathType,
+    Direction,
+    directions_from_path_type,
+)
+from .scalar2 import zero_tolerance
+
+
+class DubinsPathBatch:
+    """
+    Struct-of-arrays container for a batch of 2D Dubins paths.
+
+    Every attribute is an array whose leading dimensions are the batch shape,
+    vector quantities having an extra trailing axis of size 2. No per-path
+    Python object is ever created: the i-th path of the batch is described by
+    the i-th entry of each array, including radius, which may differ between
+    rows. Infeasible paths are filled with NaN, just like an invalid scalar
+    DubinsPath.
+    """
+
+    fields = (
+        "path_type",
+        "radius",
+        "initial_position",
+        "initial_tangent_unit",
+        "final_position",
+        "final_tangent_unit",
+        "initial_center_position",
+        "final_center_position",
+        "middle_center_position",
+        "initial_tangent_position",
+        "final_tangent_position",
+        "initial_arc_angle",
+        "straight_length",
+        "middle_arc_angle",
+        "final_arc_angle",
+    )
+
+    def __init__(
+        self,
+        path_type: np.ndarray,
+        radius: np.ndarray,
+        initial_position: np.ndarray,
+        initial_tangent_unit: np.ndarray,
+        final_position: np.ndarray,
+        final_tangent_unit: np.ndarray,
+        initial_center_position: np.ndarray,
+        final_center_position: np.ndarray,
+        middle_center_position: np.ndarray,
+        initial_tangent_position: np.ndarray,
+        final_tangent_position: np.ndarray,
+        initial_arc_angle: np.ndarray,
+        straight_length: np.ndarray,
+        middle_arc_angle: np.ndarray,
+        final_arc_angle: np.ndarray,
+    ):
+        shape = np.shape(straight_length)
+        self.path_type = np.broadcast_to(path_type, shape)
+        self.radius = np.broadcast_to(radius, shape)
+        self.initial_position = initial_position
+        self.initial_tangent_unit = initial_tangent_unit
+        self.final_position = final_position
+        self.final_tangent_unit = final_tangent_unit
+        self.initial_center_position = initial_center_position
+        self.final_center_position = final_center_position
+        self.middle_center_position = middle_center_position
+        self.initial_tangent_position = initial_tangent_position
+        self.final_tangent_position = final_tangent_position
+        self.initial_arc_angle = initial_arc_angle
+        self.straight_length = straight_length
+        self.middle_arc_angle = middle_arc_angle
+        self.final_arc_angle = final_arc_angle
+
+        # Lengths are the main query on a batch, compute them once
+        self.total_length = (
+            self.initial_arc_length
+            + self.straight_length
+            + self.middle_arc_length
+            + self.final_arc_length
+        )
+
+    def __repr__(self) -> str:
+        return f"DubinsPathBatch: shape={self.shape}, valid={self.is_valid.sum()}"
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, index) -> DubinsPathBatch:
+        return DubinsPathBatch(
+            *(getattr(self, name)[index] for name in DubinsPathBatch.fields)
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Get the batch shape."""
+        return np.shape(self.straight_length)
+
+    @property
+    def is_valid(self) -> np.ndarray:
+        """
+        Check which paths are valid (non-negative lengths).
+
+        This mask is the batch counterpart of DubinsPath.is_valid: invalid
+        rows have NaN lengths, and invalid_reasons tells why.
+        """
+        return self.total_length >= 0.0
+
+    @property
+    def initial_arc_length(self) -> np.ndarray:
+        """Get the lengths of the initial arc segments."""
+        return self.radius * self.initial_arc_angle
+
+    @property
+    def middle_arc_length(self) -> np.ndarray:
+        """Get the lengths of the middle arc segments of CCC paths."""
+        return self.radius * self.middle_arc_angle
+
+    @property
+    def final_arc_length(self) -> np.ndarray:
+        """Get the lengths of the final arc segments."""
+        return self.radius * self.final_arc_angle
+
+    @staticmethod
+    def stack(batches: list[DubinsPathBatch]) -> DubinsPathBatch:
+        """
+        Stack batches of the same shape along a new leading axis.
+
+        Args:
+            batches: Batches to stack.
+
+        Returns:
+            A batch whose shape is (len(batches), *shape).
+        """
+        return DubinsPathBatch(
+            *(
+                np.stack([getattr(batch, name) for batch in batches])
+                for name in DubinsPathBatch.fields
+            )
+        )
+
+    @staticmethod
+    def from_paths(paths: list) -> DubinsPathBatch:
+        """
+        Gather DubinsPath objects into a batch.
+
+        Args:
+            paths: DubinsPath instances.
+
+        Returns:
+            A batch of shape (len(paths),).
+        """
+        return DubinsPathBatch(
+            *(
+                np.array([getattr(path, name) for path in paths])
+                for name in DubinsPathBatch.fields
+            )
+        )
+
+
+# Turn of each segment per PathType value: +1 for LEFT, -1 for RIGHT, 0 straight
+_segment_turns = np.array(
+    [
+        (
+            directions_from_path_type(path_type)[0].value,
+            (
+                -directions_from_path_type(path_type)[0].value
+                if path_type in CCC_PATH_TYPES
+                else 0
+            ),
+            directions_from_path_type(path_type)[1].value,
+        )
+        for path_type in PathType
+    ],
+    dtype=float,
+)
+
+
+def normalize_vectors(v: np.ndarray) -> np.ndarray:
+    """
+    Normalize an array of 2D vectors.
+
+    Args:
+        v: Input vectors as a (..., 2) numpy array.
+
+    Returns:
+        Normalized vectors, zero where the input norm is close to zero.
+    """
+    norm = np.hypot(v[..., 0], v[..., 1])[..., np.newaxis]
+    is_zero = np.isclose(norm, 0.0)
+    return np.where(is_zero, 0.0, v / np.where(is_zero, 1.0, norm))
+
+
+def clamp_ratios(ratio: np.ndarray) -> np.ndarray:
+    """
+    Clamp feasibility ratios to 1 for circles tangent up to rounding errors.
+
+    Args:
+        ratio: Ratios of 2 * radius to the distances between circle centers.
+
+    Returns:
+        The ratios, 1 where they are within the zero tolerance of 1, see
+        scalar2.clamp_ratio.
+    """
+    return np.where(np.abs(ratio - 1.0) <= zero_tolerance, 1.0, ratio)
+
+
+def wrap_arc_angles(angle: np.ndarray) -> np.ndarray:
+    """
+    Wrap arc angles into [0, 2*pi), snapping near full turns to 0.
+
+    Args:
+        angle: Signed swept angles in radians.
+
+    Returns:
+        Swept angles in radians, within [0, 2*pi), see scalar2.wrap_arc_angle.
+    """
+    angle = np.mod(angle, 2 * np.pi)
+    return np.where(angle >= 2 * np.pi - zero_tolerance, 0.0, angle)
+
+
+def rotate_vectors(v: np.ndarray, angle: np.ndarray | float) -> np.ndarray:
+    """
+    Rotate an array of 2D vectors by the given angles.
+
+    Args:
+        v: Input vectors as a (..., 2) numpy array.
+        angle: Angles in radians, broadcastable to the batch shape.
+
+    Returns:
+        Rotated vectors as a (..., 2) numpy array.
+    """
+    cos = np.cos(angle)
+    sin = np.sin(angle)
+    return np.stack(
+        (cos * v[..., 0] - sin * v[..., 1], sin * v[..., 0] + cos * v[..., 1]),
+        axis=-1,
+    )
+
+
+def compute_center_positions(
+    position: np.ndarray,
+    tangent_unit: np.ndarray,
+    radius: float | np.ndarray,
+    direction: Direction,
+) -> np.ndarray:
+    """
+    Compute the circle center positions of a batch of poses.
+
+    Args:
+        position: Positions as a (..., 2) numpy array.
+        tangent_unit: Tangent unit vectors as a (..., 2) numpy array.
+        radius: Radius of the circles, a scalar or a (...) array.
+        direction: Direction of turn (LEFT=CCW, RIGHT=CW).
+
+    Returns:
+        Center positions as a (..., 2) numpy array.
+    """
+    # Same as the cross product of the tangent with the unit z vector
+    radial_unit = np.stack((tangent_unit[..., 1], -tangent_unit[..., 0]), axis=-1)
+    return (
+        position - direction.value * np.asarray(radius)[..., np.newaxis] * radial_unit
+    )
+
+
+@instrument2.timed("batch.tangents")
+def compute_tangent_positions(
+    initial_center: np.ndarray,
+    final_center: np.ndarray,
+    radius: float | np.ndarray,
+    path_type: PathType,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the tangent positions between two batches of circles.
+
+    Contrary to the scalar version, coincident centers, overlapping circles
+    for LSR/RSL and too distant circles for RLR/LRL do not raise nor warn: the
+    corresponding rows are filled with NaN. The feasibility ratios are
+    computed per row, with the radius of each row.
+
+    Args:
+        initial_center: Centers of the initial circles as a (..., 2) array.
+        final_center: Centers of the final circles as a (..., 2) array.
+        radius: Radius of the circles, a scalar or a (...) array.
+        path_type: Type of the Dubins paths.
+
+    Returns:
+        A tuple containing the initial and final tangent positions.
+    """
+    offset_position = final_center - initial_center
+    distance = np.hypot(offset_position[..., 0], offset_position[..., 1])
+    is_valid = ~np.isclose(distance, 0.0)
+
+    match path_type:
+        case PathType.LSL:
+            initial_relative_azimuth = -0.5 * np.pi
+            final_relative_azimuth = -0.5 * np.pi
+
+        case PathType.LSR | PathType.RSL:
+            # The belt between the circles only exists when they do not overlap
+            ratio = clamp_ratios(2 * radius / np.where(is_valid, distance, np.inf))
+            is_valid &= ratio <= 1.0
+            belt_azimuth = np.arccos(np.where(is_valid, ratio, 0.0))
+            if path_type == PathType.LSR:
+                initial_relative_azimuth = -belt_azimuth
+                final_relative_azimuth = np.pi - belt_azimuth
+            else:
+                initial_relative_azimuth = belt_azimuth
+                final_relative_azimuth = -np.pi + belt_azimuth
+
+        case PathType.RSR:
+            initial_relative_azimuth = 0.5 * np.pi
+            final_relative_azimuth = 0.5 * np.pi
+
+        case PathType.RLR | PathType.LRL:
+            # The middle circle only touches both circles when close enough
+            ratio = np.where(is_valid, distance, np.inf) / (4 * radius)
+            is_valid &= ratio <= 1.0
+            triangle_azimuth = np.arccos(np.where(is_valid, ratio, 0.0))
+            if path_type == PathType.RLR:
+                initial_relative_azimuth = -triangle_azimuth
+                final_relative_azimuth = np.pi + triangle_azimuth
+            else:
+                initial_relative_azimuth = triangle_azimuth
+                final_relative_azimuth = np.pi - triangle_azimuth
+
+        case _:
+            raise ValueError(f"Invalid Dubins path type: {path_type}")
+
+    offset_unit = (
+        offset_position / np.where(is_valid, distance, np.nan)[..., np.newaxis]
+    )
+    radius = np.asarray(radius)[..., np.newaxis]
+    return (
+        rotate_vectors(offset_unit, initial_relative_azimuth) * radius + initial_center,
+        rotate_vectors(offset_unit, final_relative_azimuth) * radius + final_center,
+    )
+
+
+def relative_azimuths(
+    initial_position: np.ndarray,
+    final_position: np.ndarray,
+    center_position: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the relative azimuth angles from one batch of positions to another
+    around a batch of center positions.
+
+    Args:
+        initial_position: Initial positions as a (..., 2) numpy array.
+        final_position: Final positions as a (..., 2) numpy array.
+        center_position: Center positions as a (..., 2) numpy array.
+
+    Returns:
+        Relative azimuth angles in radians.
+    """
+    initial_vector = initial_position - center_position
+    final_vector = final_position - center_position
+
+    initial_angle = np.arctan2(initial_vector[..., 1], initial_vector[..., 0])
+    final_angle = np.arctan2(final_vector[..., 1], final_vector[..., 0])
+
+    return final_angle - initial_angle
+
+
+@instrument2.timed("batch.compute_paths")
+def compute_dubins_paths(
+    path_type: PathType,
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+    initial_center_position: np.ndarray | None = None,
+    final_center_position: np.ndarray | None = None,
+) -> DubinsPathBatch:
+    """
+    Compute a batch of Dubins paths sharing the same path type.
+
+    Args:
+        path_type: Type of the Dubins paths.
+        radius: Radius of the circles, a scalar or a (N,) array of row radii.
+        initial_position: Initial positions as a (N, 2) numpy array.
+        initial_tangent_unit: Initial unit tangents as a (N, 2) numpy array.
+        final_position: Final positions as a (N, 2) numpy array.
+        final_tangent_unit: Final unit tangents as a (N, 2) numpy array.
+        initial_center_position: Optional precomputed initial circle centers.
+        final_center_position: Optional precomputed final circle centers.
+
+    Returns:
+        The batch of Dubins paths, of shape (N,).
+    """
+    initial_direction, final_direction = directions_from_path_type(path_type)
+
+    if initial_center_position is None:
+        initial_center_position = compute_center_positions(
+            initial_position, initial_tangent_unit, radius, initial_direction
+        )
+    if final_center_position is None:
+        final_center_position = compute_center_positions(
+            final_position, final_tangent_unit, radius, final_direction
+        )
+
+    initial_tangent_position, final_tangent_position = compute_tangent_positions(
+        initial_center_position, final_center_position, radius, path_type
+    )
+
+    initial_arc_angle = wrap_arc_angles(
+        initial_direction.value
+        * relative_azimuths(
+            initial_position, initial_tangent_position, initial_center_position
+        )
+    )
+    final_arc_angle = wrap_arc_angles(
+        final_direction.value
+        * relative_azimuths(
+            final_tangent_position, final_position, final_center_position
+        )
+    )
+
+    if path_type in CCC_PATH_TYPES:
+        # Reflection of the initial center through the initial tangent position
+        middle_center_position = 2 * initial_tangent_position - initial_center_position
+        middle_arc_angle = wrap_arc_angles(
+            -initial_direction.value
+            * relative_azimuths(
+                initial_tangent_position,
+                final_tangent_position,
+                middle_center_position,
+            )
+        )
+        straight_length = np.zeros_like(middle_arc_angle)
+    else:
+        straight_offset = final_tangent_position - initial_tangent_position
+        straight_length = np.hypot(straight_offset[..., 0], straight_offset[..., 1])
+        middle_center_position = np.full_like(initial_tangent_position, np.nan)
+        middle_arc_angle = np.zeros_like(straight_length)
+
+    batch = DubinsPathBatch(
+        path_type=np.int8(path_type),
+        radius=radius,
+        initial_position=initial_position,
+        initial_tangent_unit=initial_tangent_unit,
+        final_position=final_position,
+        final_tangent_unit=final_tangent_unit,
+        initial_center_position=initial_center_position,
+        final_center_position=final_center_position,
+        middle_center_position=middle_center_position,
+        initial_tangent_position=initial_tangent_position,
+        final_tangent_position=final_tangent_position,
+        initial_arc_angle=initial_arc_angle,
+        straight_length=straight_length,
+        middle_arc_angle=middle_arc_angle,
+        final_arc_angle=final_arc_angle,
+    )
+    if instrument2.is_enabled():
+        instrument2.increment("batch.paths", batch.total_length.size)
+        instrument2.increment("batch.invalid", np.count_nonzero(~batch.is_valid))
+    return batch
+
+
+def iterate_dubins_paths(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+    path_types: tuple[PathType, ...] = tuple(PathType),
+    initial_centers: dict[Direction, np.ndarray] | None = None,
+) -> Iterator[DubinsPathBatch]:
+    """
+    Compute the Dubins paths of every requested type for N pose pairs, one
+    path type at a time.
+
+    The circle centers are computed once per turn direction and shared by all
+    the path types starting or ending with that direction.
+
+    Args:
+        radius: Radius of the circles, a scalar or a (N,) array of row radii.
+        initial_position: Initial positions as a (N, 2) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a (N, 2) numpy array.
+        final_position: Final positions as a (N, 2) numpy array.
+        final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+        path_types: Path types to compute, all of them by default.
+        initial_centers: Optional precomputed initial circle centers, by turn
+            direction, broadcastable to (N, 2), e.g. for many goals from the
+            same start pose.
+
+    Yields:
+        The batch of Dubins paths of each path type, of shape (N,).
+    """
+    radius = np.asarray(radius, dtype=float)
+    initial_position, final_position = np.broadcast_arrays(
+        np.asarray(initial_position, dtype=float),
+        np.asarray(final_position, dtype=float),
+    )
+    initial_tangent_unit = normalize_vectors(
+        np.broadcast_to(
+            np.asarray(initial_tangent_unit, dtype=float), initial_position.shape
+        )
+    )
+    final_tangent_unit = normalize_vectors(
+        np.broadcast_to(
+            np.asarray(final_tangent_unit, dtype=float), final_position.shape
+        )
+    )
+
+    if initial_centers is None:
+        initial_centers = {
+            direction: compute_center_positions(
+                initial_position, initial_tangent_unit, radius, direction
+            )
+            for direction in Direction
+        }
+    final_centers = {
+        direction: compute_center_positions(
+            final_position, final_tangent_unit, radius, direction
+        )
+        for direction in Direction
+    }
+
+    for path_type in path_types:
+        initial_direction, final_direction = directions_from_path_type(path_type)
+        yield compute_dubins_paths(
+            path_type,
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+            np.broadcast_to(initial_centers[initial_direction], initial_position.shape),
+            final_centers[final_direction],
+        )
+
+
+def solve_dubins_batch(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+    path_types: tuple[PathType, ...] = tuple(PathType),
+) -> DubinsPathBatch:
+    """
+    Compute the Dubins paths of every requested type for N pose pairs.
+
+    Args:
+        radius: Radius of the circles, a scalar or a (N,) array of row radii.
+        initial_position: Initial positions as a (N, 2) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a (N, 2) numpy array.
+        final_position: Final positions as a (N, 2) numpy array.
+        final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+        path_types: Path types to compute, all of them by default.
+
+    Returns:
+        The batch of Dubins paths, of shape (len(path_types), N), so that
+        `batch[i]` holds the paths of type `path_types[i]`.
+    """
+    return DubinsPathBatch.stack(
+        list(
+            iterate_dubins_paths(
+                radius,
+                initial_position,
+                initial_tangent_unit,
+                final_position,
+                final_tangent_unit,
+                path_types,
+            )
+        )
+    )
+
+
+def shortest_dubins_lengths(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the type and length of the shortest Dubins path for N pose pairs.
+
+    Only a running minimum is kept while the path types are solved, so the
+    memory footprint does not grow with the number of path types.
+
+    Args:
+        radius: Radius of the circles, a scalar or a (N,) array of row radii.
+        initial_position: Initial positions as a (N, 2) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a (N, 2) numpy array.
+        final_position: Final positions as a (N, 2) numpy array.
+        final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+
+    Returns:
+        A tuple containing the PathType value of the shortest path of each row,
+        as an int8 array, and its length. Rows without any feasible path have
+        the type -1 and a NaN length.
+    """
+    return reduce_shortest_lengths(
+        iterate_dubins_paths(
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+    )
+
+
+def reduce_shortest_lengths(
+    batches: Iterable[DubinsPathBatch],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keep the type and length of the shortest path of each row over batches.
+
+    Args:
+        batches: Batches of Dubins paths of the same shape, one per path type,
+            e.g. yielded by iterate_dubins_paths.
+
+    Returns:
+        The same as shortest_dubins_lengths.
+    """
+    best_path_type = None
+    best_length = None
+    for batch in batches:
+        if best_length is None:
+            best_path_type = np.full(batch.shape, -1, dtype=np.int8)
+            best_length = np.full(batch.shape, np.inf)
+
+        # NaN lengths compare as False, so infeasible paths never win
+        is_shorter = batch.total_length < best_length
+        best_path_type[is_shorter] = batch.path_type[is_shorter]
+        best_length[is_shorter] = batch.total_length[is_shorter]
+
+    best_length[best_path_type < 0] = np.nan
+    return best_path_type, best_length
+
+
+def shortest_dubins_batch(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+) -> DubinsPathBatch:
+    """
+    Compute the full geometry of the shortest Dubins path for N pose pairs.
+
+    Args:
+        radius: Radius of the circles, a scalar or a (N,) array of row radii.
+        initial_position: Initial positions as a (N, 2) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a (N, 2) numpy array.
+        final_position: Final positions as a (N, 2) numpy array.
+        final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+
+    Returns:
+        The batch of the shortest Dubins paths, of shape (N,). Rows without
+        any feasible path are invalid.
+    """
+    return select_shortest_paths(
+        solve_dubins_batch(
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+    )
+
+
+def select_shortest_paths(batch: DubinsPathBatch) -> DubinsPathBatch:
+    """
+    Select the shortest path of each row among the path types.
+
+    Args:
+        batch: Batch of Dubins paths of shape (T, N), one row per path type,
+            like the output of solve_dubins_batch.
+
+    Returns:
+        The batch of the shortest paths, of shape (N,). Rows without any
+        feasible path are invalid.
+    """
+    best_index = np.argmin(np.nan_to_num(batch.total_length, nan=np.inf), axis=0)
+    return batch[best_index, np.arange(batch.shape[1])]
+
+
+def invalid_reasons(batch: DubinsPathBatch) -> np.ndarray:
+    """
+    Find why the paths of a batch do not exist, without solving anything.
+
+    The reasons only depend on the circle centers, the radius and the path
+    type of each row, which the batch already holds, and use the same tests
+    as compute_tangent_positions.
+
+    Args:
+        batch: Batch of Dubins paths of shape S, possibly mixing path types.
+
+    Returns:
+        The InvalidReason values as a S int8 array, NONE exactly where
+        batch.is_valid is True.
+    """
+    offset = batch.final_center_position - batch.initial_center_position
+    distance = np.hypot(offset[..., 0], offset[..., 1])
+    radius = batch.radius
+    path_type = batch.path_type
+    is_belt = (path_type == PathType.LSR) | (path_type == PathType.RSL)
+    is_ccc = np.isin(path_type, CCC_PATH_TYPES)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        conditions = (
+            ~(np.isfinite(distance) & np.isfinite(radius)),
+            np.isclose(distance, 0.0),
+            is_belt & (clamp_ratios(2 * radius / distance) > 1.0),
+            is_ccc & (distance / (4 * radius) > 1.0),
+        )
+    return np.select(
+        conditions,
+        (
+            InvalidReason.INVALID_INPUT,
+            InvalidReason.COINCIDENT_CENTERS,
+            InvalidReason.OVERLAPPING_CIRCLES,
+            InvalidReason.DISTANT_CIRCLES,
+        ),
+        InvalidReason.NONE,
+    ).astype(np.int8)
+
+
+def compute_segments(
+    batch: DubinsPathBatch,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Describe the three segments of each path of a batch.
+
+    Each segment starts at an arc length offset along the path, from an
+    origin with a start angle, and turns in a given direction. For arcs, the
+    origin is the circle center and the angle is the azimuth of the segment
+    start. For straight segments, the turn is zero, the origin is the segment
+    start and the angle is the heading.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+
+    Returns:
+        A tuple containing the turns, arc length offsets, lengths and start
+        angles as S + (3,) arrays, and the origins as a S + (3, 2) array.
+    """
+    turn = _segment_turns[batch.path_type]
+    length = np.stack(
+        (
+            batch.initial_arc_length,
+            batch.straight_length + batch.middle_arc_length,
+            batch.final_arc_length,
+        ),
+        axis=-1,
+    )
+    offset = np.cumsum(length, axis=-1) - length
+
+    initial_vector = batch.initial_position - batch.initial_center_position
+    initial_angle = np.arctan2(initial_vector[..., 1], initial_vector[..., 0])
+    final_vector = batch.final_tangent_position - batch.final_center_position
+    final_angle = np.arctan2(final_vector[..., 1], final_vector[..., 0])
+
+    # The straight segment keeps the heading at the end of the initial arc
+    is_straight = turn[..., 1] == 0
+    middle_vector = batch.initial_tangent_position - batch.middle_center_position
+    middle_angle = np.where(
+        is_straight,
+        initial_angle + turn[..., 0] * (batch.initial_arc_angle + 0.5 * np.pi),
+        np.arctan2(middle_vector[..., 1], middle_vector[..., 0]),
+    )
+    middle_origin = np.where(
+        is_straight[..., np.newaxis],
+        batch.initial_tangent_position,
+        batch.middle_center_position,
+    )
+
+    angle = np.stack((initial_angle, middle_angle, final_angle), axis=-1)
+    origin = np.stack(
+        (batch.initial_center_position, middle_origin, batch.final_center_position),
+        axis=-2,
+    )
+    return turn, offset, length, angle, origin
+
+
+@instrument2.timed("batch.pose_at")
+def pose_at(
+    batch: DubinsPathBatch, s: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Evaluate the poses of a batch of paths at given arc lengths.
+
+    The segment of each arc length is located from the cumulative segment
+    lengths and the pose is evaluated in closed form, with a single cos/sin
+    evaluation per pose.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        s: Arc lengths along each path, broadcastable to S + (n,). Values out
+            of [0, total_length] are clipped.
+        out: Optional S + (n, 3) array where the poses are written.
+
+    Returns:
+        The (x, y, heading) poses as a S + (n, 3) array, headings within
+        [-pi, pi).
+    """
+    turn, offset, length, angle, origin = compute_segments(batch)
+    radius = batch.radius[..., np.newaxis]
+    s = np.clip(s, 0.0, batch.total_length[..., np.newaxis])
+
+    # Index of the segment of each arc length
+    index = (s >= offset[..., 1:2]).astype(np.intp) + (s >= offset[..., 2:3])
+    turn = np.take_along_axis(turn, index, axis=-1)
+    distance = s - np.take_along_axis(offset, index, axis=-1)
+    angle = np.take_along_axis(angle, index, axis=-1) + turn * distance / radius
+    origin = np.take_along_axis(origin, index[..., np.newaxis], axis=-2)
+
+    # Arcs move on the circle around the origin, straights along the heading
+    scale = np.where(turn == 0, distance, radius)
+    if out is None:
+        out = np.empty(np.shape(s) + (3,))
+    out[..., 0] = origin[..., 0] + scale * np.cos(angle)
+    out[..., 1] = origin[..., 1] + scale * np.sin(angle)
+    out[..., 2] = np.mod(angle + turn * 0.5 * np.pi + np.pi, 2 * np.pi) - np.pi
+    if instrument2.is_enabled():
+        instrument2.increment("batch.samples", np.size(s))
+    return out
+
+
+def sample_dubins_paths(
+    batch: DubinsPathBatch, n: int = 100, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Sample poses evenly spaced by arc length along a batch of paths.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        n: Number of samples per path, including both ends.
+        out: Optional S + (n, 3) array where the samples are written.
+
+    Returns:
+        The (x, y, heading) samples as a S + (n, 3) array.
+    """
+    s = np.linspace(0.0, batch.total_length, n, axis=-1)
+    return pose_at(batch, s, out)
@@ -0,0 +1,1033 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Benchmarks for the 2D Dubins path tools.
+
+Benchmarks are run as a module from the python directory. Single benchmarks
+are run by name, e.g. `python -m dubins.benchmark batch`. The regression suite
+is run with `python -m dubins.benchmark suite --output new.json --baseline
+old.json`, which exits with an error when a result is slower than the baseline
+by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger("dubins")
+
+
+def random_poses(
+    size: int, seed: int = 0, extent: float = 10.0
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw seeded random pose pairs.
+
+    Args:
+        size: Number of pose pairs.
+        seed: Seed of the random generator.
+        extent: Half width of the square where the positions are drawn.
+
+    Returns:
+        Initial positions, initial tangents, final positions and final
+        tangents, each as a (size, 2) numpy array.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-extent, extent, (2, size, 2))
+    headings = rng.uniform(-np.pi, np.pi, (2, size))
+    tangents = np.stack((np.cos(headings), np.sin(headings)), axis=-1)
+    return positions[0], tangents[0], positions[1], tangents[1]
+
+
+def best_time(function: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Measure the best wall time of several runs of a function.
+
+    Args:
+        function: Function to time, called without arguments.
+        repeat: Number of runs.
+
+    Returns:
+        The best run time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_batch(size: int = 10_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the throughput of the batch solver against DubinsPath objects.
+
+    Both sides compute the paths of every PathType for the same pose pairs.
+    The scalar class is timed on a subset since it is orders of magnitude
+    slower, and its throughput is extrapolated. The batch solver is also
+    timed with a different radius per row.
+
+    Args:
+        size: Number of pose pairs of the batch solver.
+        radius: Radius of the circles.
+
+    Returns:
+        The throughput of each side in paths per second.
+    """
+    from .path_type import PathType
+    from .dubins2 import DubinsPath
+    from .batch2 import solve_dubins_batch
+
+    poses = random_poses(size)
+    scalar_size = min(size, 1000)
+
+    def build_scalar():
+        # Overlapping circles make LSR/RSL paths NaN, which is expected here
+        with np.errstate(invalid="ignore"):
+            for i in range(scalar_size):
+                for path_type in PathType:
+                    DubinsPath(
+                        path_type,
+                        radius,
+                        poses[0][i],
+                        poses[1][i],
+                        poses[2][i],
+                        poses[3][i],
+                    )
+
+    # Mixed fleet: every row has its own radius, within a factor 4
+    radii = radius * np.random.default_rng(1).uniform(0.5, 2.0, size)
+
+    n_types = len(PathType)
+    scalar_time = best_time(build_scalar, repeat=1)
+    batch_time = best_time(lambda: solve_dubins_batch(radius, *poses))
+    mixed_time = best_time(lambda: solve_dubins_batch(radii, *poses))
+
+    return {
+        "scalar_paths_per_second": scalar_size * n_types / scalar_time,
+        "batch_paths_per_second": size * n_types / batch_time,
+        "mixed_radius_paths_per_second": size * n_types / mixed_time,
+    }
+
+
+def benchmark_path_object(size: int = 10_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the memory footprint and the length access time of DubinsPath.
+
+    Args:
+        size: Number of paths to build.
+        radius: Radius of the circles.
+
+    Returns:
+        The memory per path in bytes, the construction time per path and the
+        time per total_length access in seconds.
+    """
+    from .path_type import PathType
+    from .dubins2 import DubinsPath
+
+    poses = random_poses(size)
+
+    def build_paths():
+        return [
+            DubinsPath(PathType.LSL, radius, *(pose[i] for pose in poses))
+            for i in range(size)
+        ]
+
+    tracemalloc.start()
+    paths = build_paths()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    def access_lengths():
+        for path in paths:
+            path.total_length
+
+    return {
+        "bytes_per_path": memory / size,
+        "seconds_per_construction": best_time(build_paths, repeat=1) / size,
+        "seconds_per_total_length": best_time(access_lengths) / size,
+    }
+
+
+def benchmark_backends(size: int = 1000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the single query latency of the numpy and math backends.
+
+    Args:
+        size: Number of queries.
+        radius: Radius of the circles.
+
+    Returns:
+        The time per query in seconds of DubinsPath construction and of
+        shortest_dubins_path, for each backend.
+    """
+    from .path_type import PathType
+    from .dubins2 import DubinsPath, shortest_dubins_path
+
+    poses = random_poses(size)
+    queries = [tuple(pose[i] for pose in poses) for i in range(size)]
+    results = {}
+
+    for backend in ("numpy", "math"):
+
+        def build_paths():
+            for query in queries:
+                DubinsPath(PathType.LSL, radius, *query, backend=backend)
+
+        def find_shortest_paths():
+            for query in queries:
+                shortest_dubins_path(radius, *query, backend=backend)
+
+        results[f"{backend}_seconds_per_path"] = best_time(build_paths) / size
+        results[f"{backend}_seconds_per_shortest"] = (
+            best_time(find_shortest_paths) / size
+        )
+
+    return results
+
+
+def benchmark_cache(size: int = 1000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the shortest path latency with and without a DubinsPathCache.
+
+    Args:
+        size: Number of distinct queries, each one repeated 10 times.
+        radius: Radius of the circles.
+
+    Returns:
+        The time per query in seconds with and without cache, and the hit
+        rate of the cache.
+    """
+    from .dubins2 import shortest_dubins_path
+    from .cache2 import DubinsPathCache
+
+    poses = random_poses(size)
+    queries = [tuple(pose[i] for pose in poses) for i in range(size)] * 10
+    np.random.default_rng(0).shuffle(queries)
+    cache = DubinsPathCache(maxsize=size)
+
+    def find_shortest_paths():
+        for query in queries:
+            shortest_dubins_path(radius, *query)
+
+    def find_cached_shortest_paths():
+        cache.clear()
+        for query in queries:
+            cache.shortest_path(radius, *query)
+
+    cached_time = best_time(find_cached_shortest_paths, repeat=3)
+    info = cache.cache_info()
+    return {
+        "seconds_per_shortest": best_time(find_shortest_paths, repeat=3) / len(queries),
+        "cached_seconds_per_shortest": cached_time / len(queries),
+        "hit_rate": info.hits / (info.hits + info.misses),
+    }
+
+
+def benchmark_table(size: int = 100_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the lookup table throughput and error against the exact solver.
+
+    Args:
+        size: Number of pose pairs.
+        radius: Radius of the circles.
+
+    Returns:
+        The throughput in pose pairs per second of the table and of the exact
+        solver, their single query latency in seconds, the build time of the
+        table, its estimated errors and the measured maximum error, in radii,
+        far from the initial pose.
+    """
+    from .dubins2 import shortest_dubins_path
+    from .batch2 import shortest_dubins_lengths
+    from .table2 import DubinsLengthTable, near_distance
+
+    start = time.perf_counter()
+    table = DubinsLengthTable.build()
+    build_time = time.perf_counter() - start
+
+    # Keep the offsets within the table span
+    poses = random_poses(size, extent=0.35 * table.extent * radius)
+    _, lengths = table.lookup(radius, *poses)
+    _, exact_lengths = shortest_dubins_lengths(radius, *poses)
+    distances = np.linalg.norm(poses[2] - poses[0], axis=-1) / radius
+    errors = np.abs(lengths - exact_lengths)[distances >= near_distance] / radius
+    queries = [tuple(pose[i] for pose in poses) for i in range(min(size, 1000))]
+
+    def lookup_lengths():
+        for query in queries:
+            table.lookup_length(radius, *query)
+
+    def find_shortest_paths():
+        for query in queries:
+            shortest_dubins_path(radius, *query, backend="math")
+
+    return {
+        "table_pairs_per_second": size
+        / best_time(lambda: table.lookup(radius, *poses)),
+        "exact_pairs_per_second": size
+        / best_time(lambda: shortest_dubins_lengths(radius, *poses), repeat=3),
+        "table_seconds_per_query": best_time(lookup_lengths) / len(queries),
+        "exact_seconds_per_query": best_time(find_shortest_paths) / len(queries),
+        "build_seconds": build_time,
+        "estimated_far_error": table.far_error,
+        "measured_far_error": float(np.max(errors)),
+        "estimated_near_error": table.near_error,
+    }
+
+
+def benchmark_cutoff(size: int = 100_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the lower bound rejection against solving every query exactly.
+
+    The cutoff is the 20th percentile of the shortest lengths, as when a
+    search only keeps the candidates shorter than its best ones.
+
+    Args:
+        size: Number of pose pairs.
+        radius: Radius of the circles.
+
+    Returns:
+        The throughput in pose pairs per second with and without cutoff, and
+        the fraction of exact evaluations saved.
+    """
+    from .batch2 import shortest_dubins_lengths
+    from .bound2 import shortest_length_with_cutoff
+
+    poses = random_poses(size)
+    _, lengths = shortest_dubins_lengths(radius, *poses)
+    cutoff = np.percentile(lengths, 20)
+    _, _, rejected = shortest_length_with_cutoff(radius, *poses, cutoff)
+
+    return {
+        "exact_pairs_per_second": size
+        / best_time(lambda: shortest_dubins_lengths(radius, *poses), repeat=3),
+        "cutoff_pairs_per_second": size
+        / best_time(
+            lambda: shortest_length_with_cutoff(radius, *poses, cutoff), repeat=3
+        ),
+        "saved_fraction": rejected / size,
+    }
+
+
+def benchmark_collision(size: int = 1000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the analytic collision checks with point sampling checks.
+
+    Args:
+        size: Number of paths.
+        radius: Radius of the circles.
+
+    Returns:
+        The (path, obstacle) pairs checked per second analytically and by
+        testing 200 samples per path, against 50 circles and 50 boxes.
+    """
+    from .batch2 import sample_dubins_paths, shortest_dubins_batch
+    from .collision2 import any_collision
+
+    batch = shortest_dubins_batch(radius, *random_poses(size))
+    rng = np.random.default_rng(1)
+    centers = rng.uniform(-10.0, 10.0, (50, 2))
+    radii = rng.uniform(0.2, 2.0, 50)
+    corners = rng.uniform(-10.0, 10.0, (50, 2))
+    boxes = np.concatenate((corners, corners + rng.uniform(0.1, 3.0, (50, 2))), 1)
+
+    def check_sampled():
+        samples = sample_dubins_paths(batch, 200)[..., np.newaxis, :, :2]
+        np.any(
+            np.linalg.norm(samples - centers[:, np.newaxis], axis=-1)
+            <= radii[:, np.newaxis],
+            axis=-1,
+        )
+        np.any(
+            np.all(
+                (samples >= boxes[:, np.newaxis, :2])
+                & (samples <= boxes[:, np.newaxis, 2:]),
+                axis=-1,
+            ),
+            axis=-1,
+        )
+
+    pairs = size * (len(centers) + len(boxes))
+    return {
+        "analytic_pairs_per_second": pairs
+        / best_time(lambda: any_collision(batch, centers, radii, boxes)),
+        "sampled_pairs_per_second": pairs / best_time(check_sampled, repeat=3),
+    }
+
+
+def benchmark_index(size: int = 100_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the spatial index queries with linear scans of all the paths.
+
+    The paths join poses drawn within 10 radii of each other, scattered over
+    a square of size**0.5 radii aside, like the edges of a roadmap.
+
+    Args:
+        size: Number of indexed paths.
+        radius: Radius of the circles.
+
+    Returns:
+        The index build time, and the point queries per second of the index
+        and of collide_circles over all the paths.
+    """
+    from .batch2 import shortest_dubins_batch
+    from .collision2 import collide_circles
+    from .index2 import DubinsPathIndex
+
+    positions, tangents, offsets, final_tangents = random_poses(size)
+    positions *= 0.1 * radius * np.sqrt(size)
+    batch = shortest_dubins_batch(
+        radius, positions, tangents, positions + 0.5 * offsets, final_tangents
+    )
+    index = DubinsPathIndex(batch)
+    points = positions[:100] + offsets[:100]
+
+    def query_index():
+        for point in points:
+            index.paths_near_point(point, radius)
+
+    def scan_paths():
+        for point in points[:10]:
+            collide_circles(batch, point, radius)
+
+    return {
+        "build_seconds": best_time(lambda: DubinsPathIndex(batch), repeat=3),
+        "index_queries_per_second": len(points) / best_time(query_index),
+        "scan_queries_per_second": 10 / best_time(scan_paths, repeat=3),
+    }
+
+
+def benchmark_serialize(size: int = 100_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the binary path records with pickled DubinsPath objects.
+
+    Args:
+        size: Number of paths.
+        radius: Radius of the circles.
+
+    Returns:
+        The bytes per path and the load time, up to a usable batch for the
+        records, of the records with and without geometry and of a pickled
+        list of DubinsPath objects.
+    """
+    from .batch2 import shortest_dubins_batch
+    from .serialize2 import paths_from_bytes, paths_to_bytes
+
+    batch = shortest_dubins_batch(radius, *random_poses(size))
+    paths = list(paths_from_bytes(paths_to_bytes(batch)))
+    buffers = {
+        "geometry": paths_to_bytes(batch),
+        "poses": paths_to_bytes(batch, geometry=False),
+        "pickle": pickle.dumps(paths, protocol=pickle.HIGHEST_PROTOCOL),
+    }
+
+    loads = {
+        "geometry": lambda: paths_from_bytes(buffers["geometry"]).batch,
+        "poses": lambda: paths_from_bytes(buffers["poses"]).batch,
+        "pickle": lambda: pickle.loads(buffers["pickle"]),
+    }
+
+    results = {}
+    for name, buffer in buffers.items():
+        results[f"{name}_bytes_per_path"] = len(buffer) / size
+        results[f"{name}_load_seconds"] = best_time(loads[name], repeat=3)
+    return results
+
+
+def benchmark_incremental(size: int = 1000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the incremental solver with solving from scratch for moving goals.
+
+    Args:
+        size: Number of goal poses, solved one per tick and as a batch.
+        radius: Radius of the circles.
+
+    Returns:
+        The ticks per second of IncrementalDubinsSolver.shortest_path and of
+        shortest_dubins_path with both backends, and the goals per second of
+        the batched incremental and from scratch shortest lengths.
+    """
+    from .dubins2 import shortest_dubins_path
+    from .batch2 import shortest_dubins_lengths
+    from .incremental2 import IncrementalDubinsSolver
+
+    _, _, goal_positions, goal_tangents = random_poses(size)
+    start_position = np.zeros(2)
+    start_tangent = np.array((1.0, 0.0))
+    solver = IncrementalDubinsSolver(radius, start_position, start_tangent)
+
+    def track_incremental():
+        for goal in zip(goal_positions, goal_tangents):
+            solver.shortest_path(*goal)
+
+    def track_from_scratch(backend: str):
+        for goal in zip(goal_positions, goal_tangents):
+            shortest_dubins_path(radius, start_position, start_tangent, *goal, backend)
+
+    start_positions = np.broadcast_to(start_position, goal_positions.shape)
+    start_tangents = np.broadcast_to(start_tangent, goal_tangents.shape)
+    return {
+        "incremental_ticks_per_second": size / best_time(track_incremental),
+        "math_ticks_per_second": size / best_time(lambda: track_from_scratch("math")),
+        "numpy_ticks_per_second": size
+        / best_time(lambda: track_from_scratch("numpy"), repeat=1),
+        "incremental_batch_per_second": size
+        / best_time(lambda: solver.shortest_lengths(goal_positions, goal_tangents)),
+        "batch_per_second": size
+        / best_time(
+            lambda: shortest_dubins_lengths(
+                radius, start_positions, start_tangents, goal_positions, goal_tangents
+            )
+        ),
+    }
+
+
+def benchmark_chain(size: int = 200, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the vectorized chain planner with scalar candidate evaluations.
+
+    Args:
+        size: Number of waypoints of the chain.
+        radius: Radius of the circles.
+
+    Returns:
+        The legs per second, with 36 candidate headings per waypoint, of
+        plan_dubins_chain and of the layer lengths evaluated one pose pair at
+        a time with shortest_dubins_path on a few legs.
+    """
+    from .dubins2 import shortest_dubins_path
+    from .chain2 import candidate_headings, plan_dubins_chain
+
+    rng = np.random.default_rng(0)
+    positions = np.cumsum(rng.uniform(-3.0, 3.0, (size, 2)) * radius, axis=0)
+    headings = candidate_headings(size, 36)
+    tangents = np.stack((np.cos(headings), np.sin(headings)), axis=-1)
+    scalar_size = min(size - 1, 2)
+
+    def evaluate_layers():
+        for leg in range(scalar_size):
+            for initial_tangent in tangents[leg]:
+                for final_tangent in tangents[leg + 1]:
+                    shortest_dubins_path(
+                        radius,
+                        positions[leg],
+                        initial_tangent,
+                        positions[leg + 1],
+                        final_tangent,
+                        backend="math",
+                    )
+
+    return {
+        "chain_legs_per_second": (size - 1)
+        / best_time(lambda: plan_dubins_chain(radius, positions), repeat=3),
+        "scalar_legs_per_second": scalar_size / best_time(evaluate_layers, repeat=1),
+    }
+
+
+def benchmark_invalid(size: int = 1000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the ways of handling infeasible paths of every path type.
+
+    The poses are drawn close to each other, so that many LSR/RSL paths
+    overlap, and a tenth of the queries have coincident centers.
+
+    Args:
+        size: Number of pose pairs.
+        radius: Radius of the circles.
+
+    Returns:
+        The paths per second of DubinsPath within try/except with warnings
+        ignored, of try_dubins_path, and of solve_dubins_batch followed by
+        invalid_reasons, and the fraction of invalid paths.
+    """
+    from .path_type import PathType
+    from .dubins2 import DubinsPath, try_dubins_path
+    from .batch2 import invalid_reasons, solve_dubins_batch
+
+    initial_position, initial_tangent, final_position, final_tangent = random_poses(
+        size, extent=2.0 * radius
+    )
+    final_position[: size // 10] = initial_position[: size // 10]
+    final_tangent[: size // 10] = initial_tangent[: size // 10]
+    queries = list(
+        zip(initial_position, initial_tangent, final_position, final_tangent)
+    )
+
+    def build_with_exceptions():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            for query in queries:
+                for path_type in PathType:
+                    try:
+                        DubinsPath(path_type, radius, *query, backend="math")
+                    except ValueError:
+                        DubinsPath.create_invalid(path_type)
+
+    def build_without_exceptions():
+        for query in queries:
+            for path_type in PathType:
+                try_dubins_path(path_type, radius, *query, backend="math")
+
+    def solve_with_masks():
+        batch = solve_dubins_batch(
+            radius, initial_position, initial_tangent, final_position, final_tangent
+        )
+        return invalid_reasons(batch)
+
+    paths = size * len(PathType)
+    return {
+        "exception_paths_per_second": paths
+        / best_time(build_with_exceptions, repeat=1),
+        "try_paths_per_second": paths / best_time(build_without_exceptions, repeat=1),
+        "mask_paths_per_second": paths / best_time(solve_with_masks),
+        "invalid_fraction": float(np.mean(solve_with_masks() != 0)),
+    }
+
+
+def benchmark_instrument(size: int = 10_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the overhead of the instrumentation on the hot paths.
+
+    Args:
+        size: Number of pose pairs of the batch, a tenth of them being solved
+            one by one.
+        radius: Radius of the circles.
+
+    Returns:
+        The paths per second of DubinsPath construction and of
+        shortest_dubins_batch, with the instrumentation disabled and enabled.
+    """
+    from .path_type import PathType
+    from . import instrument2
+    from .dubins2 import DubinsPath
+    from .batch2 import shortest_dubins_batch
+
+    poses = random_poses(size)
+    queries = list(zip(*(pose[: size // 10] for pose in poses)))
+
+    def build_paths():
+        for query in queries:
+            DubinsPath(PathType.LSL, radius, *query, backend="math")
+
+    def solve_batch():
+        shortest_dubins_batch(radius, *poses)
+
+    was_enabled = instrument2.is_enabled()
+    results = {}
+    try:
+        for state, switch in (
+            ("disabled", instrument2.disable),
+            ("enabled", instrument2.enable),
+        ):
+            switch()
+            results[f"{state}_paths_per_second"] = len(queries) / best_time(build_paths)
+            results[f"{state}_batch_paths_per_second"] = size / best_time(solve_batch)
+    finally:
+        instrument2.reset()
+        (instrument2.enable if was_enabled else instrument2.disable)()
+    return results
+
+
+def benchmark_matrix(size: int = 1000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the throughput of the distance matrix against shortest paths.
+
+    Args:
+        size: Number of poses, the matrix having size**2 entries.
+        radius: Radius of the circles.
+
+    Returns:
+        The throughput in pose pairs per second of dubins_distance_matrix and
+        of shortest_dubins_path on a subset of the pairs.
+    """
+    from .dubins2 import shortest_dubins_path
+    from .matrix2 import dubins_distance_matrix
+
+    positions, tangents, _, _ = random_poses(size)
+    scalar_size = min(size, 30)
+
+    def find_shortest_paths():
+        for i in range(scalar_size):
+            for j in range(scalar_size):
+                shortest_dubins_path(
+                    radius, positions[i], tangents[i], positions[j], tangents[j]
+                )
+
+    scalar_time = best_time(find_shortest_paths, repeat=1)
+    matrix_time = best_time(
+        lambda: dubins_distance_matrix(radius, positions, tangents), repeat=1
+    )
+    return {
+        "scalar_pairs_per_second": scalar_size**2 / scalar_time,
+        "matrix_pairs_per_second": size**2 / matrix_time,
+    }
+
+
+def benchmark_parallel(size: int = 1_000_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Measure the scaling of the parallel executor with the number of workers.
+
+    Args:
+        size: Number of pose pairs.
+        radius: Radius of the circles.
+
+    Returns:
+        The throughput in pose pairs per second at 1, 2, 4 and 8 workers.
+    """
+    from .parallel2 import ParallelDubinsExecutor
+
+    poses = random_poses(size)
+    results = {}
+
+    for workers in (1, 2, 4, 8):
+        with ParallelDubinsExecutor(workers) as executor:
+            # Warm the pool up so that process startup is not timed
+            executor.shortest_lengths(radius, *(pose[:workers] for pose in poses))
+            elapsed = best_time(
+                lambda: executor.shortest_lengths(radius, *poses), repeat=3
+            )
+        results[f"workers_{workers}_pairs_per_second"] = size / elapsed
+
+    return results
+
+
+def benchmark_render(size: int = 10_000, radius: float = 1.0) -> dict[str, float]:
+    """
+    Compare the per-path and the bulk rendering of Dubins paths to an image.
+
+    The per-path renderer is only timed up to 1000 paths, as it scales badly.
+
+    Args:
+        size: Largest number of paths rendered at once.
+        radius: Radius of the circles.
+
+    Returns:
+        The seconds per image, keyed by renderer and number of paths.
+    """
+    import tempfile
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from .dubins2 import shortest_dubins_path
+    from .batch2 import shortest_dubins_batch
+    from .plot2 import plot_dubins_path, render_dubins_batch
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "paths.png")
+        count = 10
+        while count <= size:
+            poses = random_poses(count)
+            batch = shortest_dubins_batch(radius, *poses)
+            results[f"bulk_{count}_seconds"] = best_time(
+                lambda: render_dubins_batch(batch, file_path), repeat=3
+            )
+
+            if count <= 1000:
+                paths = [shortest_dubins_path(radius, *query) for query in zip(*poses)]
+
+                def render_paths():
+                    figure = Figure(figsize=(8.0, 8.0), dpi=100)
+                    FigureCanvasAgg(figure)
+                    ax = figure.add_subplot(1, 1, 1)
+                    for path in paths:
+                        plot_dubins_path(ax, path)
+                    figure.savefig(file_path)
+
+                results[f"per_path_{count}_seconds"] = best_time(render_paths, repeat=1)
+
+            count *= 10
+
+    return results
+
+
+def benchmark_import(size: int = 5) -> dict[str, float]:
+    """
+    Measure the cold start time of importing the package and its submodules.
+
+    Each statement runs in a fresh interpreter, which reports the time spent
+    in the statement only, without the interpreter startup.
+
+    Args:
+        size: Number of fresh interpreters per statement, at most 20.
+
+    Returns:
+        The best seconds per statement, and whether importing the geometry
+        core loaded matplotlib, as 0 or 1.
+    """
+    statements = {
+        "package": "import dubins",
+        "core": "import dubins; dubins.DubinsPath",
+        "plot_module": "import dubins; dubins.plot2",
+        "plot_first_use": "import dubins; dubins.plot2; import matplotlib.pyplot",
+    }
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "exec(sys.argv[1])\n"
+        "print(time.perf_counter() - start, 'matplotlib' in sys.modules)\n"
+    )
+    # The parent directory of the package must be importable
+    python_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    results = {}
+    for name, statement in statements.items():
+        times = []
+        for _ in range(max(1, min(size, 20))):
+            output = subprocess.run(
+                [sys.executable, "-c", script, statement],
+                cwd=python_dir,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+            times.append(float(output[0]))
+        results[f"{name}_seconds"] = min(times)
+        if name == "core":
+            results["core_loads_matplotlib"] = float(output[1] == "True")
+
+    return results
+
+
+def suite_path_construction(size: int = 500) -> dict[str, float]:
+    """
+    Time the DubinsPath construction of each PathType with each backend.
+
+    Args:
+        size: Number of paths per measurement.
+
+    Returns:
+        The seconds per path, keyed by "construct_<backend>_<type>".
+    """
+    from .path_type import PathType
+    from .dubins2 import DubinsPath
+
+    # Close poses so that every path type is feasible most of the time
+    queries = list(zip(*random_poses(size, seed=1, extent=1.5)))
+    results = {}
+
+    for backend in ("numpy", "math"):
+        for path_type in PathType:
+
+            def build_paths():
+                with np.errstate(invalid="ignore"):
+                    for query in queries:
+                        DubinsPath(path_type, 1.0, *query, backend=backend)
+
+            name = f"construct_{backend}_{path_type.name}"
+            results[name] = best_time(build_paths) / size
+
+    return results
+
+
+def suite_path_queries(size: int = 500) -> dict[str, float]:
+    """
+    Time the queries on DubinsPath objects and the tangent computation.
+
+    Args:
+        size: Number of paths per measurement.
+
+    Returns:
+        The seconds per call of total_length, compute_tangent_positions for
+        each PathType and the plot2 discretization (300 samples per path).
+    """
+    from .path_type import PathType, directions_from_path_type
+    from .dubins2 import DubinsPath, compute_center_position, compute_tangent_positions
+
+    queries = list(zip(*random_poses(size, seed=2, extent=1.5)))
+    paths = [DubinsPath(PathType.LSL, 1.0, *query) for query in queries]
+    results = {}
+
+    def access_lengths():
+        for path in paths:
+            path.total_length
+
+    results["total_length"] = best_time(access_lengths) / size
+
+    for path_type in PathType:
+        initial_direction, final_direction = directions_from_path_type(path_type)
+        centers = [
+            (
+                compute_center_position(query[0], query[1], 1.0, initial_direction),
+                compute_center_position(query[2], query[3], 1.0, final_direction),
+            )
+            for query in queries
+        ]
+
+        def compute_tangents():
+            with np.errstate(invalid="ignore"):
+                for initial_center, final_center in centers:
+                    compute_tangent_positions(
+                        initial_center, final_center, 1.0, path_type
+                    )
+
+        name = f"compute_tangent_positions_{path_type.name}"
+        results[name] = best_time(compute_tangents) / size
+
+    def sample_paths():
+        for path in paths:
+            path.sample(n=300)
+
+    results["sample_plot2"] = best_time(sample_paths) / size
+    return results
+
+
+def suite_batch_sizes(max_size: int = 1_000_000) -> dict[str, float]:
+    """
+    Time the batch shortest path solver for batch sizes from 1 to max_size.
+
+    Args:
+        max_size: Largest batch size, batch sizes being powers of 10.
+
+    Returns:
+        The seconds per pose pair, keyed by "shortest_batch_<size>".
+    """
+    from .batch2 import shortest_dubins_lengths
+
+    results = {}
+    size = 1
+    while size <= max_size:
+        poses = random_poses(size, seed=3)
+        repeat = 5 if size < 100_000 else 1
+        elapsed = best_time(lambda: shortest_dubins_lengths(1.0, *poses), repeat)
+        results[f"shortest_batch_{size}"] = elapsed / size
+        size *= 10
+
+    return results
+
+
+def run_suite(max_batch_size: int = 1_000_000) -> dict:
+    """
+    Run the whole benchmark suite.
+
+    Every measurement uses seeded random poses and no external resource, so
+    runs are reproducible and comparable with each other. All the results are
+    times per operation in seconds, lower being better.
+
+    Args:
+        max_batch_size: Largest batch size of the batch measurements.
+
+    Returns:
+        The suite report, with the environment and the results.
+    """
+    results = {}
+    results.update(suite_path_construction())
+    results.update(suite_path_queries())
+    results.update(suite_batch_sizes(max_batch_size))
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare_reports(
+    baseline: dict, report: dict, threshold: float = 0.2
+) -> dict[str, float]:
+    """
+    Find the slowdowns of a suite report with respect to a baseline report.
+
+    Args:
+        baseline: Previous suite report.
+        report: Current suite report.
+        threshold: Relative slowdown above which a result is flagged.
+
+    Returns:
+        The relative slowdown of each flagged result, keyed by name.
+    """
+    slowdowns = {}
+    for name, value in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None or previous <= 0.0:
+            continue
+        slowdown = value / previous - 1.0
+        if slowdown > threshold:
+            slowdowns[name] = slowdown
+    return slowdowns
+
+
+BENCHMARKS = {
+    "batch": benchmark_batch,
+    "path_object": benchmark_path_object,
+    "backends": benchmark_backends,
+    "cache": benchmark_cache,
+    "table": benchmark_table,
+    "cutoff": benchmark_cutoff,
+    "collision": benchmark_collision,
+    "index": benchmark_index,
+    "incremental": benchmark_incremental,
+    "chain": benchmark_chain,
+    "invalid": benchmark_invalid,
+    "instrument": benchmark_instrument,
+    "serialize": benchmark_serialize,
+    "matrix": benchmark_matrix,
+    "parallel": benchmark_parallel,
+    "render": benchmark_render,
+    "import": benchmark_import,
+}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmark", choices=[*BENCHMARKS, "suite"])
+    parser.add_argument(
+        "--size", type=int, help="Benchmark size, defaults to its own default"
+    )
+    parser.add_argument("--output", help="JSON file where the suite report is written")
+    parser.add_argument(
+        "--baseline", help="JSON suite report to compare the new report with"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Flagged relative slowdown"
+    )
+    parser.add_argument("--max-batch-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if args.benchmark != "suite":
+        benchmark = BENCHMARKS[args.benchmark]
+        results = benchmark() if args.size is None else benchmark(args.size)
+        for name, value in results.items():
+            logger.info("%s: %.4g", name, value)
+        sys.exit(0)
+
+    report = run_suite(args.max_batch_size)
+    for name, value in report["results"].items():
+        logger.info("%s: %.4g s", name, value)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        logger.info("Benchmark report saved to %s", args.output)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        slowdowns = compare_reports(baseline, report, args.threshold)
+        for name, slowdown in slowdowns.items():
+            logger.warning("%s is %.0f%% slower", name, 100 * slowdown)
+        if slowdowns:
+            sys.exit(1)
+        logger.info("No slowdown above %.0f%%", 100 * args.threshold)
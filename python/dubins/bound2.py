@@ -0,0 +1,118 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Admissible lower bounds of 2D Dubins lengths, to reject queries early."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .batch2 import normalize_vectors, shortest_dubins_lengths
+
+
+def dubins_lower_bounds(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute lower bounds of the shortest Dubins lengths of a batch of queries.
+
+    A path is at least as long as the straight line between its endpoints,
+    and it turns by at least the heading change wrapped to [-pi, pi], which
+    takes a length of radius per radian at the minimum turning radius. Both
+    terms are lower bounds, but their sum is not, since a path can move and
+    turn at once, so the bound is their maximum.
+
+    Args:
+        radius: Radius of the circles, a scalar or an array broadcastable to
+            the batch shape S.
+        initial_position: Initial positions as a S+(2,) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a S+(2,) numpy array.
+        final_position: Final positions as a S+(2,) numpy array.
+        final_tangent_unit: Final tangent vectors as a S+(2,) numpy array.
+
+    Returns:
+        The lower bounds as a S array, never greater than the lengths given
+        by shortest_dubins_lengths.
+    """
+    offset = np.asarray(final_position) - initial_position
+    distance = np.hypot(offset[..., 0], offset[..., 1])
+
+    initial_tangent_unit = normalize_vectors(initial_tangent_unit)
+    final_tangent_unit = normalize_vectors(final_tangent_unit)
+    heading_change = np.abs(
+        np.arctan2(
+            initial_tangent_unit[..., 0] * final_tangent_unit[..., 1]
+            - initial_tangent_unit[..., 1] * final_tangent_unit[..., 0],
+            np.sum(initial_tangent_unit * final_tangent_unit, axis=-1),
+        )
+    )
+
+    return np.maximum(distance, radius * heading_change)
+
+
+def shortest_length_with_cutoff(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+    cutoff: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Find the shortest Dubins lengths of the queries which may beat a cutoff.
+
+    The lower bound of every query is computed first, and only the queries
+    whose bound does not exceed the cutoff are solved exactly, the other ones
+    skipping the whole tangent and arc geometry.
+
+    Args:
+        radius: Radius of the circles, a scalar or an array broadcastable to
+            the batch shape S.
+        initial_position: Initial positions as a S+(2,) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a S+(2,) numpy array.
+        final_position: Final positions as a S+(2,) numpy array.
+        final_tangent_unit: Final tangent vectors as a S+(2,) numpy array.
+        cutoff: Length above which queries are rejected, a scalar or an array
+            broadcastable to the batch shape S, e.g. the best length so far.
+
+    Returns:
+        A tuple containing the PathType values of the shortest paths as an
+        int8 array, and their lengths, as S arrays, like
+        shortest_dubins_lengths, and the number of rejected queries. Rejected
+        queries have the type -1 and an infinite length.
+    """
+    initial_position, initial_tangent_unit, final_position, final_tangent_unit = (
+        np.broadcast_arrays(
+            initial_position, initial_tangent_unit, final_position, final_tangent_unit
+        )
+    )
+    radius = np.broadcast_to(
+        np.asarray(radius, dtype=float), initial_position.shape[:-1]
+    )
+    bounds = dubins_lower_bounds(
+        radius,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+    )
+    # NaN bounds compare as False, so invalid queries are solved and stay NaN
+    is_rejected = bounds > cutoff
+    is_solved = ~is_rejected
+
+    path_types = np.full(bounds.shape, -1, dtype=np.int8)
+    lengths = np.full(bounds.shape, np.inf)
+    path_types[is_solved], lengths[is_solved] = shortest_dubins_lengths(
+        radius[is_solved],
+        initial_position[is_solved],
+        initial_tangent_unit[is_solved],
+        final_position[is_solved],
+        final_tangent_unit[is_solved],
+    )
+
+    return path_types, lengths, int(np.count_nonzero(is_rejected))
@@ -0,0 +1,245 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Memoization of 2D Dubins path queries with quantized pose keys."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+from .path_type import PathType
+from .dubins2 import DubinsPath
+from .canonical2 import (
+    CanonicalQuery,
+    canonical_path,
+    canonical_query,
+    shortest_canonical_path,
+    to_world_path,
+)
+
+# Key of a query: quantized canonical query, and the path type or None for the
+# shortest path
+QueryKey = tuple[int, int, int, "PathType | None"]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a DubinsPathCache, like functools.lru_cache's."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class DubinsPathCache:
+    """
+    Bounded LRU cache of DubinsPath queries.
+
+    Queries are keyed on their canonical query (see canonical2) rounded to the
+    given resolutions, so that all the rigid transforms and radius scalings of
+    a query share one entry. The cache holds the canonical path of the first
+    query of each quantization cell, which is mapped back to the world frame
+    of every query. The returned paths start and end exactly at the query
+    poses, their inner geometry being the one of the cached query, which
+    differs by less than the resolutions.
+
+    The cache can be shared between threads. The paths are built outside of
+    the lock, so concurrent misses on the same key may build it twice, but
+    only one of the paths is kept.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        position_resolution: float = 1e-9,
+        heading_resolution: float = 1e-9,
+        backend: str | None = None,
+    ):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached paths, the least recently used
+                path is evicted beyond it.
+            position_resolution: Quantization step of the canonical
+                positions, in units of radius.
+            heading_resolution: Quantization step of the headings in radians.
+            backend: Geometry backend of the built paths, see
+                dubins2.set_backend.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Invalid cache size: {maxsize}")
+        if position_resolution <= 0.0 or heading_resolution <= 0.0:
+            raise ValueError("Quantization resolutions must be positive.")
+
+        self.maxsize = maxsize
+        self.position_resolution = position_resolution
+        self.heading_resolution = heading_resolution
+        self.backend = backend
+
+        self._paths: OrderedDict[QueryKey, DubinsPath] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def cache_info(self) -> CacheInfo:
+        """Get the hit, miss and eviction counters and the cache size."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._paths),
+                self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Remove every cached path and reset the counters."""
+        with self._lock:
+            self._paths.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def make_key(
+        self,
+        path_type: PathType | None,
+        radius: float,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+    ) -> tuple[QueryKey, CanonicalQuery]:
+        """
+        Quantize a query into a hashable key.
+
+        Args:
+            path_type: Type of the Dubins path, or None for the shortest path.
+            radius: Radius of the circles.
+            initial_position: Initial position as a 2D sequence.
+            initial_tangent_unit: Initial tangent vector as a 2D sequence.
+            final_position: Final position as a 2D sequence.
+            final_tangent_unit: Final tangent vector as a 2D sequence.
+
+        Returns:
+            The key of the query and its canonical query.
+        """
+        query = canonical_query(
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+        dx, dy, theta = query
+        # Headings close to 2*pi must share the cell of 0
+        heading_cells = round(2 * math.pi / self.heading_resolution)
+        key = (
+            round(dx / self.position_resolution),
+            round(dy / self.position_resolution),
+            round(theta / self.heading_resolution) % heading_cells,
+            path_type,
+        )
+        return key, query
+
+    def _get_or_build(
+        self, key: QueryKey, build: Callable[[], DubinsPath]
+    ) -> DubinsPath:
+        """Look a key up, building and caching its canonical path on a miss."""
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None:
+                self._paths.move_to_end(key)
+                self._hits += 1
+                return path
+            self._misses += 1
+
+        path = build()
+
+        with self._lock:
+            # Keep the path of a concurrent miss if it was cached first
+            path = self._paths.setdefault(key, path)
+            self._paths.move_to_end(key)
+            while len(self._paths) > self.maxsize:
+                self._paths.popitem(last=False)
+                self._evictions += 1
+        return path
+
+    def path(
+        self,
+        path_type: PathType,
+        radius: float,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+    ) -> DubinsPath:
+        """
+        Get the Dubins path of a given type, building it on a cache miss.
+
+        Args:
+            path_type: Type of the Dubins path.
+            radius: Radius of the circles.
+            initial_position: Initial position as a 2D numpy array.
+            initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+            final_position: Final position as a 2D numpy array.
+            final_tangent_unit: Final tangent vector as a 2D numpy array.
+
+        Returns:
+            The cached or new DubinsPath.
+        """
+        arguments = (
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+        key, query = self.make_key(path_type, *arguments)
+        path = self._get_or_build(
+            key, lambda: canonical_path(path_type, query, self.backend)
+        )
+        return to_world_path(path, *arguments)
+
+    def shortest_path(
+        self,
+        radius: float,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+    ) -> DubinsPath:
+        """
+        Get the shortest Dubins path, solving it on a cache miss.
+
+        Args:
+            radius: Radius of the circles.
+            initial_position: Initial position as a 2D numpy array.
+            initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+            final_position: Final position as a 2D numpy array.
+            final_tangent_unit: Final tangent vector as a 2D numpy array.
+
+        Returns:
+            The cached or new shortest DubinsPath, see shortest_dubins_path.
+        """
+        arguments = (
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+        key, query = self.make_key(None, *arguments)
+        path = self._get_or_build(
+            key, lambda: shortest_canonical_path(query, self.backend)
+        )
+        return to_world_path(path, *arguments)
@@ -0,0 +1,231 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Canonical frame of 2D Dubins queries.
+
+Dubins paths are invariant to translations and rotations, and scale with the
+radius: the path between two poses is the path of the canonical query, where
+the initial pose is at the origin heading to +x and the radius is 1, mapped
+back to the world frame. A query then reduces to three values: the final
+position (dx, dy) in the initial pose frame divided by the radius, and the
+final heading theta relative to the initial heading, within [0, 2*pi).
+
+Every rigid transform and radius scaling of a query share the same canonical
+query, which is what makes caches and precomputed tables practical.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from . import scalar2
+from .path_type import PathType
+from .dubins2 import DubinsPath, shortest_dubins_path
+from .batch2 import normalize_vectors
+
+CanonicalQuery = tuple[float, float, float]
+
+canonical_initial_position = np.array((0.0, 0.0))
+canonical_initial_tangent_unit = np.array((1.0, 0.0))
+
+# Rows of the packed DubinsPath positions which are directions, only rotated
+_direction_rows = np.zeros((9, 1), dtype=bool)
+_direction_rows[[DubinsPath._INITIAL_TANGENT_UNIT, DubinsPath._FINAL_TANGENT_UNIT]] = (
+    True
+)
+
+
+def canonical_query(
+    radius: float,
+    initial_position,
+    initial_tangent_unit,
+    final_position,
+    final_tangent_unit,
+) -> CanonicalQuery:
+    """
+    Reduce a query to its canonical frame.
+
+    Args:
+        radius: Radius of the circles.
+        initial_position: Initial position as a 2D sequence.
+        initial_tangent_unit: Initial tangent vector as a 2D sequence.
+        final_position: Final position as a 2D sequence.
+        final_tangent_unit: Final tangent vector as a 2D sequence.
+
+    Returns:
+        The canonical query (dx, dy, theta).
+    """
+    cos, sin = scalar2.normalize_vector(scalar2.as_vector(initial_tangent_unit))
+    final_x, final_y = scalar2.normalize_vector(scalar2.as_vector(final_tangent_unit))
+    offset_x = (final_position[0] - initial_position[0]) / radius
+    offset_y = (final_position[1] - initial_position[1]) / radius
+
+    theta = math.atan2(cos * final_y - sin * final_x, cos * final_x + sin * final_y)
+    return (
+        float(cos * offset_x + sin * offset_y),
+        float(cos * offset_y - sin * offset_x),
+        theta % (2 * math.pi),
+    )
+
+
+def canonical_queries(
+    radius: float | np.ndarray,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+) -> np.ndarray:
+    """
+    Reduce a batch of queries to their canonical frame.
+
+    Args:
+        radius: Radius of the circles, a scalar or an array broadcastable to
+            the batch shape S.
+        initial_position: Initial positions as a S+(2,) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a S+(2,) numpy array.
+        final_position: Final positions as a S+(2,) numpy array.
+        final_tangent_unit: Final tangent vectors as a S+(2,) numpy array.
+
+    Returns:
+        The canonical queries as a S+(3,) array of (dx, dy, theta).
+    """
+    initial_tangent_unit = normalize_vectors(initial_tangent_unit)
+    final_tangent_unit = normalize_vectors(final_tangent_unit)
+    offset = (np.asarray(final_position) - initial_position) / np.asarray(radius)[
+        ..., np.newaxis
+    ]
+
+    cos = initial_tangent_unit[..., 0]
+    sin = initial_tangent_unit[..., 1]
+    final_x = final_tangent_unit[..., 0]
+    final_y = final_tangent_unit[..., 1]
+
+    theta = np.arctan2(cos * final_y - sin * final_x, cos * final_x + sin * final_y)
+    return np.stack(
+        (
+            cos * offset[..., 0] + sin * offset[..., 1],
+            cos * offset[..., 1] - sin * offset[..., 0],
+            theta % (2 * np.pi),
+        ),
+        axis=-1,
+    )
+
+
+def canonical_poses(
+    dx: float | np.ndarray, dy: float | np.ndarray, theta: float | np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Expand canonical queries into the poses of a unit radius query.
+
+    Args:
+        dx: Final x positions in the canonical frame.
+        dy: Final y positions in the canonical frame.
+        theta: Final headings in the canonical frame.
+
+    Returns:
+        The initial positions, initial tangent vectors, final positions and
+        final tangent vectors, as S+(2,) arrays of the broadcast shape S.
+    """
+    dx, dy, theta = np.broadcast_arrays(dx, dy, theta)
+    final_position = np.stack((dx, dy), axis=-1).astype(float)
+    final_tangent_unit = np.stack((np.cos(theta), np.sin(theta)), axis=-1)
+    return (
+        np.broadcast_to(canonical_initial_position, final_position.shape),
+        np.broadcast_to(canonical_initial_tangent_unit, final_position.shape),
+        final_position,
+        final_tangent_unit,
+    )
+
+
+def canonical_path(
+    path_type: PathType, query: CanonicalQuery, backend: str | None = None
+) -> DubinsPath:
+    """
+    Build the Dubins path of a canonical query.
+
+    Args:
+        path_type: Type of the Dubins path.
+        query: Canonical query (dx, dy, theta).
+        backend: Geometry backend, see dubins2.set_backend.
+
+    Returns:
+        The DubinsPath of unit radius in the canonical frame.
+    """
+    return DubinsPath(path_type, 1.0, *canonical_poses(*query), backend)
+
+
+def shortest_canonical_path(
+    query: CanonicalQuery, backend: str | None = None
+) -> DubinsPath:
+    """
+    Find the shortest Dubins path of a canonical query.
+
+    Args:
+        query: Canonical query (dx, dy, theta).
+        backend: Geometry backend, see dubins2.set_backend.
+
+    Returns:
+        The shortest DubinsPath of unit radius in the canonical frame, or an
+        invalid one if no path type is feasible.
+    """
+    return shortest_dubins_path(1.0, *canonical_poses(*query), backend)
+
+
+def to_world_path(
+    path: DubinsPath,
+    radius: float,
+    initial_position,
+    initial_tangent_unit,
+    final_position,
+    final_tangent_unit,
+) -> DubinsPath:
+    """
+    Map a canonical path back to the world frame of a query.
+
+    The positions of the path are rotated by the initial heading, scaled by
+    the radius and translated to the initial position, and its straight length
+    is scaled, without solving anything. The arc angles and the path type are
+    invariant. The initial and final poses of the returned path are exactly
+    the ones of the query, not the mapped canonical ones.
+
+    Args:
+        path: DubinsPath of unit radius in the canonical frame.
+        radius: Radius of the circles.
+        initial_position: Initial position as a 2D sequence.
+        initial_tangent_unit: Initial tangent vector as a 2D sequence.
+        final_position: Final position as a 2D sequence.
+        final_tangent_unit: Final tangent vector as a 2D sequence.
+
+    Returns:
+        The DubinsPath of the query, invalid if the canonical path is.
+    """
+    if not path.is_valid:
+        return DubinsPath.create_invalid(path.path_type)
+
+    cos, sin = scalar2.normalize_vector(scalar2.as_vector(initial_tangent_unit))
+    rotation = np.array(((cos, sin), (-sin, cos)))
+
+    # Rotate the row vectors, then scale and translate the positions only
+    rotated = path.positions @ rotation
+    positions = np.where(
+        _direction_rows, rotated, radius * rotated + np.asarray(initial_position)
+    )
+    positions[DubinsPath._INITIAL_POSITION] = initial_position
+    positions[DubinsPath._INITIAL_TANGENT_UNIT] = (cos, sin)
+    positions[DubinsPath._FINAL_POSITION] = final_position
+    positions[DubinsPath._FINAL_TANGENT_UNIT] = scalar2.normalize_vector(
+        scalar2.as_vector(final_tangent_unit)
+    )
+
+    return DubinsPath.from_geometry(
+        path.path_type,
+        radius,
+        positions,
+        path.initial_arc_angle,
+        radius * path.straight_length,
+        path.middle_arc_angle,
+        path.final_arc_angle,
+    )
@@ -0,0 +1,182 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Shortest 2D Dubins chains through ordered waypoints with free headings.
+
+The heading at each waypoint is chosen among evenly spaced candidates. The
+shortest lengths between the candidates of consecutive waypoints form one
+(K, K) layer per leg, solved with shortest_dubins_lengths for many legs at
+once, and a dynamic programming pass over the layers keeps, for every
+candidate, the best cost of reaching it and its best predecessor. Layers are
+solved and reduced by chunks of legs, so the memory only depends on the
+chunk size and on the (W, K) predecessor table, not on W * K**2.
+
+The chain is optimal among the candidate headings, its length converging to
+the optimal one of free headings as the number of candidates grows.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch2 import (
+    DubinsPathBatch,
+    sample_dubins_paths,
+    shortest_dubins_batch,
+    shortest_dubins_lengths,
+)
+
+default_max_pairs = 1 << 16
+
+
+class DubinsChain(NamedTuple):
+    """Shortest Dubins chain through W waypoints."""
+
+    headings: np.ndarray
+    """Heading at each waypoint, in radians, as a (W,) array."""
+    lengths: np.ndarray
+    """Length of each leg as a (W - 1,) array."""
+    total_length: float
+    """Length of the whole chain, infinite if no chain is feasible."""
+    paths: DubinsPathBatch
+    """Shortest path of each leg, as a batch of shape (W - 1,)."""
+
+
+def candidate_headings(
+    waypoint_count: int,
+    heading_count: int,
+    initial_heading: float | None = None,
+    final_heading: float | None = None,
+) -> np.ndarray:
+    """
+    Compute evenly spaced candidate headings at each waypoint.
+
+    Args:
+        waypoint_count: Number of waypoints W.
+        heading_count: Number of candidate headings K per waypoint.
+        initial_heading: Optional fixed heading at the first waypoint.
+        final_heading: Optional fixed heading at the last waypoint.
+
+    Returns:
+        The candidate headings as a (W, K) array. Fixed headings are repeated
+        over their whole row.
+    """
+    headings = np.tile(
+        np.linspace(0.0, 2 * np.pi, heading_count, endpoint=False),
+        (waypoint_count, 1),
+    )
+    if initial_heading is not None:
+        headings[0] = initial_heading
+    if final_heading is not None:
+        headings[-1] = final_heading
+    return headings
+
+
+def _layer_lengths(
+    radius: float, positions: np.ndarray, headings: np.ndarray
+) -> np.ndarray:
+    """
+    Solve the shortest lengths between the candidates of consecutive waypoints.
+
+    Args:
+        radius: Radius of the circles.
+        positions: Positions of C + 1 consecutive waypoints as a (C + 1, 2)
+            array.
+        headings: Their candidate headings as a (C + 1, K) array.
+
+    Returns:
+        The lengths of the C legs as a (C, K, K) array, from the candidates of
+        the first waypoint along the second axis to the candidates of the next
+        one along the third axis, infinite where no path is feasible.
+    """
+    tangents = np.stack((np.cos(headings), np.sin(headings)), axis=-1)
+    shape = (len(positions) - 1, headings.shape[1], headings.shape[1], 2)
+    _, lengths = shortest_dubins_lengths(
+        radius,
+        np.broadcast_to(positions[:-1, np.newaxis, np.newaxis], shape).reshape(-1, 2),
+        np.broadcast_to(tangents[:-1, :, np.newaxis], shape).reshape(-1, 2),
+        np.broadcast_to(positions[1:, np.newaxis, np.newaxis], shape).reshape(-1, 2),
+        np.broadcast_to(tangents[1:, np.newaxis], shape).reshape(-1, 2),
+    )
+    return np.nan_to_num(lengths.reshape(shape[:-1]), nan=np.inf)
+
+
+def plan_dubins_chain(
+    radius: float,
+    positions: np.ndarray,
+    heading_count: int = 36,
+    initial_heading: float | None = None,
+    final_heading: float | None = None,
+    max_pairs: int = default_max_pairs,
+) -> DubinsChain:
+    """
+    Find the shortest Dubins chain through ordered waypoints.
+
+    Args:
+        radius: Radius of the circles.
+        positions: Waypoint positions as a (W, 2) array, W >= 2.
+        heading_count: Number of candidate headings K per free waypoint.
+        initial_heading: Optional fixed heading at the first waypoint.
+        final_heading: Optional fixed heading at the last waypoint.
+        max_pairs: Maximum number of pose pairs solved at once, bounding the
+            memory of the length layers.
+
+    Returns:
+        The chain of the best candidate headings.
+    """
+    positions = np.asarray(positions, dtype=float)
+    if positions.ndim != 2 or positions.shape[1] != 2 or len(positions) < 2:
+        raise ValueError(f"Invalid waypoint positions shape: {positions.shape}")
+
+    headings = candidate_headings(
+        len(positions), heading_count, initial_heading, final_heading
+    )
+    leg_count = len(positions) - 1
+    chunk_size = max(1, max_pairs // heading_count**2)
+
+    # Forward pass: best cost of reaching each candidate, and its predecessor
+    cost = np.zeros(heading_count)
+    predecessors = np.empty((leg_count, heading_count), dtype=np.intp)
+    candidates = np.arange(heading_count)
+    for start in range(0, leg_count, chunk_size):
+        stop = min(start + chunk_size, leg_count)
+        layers = _layer_lengths(
+            radius, positions[start : stop + 1], headings[start : stop + 1]
+        )
+        for leg, layer in enumerate(layers, start):
+            costs = cost[:, np.newaxis] + layer
+            predecessors[leg] = np.argmin(costs, axis=0)
+            cost = costs[predecessors[leg], candidates]
+
+    # Backward pass: follow the predecessors from the best final candidate
+    chosen = np.empty(len(positions), dtype=np.intp)
+    chosen[-1] = np.argmin(cost)
+    for leg in range(leg_count - 1, -1, -1):
+        chosen[leg] = predecessors[leg, chosen[leg + 1]]
+    chain_headings = headings[np.arange(len(positions)), chosen]
+
+    tangents = np.stack((np.cos(chain_headings), np.sin(chain_headings)), axis=-1)
+    paths = shortest_dubins_batch(
+        radius, positions[:-1], tangents[:-1], positions[1:], tangents[1:]
+    )
+    lengths = np.nan_to_num(paths.total_length, nan=np.inf)
+    return DubinsChain(chain_headings, lengths, float(np.sum(lengths)), paths)
+
+
+def sample_dubins_chain(chain: DubinsChain, n: int = 100) -> np.ndarray:
+    """
+    Sample poses along a whole chain, leg after leg.
+
+    Args:
+        chain: Chain found by plan_dubins_chain.
+        n: Number of samples per leg, including both ends.
+
+    Returns:
+        The (x, y, heading) samples as a (M, 3) array, the end of each leg
+        being the start of the next one and sampled once.
+    """
+    samples = sample_dubins_paths(chain.paths, n)
+    return np.concatenate((samples[0, :1], samples[:, 1:].reshape(-1, 3)))
@@ -0,0 +1,337 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Analytic collision checks of 2D Dubins paths against obstacles.
+
+Paths are checked segment by segment in closed form, without sampling: the
+distance from a point to an arc or a straight segment for circular obstacles,
+and the crossings of the arc or segment with the box edges for axis-aligned
+boxes. Every (path, obstacle) pair is first tested with bounding boxes: a path
+always lies within the union of the bounding boxes of its circles, so only
+the pairs whose boxes overlap are checked exactly.
+
+A path collides with an obstacle when it touches or enters its closed area.
+Invalid paths never collide.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .batch2 import DubinsPathBatch, compute_segments
+
+
+def path_bounding_boxes(batch: DubinsPathBatch) -> np.ndarray:
+    """
+    Compute bounding boxes of a batch of paths from their circles.
+
+    The boxes enclose the whole initial, final and middle circles, hence the
+    arcs on them and the straight segment between them. They are cheap, but
+    not the tightest boxes of the paths.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+
+    Returns:
+        The (x_min, y_min, x_max, y_max) boxes as a S+(4,) array, NaN for
+        invalid paths.
+    """
+    # CSC paths have no middle circle, use the initial one in its place
+    middle_center = np.where(
+        np.isnan(batch.middle_center_position),
+        batch.initial_center_position,
+        batch.middle_center_position,
+    )
+    centers = (
+        batch.initial_center_position,
+        batch.final_center_position,
+        middle_center,
+    )
+    radius = batch.radius[..., np.newaxis]
+    lower = np.minimum.reduce(centers)
+    upper = np.maximum.reduce(centers)
+    boxes = np.concatenate((lower - radius, upper + radius), axis=-1)
+    # Infeasible paths keep finite circle centers, so their boxes are cleared
+    return np.where(batch.is_valid[..., np.newaxis], boxes, np.nan)
+
+
+def _candidate_pairs(
+    batch: DubinsPathBatch, obstacle_boxes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the (path, obstacle) pairs whose bounding boxes overlap.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        obstacle_boxes: Obstacle bounding boxes as a (M, 4) array, M > 0.
+
+    Returns:
+        The S+(M,) overlap mask, and the flat path indices and obstacle
+        indices of the overlapping pairs.
+    """
+    boxes = path_bounding_boxes(batch)[..., np.newaxis, :]
+    # NaN boxes of invalid paths compare as False, so they never overlap
+    overlaps = (
+        (boxes[..., 0] <= obstacle_boxes[:, 2])
+        & (obstacle_boxes[:, 0] <= boxes[..., 2])
+        & (boxes[..., 1] <= obstacle_boxes[:, 3])
+        & (obstacle_boxes[:, 1] <= boxes[..., 3])
+    )
+    path_index, obstacle_index = np.nonzero(overlaps.reshape(-1, len(obstacle_boxes)))
+    return overlaps, path_index, obstacle_index
+
+
+def gather_segments(
+    batch: DubinsPathBatch, path_index: np.ndarray
+) -> tuple[np.ndarray, ...]:
+    """
+    Gather the segments of some paths of a batch.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        path_index: Flat indices of K paths.
+
+    Returns:
+        The turns, lengths and start angles as (K, 3) arrays, the origins as
+        a (K, 3, 2) array, and the radii as a (K, 1) array. Arcs are turned
+        into counterclockwise arcs, their start angle being moved to their
+        other end for clockwise arcs.
+    """
+    turn, _, length, angle, origin = compute_segments(batch)
+    turn = turn.reshape(-1, 3)[path_index]
+    length = length.reshape(-1, 3)[path_index]
+    angle = angle.reshape(-1, 3)[path_index]
+    origin = origin.reshape(-1, 3, 2)[path_index]
+    radius = np.broadcast_to(batch.radius, batch.shape).reshape(-1)[path_index]
+    radius = radius[:, np.newaxis]
+
+    angle = np.where(turn < 0, angle - length / radius, angle)
+    return turn, length, angle, origin, radius
+
+
+def _is_in_sweep(
+    point: np.ndarray, center: np.ndarray, start: np.ndarray, sweep: np.ndarray
+) -> np.ndarray:
+    """Check whether points are within the angular sweep of CCW arcs."""
+    offset = point - center
+    azimuth = np.arctan2(offset[..., 1], offset[..., 0])
+    return np.mod(azimuth - start, 2 * np.pi) <= sweep
+
+
+def segment_point_distances(
+    turn: np.ndarray,
+    length: np.ndarray,
+    angle: np.ndarray,
+    origin: np.ndarray,
+    radius: np.ndarray,
+    point: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the distances from points to the segments of paths.
+
+    Args:
+        turn: Segment turns as a (K, n) array.
+        length: Segment lengths as a (K, n) array.
+        angle: CCW start angles of the arcs and headings of the straight
+            segments as a (K, n) array.
+        origin: Segment origins as a (K, n, 2) array.
+        radius: Path radii as a (K, 1) array.
+        point: Points as a (K, 1, 2) array.
+
+    Returns:
+        The (K, n) distances from each point to each segment of its path.
+    """
+    direction = np.stack((np.cos(angle), np.sin(angle)), axis=-1)
+    offset = point - origin
+
+    # Straight segments: distance to the closest point of the segment
+    projection = np.clip(np.sum(offset * direction, axis=-1), 0.0, length)
+    line_distance = np.linalg.norm(
+        offset - projection[..., np.newaxis] * direction, axis=-1
+    )
+
+    # Arcs: radial distance within the sweep, else distance to the closest end
+    sweep = length / radius
+    end_direction = np.stack((np.cos(angle + sweep), np.sin(angle + sweep)), axis=-1)
+    end_distance = np.minimum(
+        np.linalg.norm(offset - radius[..., np.newaxis] * direction, axis=-1),
+        np.linalg.norm(offset - radius[..., np.newaxis] * end_direction, axis=-1),
+    )
+    arc_distance = np.where(
+        _is_in_sweep(point, origin, angle, sweep),
+        np.abs(np.linalg.norm(offset, axis=-1) - radius),
+        end_distance,
+    )
+
+    return np.where(turn == 0, line_distance, arc_distance)
+
+
+def collide_circles(
+    batch: DubinsPathBatch, centers: np.ndarray, radii: float | np.ndarray
+) -> np.ndarray:
+    """
+    Check which paths of a batch collide with which circular obstacles.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        centers: Obstacle centers as a (M, 2) array.
+        radii: Obstacle radii, a scalar or a (M,) array.
+
+    Returns:
+        The S+(M,) collision mask.
+    """
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(centers),))
+    if len(centers) == 0:
+        return np.zeros(batch.shape + (0,), dtype=bool)
+    radius_vector = radii[:, np.newaxis]
+    obstacle_boxes = np.concatenate(
+        (centers - radius_vector, centers + radius_vector), axis=-1
+    )
+
+    collisions, path_index, obstacle_index = _candidate_pairs(batch, obstacle_boxes)
+    turn, length, angle, origin, radius = gather_segments(batch, path_index)
+    distances = segment_point_distances(
+        turn,
+        length,
+        angle,
+        origin,
+        radius,
+        centers[obstacle_index][:, np.newaxis],
+    )
+
+    collisions.reshape(-1, len(centers))[path_index, obstacle_index] = np.any(
+        distances <= radii[obstacle_index][:, np.newaxis], axis=-1
+    )
+    return collisions
+
+
+def segment_box_touches(
+    turn: np.ndarray,
+    length: np.ndarray,
+    angle: np.ndarray,
+    origin: np.ndarray,
+    radius: np.ndarray,
+    box: np.ndarray,
+) -> np.ndarray:
+    """
+    Check whether the segments of paths touch boxes.
+
+    Args:
+        turn: Segment turns as a (K, n) array.
+        length: Segment lengths as a (K, n) array.
+        angle: CCW start angles of the arcs and headings of the straight
+            segments as a (K, n) array.
+        origin: Segment origins as a (K, n, 2) array.
+        radius: Path radii as a (K, 1) array.
+        box: Boxes (x_min, y_min, x_max, y_max) as a (K, 1, 4) array.
+
+    Returns:
+        The (K, n) mask of the segments touching the box of their pair.
+    """
+    lower = box[..., :2]
+    upper = box[..., 2:]
+    direction = np.stack((np.cos(angle), np.sin(angle)), axis=-1)
+
+    # Straight segments: clip the segment parameter range by both slabs
+    step = direction * length[..., np.newaxis]
+    is_parallel = step == 0.0
+    is_within = (lower <= origin) & (origin <= upper)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bound_a = (lower - origin) / step
+        bound_b = (upper - origin) / step
+    # Parallel segments are either always or never within a slab
+    enter = np.where(
+        is_parallel,
+        np.where(is_within, -np.inf, np.inf),
+        np.minimum(bound_a, bound_b),
+    )
+    leave = np.where(
+        is_parallel,
+        np.where(is_within, np.inf, -np.inf),
+        np.maximum(bound_a, bound_b),
+    )
+    line_touches = np.maximum(np.max(enter, axis=-1), 0.0) <= np.minimum(
+        np.min(leave, axis=-1), 1.0
+    )
+
+    # Arcs: the start point is in the box, or the arc crosses one of the edges
+    center = origin
+    sweep = length / radius
+    start_point = center + radius[..., np.newaxis] * direction
+    arc_touches = np.all((lower <= start_point) & (start_point <= upper), axis=-1)
+    for axis in (0, 1):
+        other = 1 - axis
+        for edge in (lower[..., axis], upper[..., axis]):
+            edge_offset = edge - center[..., axis]
+            chord_square = radius**2 - edge_offset**2
+            with np.errstate(invalid="ignore"):
+                half_chord = np.sqrt(chord_square)
+            for sign in (-1.0, 1.0):
+                crossing = np.empty(center.shape)
+                crossing[..., axis] = edge
+                crossing[..., other] = center[..., other] + sign * half_chord
+                arc_touches |= (
+                    (chord_square >= 0.0)
+                    & (lower[..., other] <= crossing[..., other])
+                    & (crossing[..., other] <= upper[..., other])
+                    & _is_in_sweep(crossing, center, angle, sweep)
+                )
+
+    return np.where(turn == 0, line_touches, arc_touches)
+
+
+def collide_boxes(batch: DubinsPathBatch, boxes: np.ndarray) -> np.ndarray:
+    """
+    Check which paths of a batch collide with which axis-aligned boxes.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        boxes: Obstacle boxes (x_min, y_min, x_max, y_max) as a (M, 4) array.
+
+    Returns:
+        The S+(M,) collision mask.
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    if len(boxes) == 0:
+        return np.zeros(batch.shape + (0,), dtype=bool)
+
+    collisions, path_index, obstacle_index = _candidate_pairs(batch, boxes)
+    turn, length, angle, origin, radius = gather_segments(batch, path_index)
+    touches = segment_box_touches(
+        turn, length, angle, origin, radius, boxes[obstacle_index][:, np.newaxis]
+    )
+
+    collisions.reshape(-1, len(boxes))[path_index, obstacle_index] = np.any(
+        touches, axis=-1
+    )
+    return collisions
+
+
+def any_collision(
+    batch: DubinsPathBatch,
+    circle_centers: np.ndarray | None = None,
+    circle_radii: float | np.ndarray = 0.0,
+    boxes: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Check which paths of a batch collide with any obstacle.
+
+    Args:
+        batch: Batch of Dubins paths of shape S.
+        circle_centers: Circular obstacle centers as a (M, 2) array.
+        circle_radii: Circular obstacle radii, a scalar or a (M,) array.
+        boxes: Box obstacles (x_min, y_min, x_max, y_max) as a (B, 4) array.
+
+    Returns:
+        The S collision mask.
+    """
+    collisions = np.zeros(batch.shape, dtype=bool)
+    if circle_centers is not None:
+        collisions |= np.any(
+            collide_circles(batch, circle_centers, circle_radii), axis=-1
+        )
+    if boxes is not None:
+        collisions |= np.any(collide_boxes(batch, boxes), axis=-1)
+    return collisions
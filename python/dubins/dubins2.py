@@ -2,18 +2,33 @@
 #
 # Copyright (c) 2026 Alexandre Loeblein Heinen
 
-"""2D Dubins path generation for CSC configurations."""
+"""2D Dubins path generation for CSC and CCC configurations.
+
+The demonstration plots every path type for several goal poses. Like every
+module of the package, it uses relative imports and is run as a module from
+the python directory: `python -m dubins.dubins2`, not `python dubins2.py`.
+"""
 
 from __future__ import annotations
 
+import math
 import numpy as np
 import logging
 
-from path_type import PathType, directions_from_path_type, Direction
+from . import batch2, instrument2, scalar2
+from .path_type import (
+    CCC_PATH_TYPES,
+    CSC_PATH_TYPES,
+    InvalidReason,
+    PathType,
+    directions_from_path_type,
+    Direction,
+)
 
 logger = logging.getLogger("dubins")
 unit_z = np.array((0.0, 0.0, 1.0))
 invalid_vector = np.full((2,), np.nan)
+invalid_positions = np.full((9, 2), np.nan)
 
 
 def cartesian_position_from_polar(
@@ -103,6 +118,9 @@ def compute_tangent_positions(
     """
     Compute the tangent positions between two circles.
 
+    For CCC paths, the tangent positions are where the initial and final
+    circles touch the middle circle.
+
     Args:
         initial_center: Center of the initial circle as a 2D numpy array.
         final_center: Center of the final circle as a 2D numpy array.
@@ -126,13 +144,13 @@ def compute_tangent_positions(
 
         case PathType.LSR:
             # Compute upper tangent points: from the bottom to the top
-            belt_azimuth = np.arccos(2 * radius / distance)
+            belt_azimuth = np.arccos(scalar2.clamp_ratio(2 * radius / distance))
             initial_relative_azimuth = -belt_azimuth
             final_relative_azimuth = np.pi - belt_azimuth
 
         case PathType.RSL:
             # Compute inner tangent points: from the top to the bottom
-            belt_azimuth = np.arccos(2 * radius / distance)
+            belt_azimuth = np.arccos(scalar2.clamp_ratio(2 * radius / distance))
             initial_relative_azimuth = belt_azimuth
             final_relative_azimuth = -np.pi + belt_azimuth
 
@@ -141,6 +159,19 @@ def compute_tangent_positions(
             initial_relative_azimuth = 0.5 * np.pi
             final_relative_azimuth = 0.5 * np.pi
 
+        case PathType.RLR:
+            # The middle circle touches both circles: the centers form an
+            # isosceles triangle with sides 2r, 2r and distance
+            triangle_azimuth = np.arccos(distance / (4 * radius))
+            initial_relative_azimuth = -triangle_azimuth
+            final_relative_azimuth = np.pi + triangle_azimuth
+
+        case PathType.LRL:
+            # Mirror of RLR, the middle circle lies on the other side
+            triangle_azimuth = np.arccos(distance / (4 * radius))
+            initial_relative_azimuth = triangle_azimuth
+            final_relative_azimuth = np.pi - triangle_azimuth
+
         case _:
             raise ValueError(f"Invalid Dubins path type: {path_type}")
 
@@ -151,6 +182,26 @@ def compute_tangent_positions(
     )
 
 
+def compute_middle_center_position(
+    initial_center: np.ndarray, initial_tangent_position: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the center of the middle circle of a CCC path.
+
+    The middle circle has the same radius and touches the initial circle at
+    the initial tangent position, so its center is the reflection of the
+    initial center through that position.
+
+    Args:
+        initial_center: Center of the initial circle as a 2D numpy array.
+        initial_tangent_position: Initial tangent position as a 2D numpy array.
+
+    Returns:
+        Center of the middle circle as a 2D numpy array.
+    """
+    return 2 * initial_tangent_position - initial_center
+
+
 def relative_azimuth(
     initial_position: np.ndarray,
     final_position: np.ndarray,
@@ -177,15 +228,187 @@ def relative_azimuth(
     return final_angle - initial_angle
 
 
+def compute_arc_angle(
+    initial_position: np.ndarray,
+    final_position: np.ndarray,
+    center_position: np.ndarray,
+    direction: Direction,
+) -> float:
+    """
+    Compute the angle swept by an arc from one position to another.
+
+    Args:
+        initial_position: Initial position as a 2D numpy array.
+        final_position: Final position as a 2D numpy array.
+        center_position: Center position as a 2D numpy array.
+        direction: Direction of turn (LEFT=CCW, RIGHT=CW).
+
+    Returns:
+        Swept angle in radians, within [0, 2*pi).
+    """
+    angle = relative_azimuth(initial_position, final_position, center_position)
+    return scalar2.wrap_arc_angle(direction.value * angle)
+
+
+def compute_path_geometry(
+    path_type: PathType,
+    radius: float,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+) -> tuple[tuple[np.ndarray, ...], float, float, float, float]:
+    """
+    Compute the whole geometry of a Dubins path.
+
+    Args:
+        path_type: Type of the Dubins path.
+        radius: Radius of the circles.
+        initial_position: Initial position as a 2D numpy array.
+        initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+        final_position: Final position as a 2D numpy array.
+        final_tangent_unit: Final tangent vector as a 2D numpy array.
+
+    Returns:
+        A tuple containing the positions in the DubinsPath packing order
+        (initial position, initial tangent unit, final position, final tangent
+        unit, initial, final and middle centers, initial and final tangent
+        positions), then the initial arc angle, the straight length, the
+        middle arc angle and the final arc angle.
+    """
+    # Ensure that the tangent vectors are unit vectors
+    initial_tangent_unit = normalize_vector(initial_tangent_unit)
+    final_tangent_unit = normalize_vector(final_tangent_unit)
+
+    # Compute the circle center positions
+    initial_direction, final_direction = directions_from_path_type(path_type)
+    initial_center_position = compute_center_position(
+        initial_position, initial_tangent_unit, radius, initial_direction
+    )
+    final_center_position = compute_center_position(
+        final_position, final_tangent_unit, radius, final_direction
+    )
+
+    # Compute the tangent point angles
+    initial_tangent_position, final_tangent_position = compute_tangent_positions(
+        initial_center_position, final_center_position, radius, path_type
+    )
+
+    if path_type in CCC_PATH_TYPES:
+        # The middle arc turns against the initial and final arcs
+        middle_center_position = compute_middle_center_position(
+            initial_center_position, initial_tangent_position
+        )
+        middle_arc_angle = compute_arc_angle(
+            initial_tangent_position,
+            final_tangent_position,
+            middle_center_position,
+            Direction(-initial_direction.value),
+        )
+        straight_length = 0.0
+    else:
+        middle_center_position = invalid_vector
+        middle_arc_angle = 0.0
+        straight_length = np.linalg.norm(
+            final_tangent_position - initial_tangent_position
+        )
+
+    return (
+        (
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+            initial_center_position,
+            final_center_position,
+            middle_center_position,
+            initial_tangent_position,
+            final_tangent_position,
+        ),
+        # Initial arc from the initial position to the initial tangent position
+        compute_arc_angle(
+            initial_position,
+            initial_tangent_position,
+            initial_center_position,
+            initial_direction,
+        ),
+        straight_length,
+        middle_arc_angle,
+        # Final arc from the final tangent position to the final position
+        compute_arc_angle(
+            final_tangent_position,
+            final_position,
+            final_center_position,
+            final_direction,
+        ),
+    )
+
+
+_geometry_solvers = {
+    "numpy": compute_path_geometry,
+    "math": scalar2.compute_path_geometry,
+}
+_default_backend = "numpy"
+
+
+def set_backend(backend: str) -> None:
+    """
+    Select the default geometry backend of DubinsPath.
+
+    The "numpy" backend works on numpy arrays. The "math" backend works on
+    plain floats with the math module, which has a much lower latency for
+    single queries and gives the same results, up to floating point rounding.
+
+    Args:
+        backend: Name of the backend, "numpy" or "math".
+    """
+    global _default_backend
+
+    if backend not in _geometry_solvers:
+        raise ValueError(f"Invalid Dubins backend: {backend}")
+
+    _default_backend = backend
+
+
+def get_backend() -> str:
+    """Get the name of the default geometry backend of DubinsPath."""
+    return _default_backend
+
+
 class DubinsPath:
     """
     Container for a 2D Dubins path representation.
 
-    This container holds only the strictly necessary parameters to define a
-    Dubins path of type CSC (Circular-Straight-Circular). Any other values
-    are computed on demand as properties.
+    This container holds a Dubins path of type CSC (Circular-Straight-Circular)
+    or CCC (Circular-Circular-Circular). It is immutable: every derived value
+    is computed once at construction, the positions being packed into a single
+    read-only array, so that accessing lengths and angles is only an attribute
+    lookup.
     """
 
+    __slots__ = (
+        "_path_type",
+        "_radius",
+        "_positions",
+        "_initial_arc_angle",
+        "_straight_length",
+        "_middle_arc_angle",
+        "_final_arc_angle",
+        "_total_length",
+        "_batch",
+    )
+
+    # Rows of the packed positions array
+    _INITIAL_POSITION = 0
+    _INITIAL_TANGENT_UNIT = 1
+    _FINAL_POSITION = 2
+    _FINAL_TANGENT_UNIT = 3
+    _INITIAL_CENTER_POSITION = 4
+    _FINAL_CENTER_POSITION = 5
+    _MIDDLE_CENTER_POSITION = 6
+    _INITIAL_TANGENT_POSITION = 7
+    _FINAL_TANGENT_POSITION = 8
+
     def __init__(
         self,
         path_type: PathType,
@@ -194,121 +417,569 @@ class DubinsPath:
         initial_tangent_unit: np.ndarray,
         final_position: np.ndarray,
         final_tangent_unit: np.ndarray,
+        backend: str | None = None,
     ):
-        # Ensure that the tangent vectors are unit vectors
-        self.radius = radius
-        self.path_type = path_type
-        self.initial_position = initial_position
-        self.initial_tangent_unit = normalize_vector(initial_tangent_unit)
-        self.final_position = final_position
-        self.final_tangent_unit = normalize_vector(final_tangent_unit)
-
-        # Compute the circle center positions
-        initial_direction, final_direction = directions_from_path_type(path_type)
-        self.initial_center_position = compute_center_position(
-            self.initial_position,
-            self.initial_tangent_unit,
-            self.radius,
-            initial_direction,
+        """
+        Build a Dubins path between two poses.
+
+        Args:
+            path_type: Type of the Dubins path.
+            radius: Radius of the circles.
+            initial_position: Initial position as a 2D numpy array.
+            initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+            final_position: Final position as a 2D numpy array.
+            final_tangent_unit: Final tangent vector as a 2D numpy array.
+            backend: Geometry backend, "numpy" or "math", defaults to the one
+                selected with set_backend.
+        """
+        solver = _geometry_solvers[backend or _default_backend]
+        positions, *angles_and_lengths = solver(
+            path_type,
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
         )
-        self.final_center_position = compute_center_position(
-            self.final_position,
-            self.final_tangent_unit,
-            self.radius,
-            final_direction,
+        self._assign(
+            path_type, radius, np.array(positions, dtype=float), *angles_and_lengths
         )
 
-        # Compute the tangent point angles
-        self.initial_tangent_position, self.final_tangent_position = (
-            compute_tangent_positions(
-                self.initial_center_position,
-                self.final_center_position,
-                self.radius,
-                self.path_type,
-            )
+    @classmethod
+    def from_geometry(
+        cls,
+        path_type: PathType,
+        radius: float,
+        positions: np.ndarray,
+        initial_arc_angle: float,
+        straight_length: float,
+        middle_arc_angle: float,
+        final_arc_angle: float,
+    ) -> DubinsPath:
+        """
+        Create a DubinsPath from an already solved geometry, without solving.
+
+        Args:
+            path_type: The type of the Dubins path.
+            radius: Radius of the circles.
+            positions: Packed (9, 2) array of positions, see the row indices.
+            initial_arc_angle: Angle of the initial arc in radians.
+            straight_length: Length of the straight segment.
+            middle_arc_angle: Angle of the middle arc in radians.
+            final_arc_angle: Angle of the final arc in radians.
+
+        Returns:
+            A DubinsPath holding the given geometry.
+        """
+        path = cls.__new__(cls)
+        path._assign(
+            path_type,
+            radius,
+            np.array(positions, dtype=float),
+            initial_arc_angle,
+            straight_length,
+            middle_arc_angle,
+            final_arc_angle,
+        )
+        return path
+
+    def _assign(
+        self,
+        path_type: PathType,
+        radius: float,
+        positions: np.ndarray,
+        initial_arc_angle: float,
+        straight_length: float,
+        middle_arc_angle: float,
+        final_arc_angle: float,
+    ) -> None:
+        """
+        Store the path geometry and compute the total length once.
+
+        Args:
+            path_type: The type of the Dubins path.
+            radius: Radius of the circles.
+            positions: Packed (9, 2) array of positions, see the row indices.
+            initial_arc_angle: Angle of the initial arc in radians.
+            straight_length: Length of the straight segment.
+            middle_arc_angle: Angle of the middle arc in radians.
+            final_arc_angle: Angle of the final arc in radians.
+        """
+        positions.flags.writeable = False
+        self._path_type = path_type
+        self._radius = radius
+        self._positions = positions
+        self._initial_arc_angle = float(initial_arc_angle)
+        self._straight_length = float(straight_length)
+        self._middle_arc_angle = float(middle_arc_angle)
+        self._final_arc_angle = float(final_arc_angle)
+        self._batch = None
+        self._total_length = (
+            radius * self._initial_arc_angle
+            + self._straight_length
+            + radius * self._middle_arc_angle
+            + radius * self._final_arc_angle
         )
+        if instrument2.is_enabled():
+            instrument2.increment("path.count")
+            instrument2.increment("path.invalid", not self.is_valid)
 
     def __repr__(self) -> str:
-        name = f"{self.path_type.name} Dubins Path"
+        name = f"{self._path_type.name} Dubins Path"
         if self.is_valid:
             return (
-                f"{name}: L={self.total_length:.2f}, "
-                f"a1={np.degrees(self.initial_arc_angle):.0f}°, "
-                f"a2={np.degrees(self.final_arc_angle):.0f}°"
+                f"{name}: L={self._total_length:.2f}, "
+                f"a1={np.degrees(self._initial_arc_angle):.0f}°, "
+                f"a2={np.degrees(self._final_arc_angle):.0f}°"
             )
         else:
             return f"{name}: INVALID"
 
     @property
     def is_valid(self) -> bool:
-        """Check if the path is valid (non-negative lengths)."""
-        return self.total_length >= 0.0
+        """
+        Check if the path is valid (non-negative lengths).
+
+        Invalid paths have NaN lengths, and their invalid_reason is not NONE,
+        like the rows of DubinsPathBatch.is_valid and batch2.invalid_reasons.
+        """
+        return self._total_length >= 0.0
+
+    @property
+    def invalid_reason(self) -> InvalidReason:
+        """Get why the path does not exist, NONE for a valid path."""
+        return scalar2.find_invalid_reason(
+            self._positions[self._INITIAL_CENTER_POSITION],
+            self._positions[self._FINAL_CENTER_POSITION],
+            self._radius,
+            self._path_type,
+        )
 
     @staticmethod
     def create_invalid(path_type: PathType) -> DubinsPath:
         """
-        Create an invalid DubinsPath instance.
+        Create an invalid DubinsPath instance, without solving any geometry.
 
         Args:
             path_type: The type of the Dubins path.
 
         Returns:
-            An invalid DubinsPath instance.
+            An invalid DubinsPath instance, whose invalid_reason is
+            INVALID_INPUT.
         """
-        return DubinsPath(
-            path_type,
-            radius=np.nan,
-            initial_position=invalid_vector,
-            initial_tangent_unit=invalid_vector,
-            final_position=invalid_vector,
-            final_tangent_unit=invalid_vector,
+        return DubinsPath.from_geometry(
+            path_type, np.nan, invalid_positions, np.nan, np.nan, np.nan, np.nan
         )
 
+    @property
+    def path_type(self) -> PathType:
+        """Get the type of the Dubins path."""
+        return self._path_type
+
+    @property
+    def radius(self) -> float:
+        """Get the radius of the circles."""
+        return self._radius
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Get the read-only (9, 2) array of packed positions."""
+        return self._positions
+
+    @property
+    def initial_position(self) -> np.ndarray:
+        """Get the initial position."""
+        return self._positions[DubinsPath._INITIAL_POSITION]
+
+    @property
+    def initial_tangent_unit(self) -> np.ndarray:
+        """Get the initial unit tangent vector."""
+        return self._positions[DubinsPath._INITIAL_TANGENT_UNIT]
+
+    @property
+    def final_position(self) -> np.ndarray:
+        """Get the final position."""
+        return self._positions[DubinsPath._FINAL_POSITION]
+
+    @property
+    def final_tangent_unit(self) -> np.ndarray:
+        """Get the final unit tangent vector."""
+        return self._positions[DubinsPath._FINAL_TANGENT_UNIT]
+
+    @property
+    def initial_center_position(self) -> np.ndarray:
+        """Get the center of the initial circle."""
+        return self._positions[DubinsPath._INITIAL_CENTER_POSITION]
+
+    @property
+    def final_center_position(self) -> np.ndarray:
+        """Get the center of the final circle."""
+        return self._positions[DubinsPath._FINAL_CENTER_POSITION]
+
+    @property
+    def middle_center_position(self) -> np.ndarray:
+        """Get the center of the middle circle, NaN for CSC paths."""
+        return self._positions[DubinsPath._MIDDLE_CENTER_POSITION]
+
+    @property
+    def initial_tangent_position(self) -> np.ndarray:
+        """Get the position where the initial arc ends."""
+        return self._positions[DubinsPath._INITIAL_TANGENT_POSITION]
+
+    @property
+    def final_tangent_position(self) -> np.ndarray:
+        """Get the position where the final arc starts."""
+        return self._positions[DubinsPath._FINAL_TANGENT_POSITION]
+
     @property
     def straight_length(self) -> float:
         """Get the length of the straight segment of the Dubins path."""
-        return np.linalg.norm(
-            self.final_tangent_position - self.initial_tangent_position
-        )
+        return self._straight_length
 
     @property
     def initial_arc_angle(self) -> float:
         """Get the angle of the initial arc segment in radians."""
-        # Initial arc length from the initial position to the initial tangent position
-        direction, _ = directions_from_path_type(self.path_type)
-        angle = relative_azimuth(
-            self.initial_position,
-            self.initial_tangent_position,
-            self.initial_center_position,
-        )
-        return (direction.value * angle) % (2 * np.pi)
+        return self._initial_arc_angle
 
     @property
     def initial_arc_length(self) -> float:
         """Get the length of the initial arc segment."""
-        return self.radius * self.initial_arc_angle
+        return self._radius * self._initial_arc_angle
+
+    @property
+    def middle_arc_angle(self) -> float:
+        """Get the angle of the middle arc segment of CCC paths in radians."""
+        return self._middle_arc_angle
+
+    @property
+    def middle_arc_length(self) -> float:
+        """Get the length of the middle arc segment of CCC paths."""
+        return self._radius * self._middle_arc_angle
 
     @property
     def final_arc_angle(self) -> float:
         """Get the angle of the final arc segment in radians."""
-        # Final arc length from the final tangent position to the final position
-        _, direction = directions_from_path_type(self.path_type)
-        angle = relative_azimuth(
-            self.final_tangent_position,
-            self.final_position,
-            self.final_center_position,
-        )
-        return (direction.value * angle) % (2 * np.pi)
+        return self._final_arc_angle
 
     @property
     def final_arc_length(self) -> float:
         """Get the length of the final arc segment."""
-        return self.radius * self.final_arc_angle
+        return self._radius * self._final_arc_angle
 
     @property
     def total_length(self) -> float:
         """Get the total length of the Dubins path."""
-        return self.initial_arc_length + self.straight_length + self.final_arc_length
+        return self._total_length
+
+    def sample(
+        self,
+        step: float | None = None,
+        n: int | None = None,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Sample poses evenly spaced by arc length along the path.
+
+        Args:
+            step: Maximum arc length between two samples, exclusive with n.
+            n: Number of samples, including both ends. Defaults to 100 if
+                step is not given either.
+            out: Optional (n, 3) array where the samples are written, and
+                which is returned.
+
+        Returns:
+            The (x, y, heading) samples as a (n, 3) array.
+        """
+        if step is not None and n is not None:
+            raise ValueError("Only one of step and n can be given.")
+
+        if step is not None:
+            n = max(int(np.ceil(self._total_length / step)) + 1, 2)
+        elif n is None:
+            n = 100 if out is None else len(out)
+
+        if out is None:
+            return batch2.sample_dubins_paths(self.as_batch(), n)[0]
+        batch2.sample_dubins_paths(self.as_batch(), n, out[np.newaxis])
+        return out
+
+    def pose_at(self, s: float | np.ndarray) -> np.ndarray:
+        """
+        Evaluate the pose at given arc lengths along the path.
+
+        The segment is located from the cumulative arc, middle and arc lengths
+        and the pose is evaluated in closed form, in constant time per arc
+        length. A scalar arc length is evaluated with the math module.
+
+        Args:
+            s: Arc length, or array of arc lengths. Values out of
+                [0, total_length] are clipped.
+
+        Returns:
+            The (x, y, heading) pose as a (3,) array, or a s.shape + (3,)
+            array of poses, headings within [-pi, pi).
+        """
+        if np.ndim(s) > 0:
+            s = np.asarray(s, dtype=float)
+            poses = batch2.pose_at(self.as_batch(), s.reshape(1, -1))
+            return poses.reshape(s.shape + (3,))
+
+        radius = self._radius
+        initial_direction, final_direction = directions_from_path_type(self._path_type)
+        initial_length = radius * self._initial_arc_angle
+        middle_length = self._straight_length + radius * self._middle_arc_angle
+        s = min(max(float(s), 0.0), self._total_length)
+
+        if s < initial_length:
+            turn = initial_direction.value
+            origin = self.initial_center_position
+            vector = self.initial_position - origin
+            angle = math.atan2(vector[1], vector[0])
+        elif s < initial_length + middle_length:
+            s -= initial_length
+            if self._path_type in CCC_PATH_TYPES:
+                turn = -initial_direction.value
+                origin = self.middle_center_position
+                vector = self.initial_tangent_position - origin
+                angle = math.atan2(vector[1], vector[0])
+            else:
+                # Heading at the end of the initial arc
+                turn = 0
+                origin = self.initial_tangent_position
+                vector = self.initial_position - self.initial_center_position
+                angle = math.atan2(vector[1], vector[0]) + initial_direction.value * (
+                    self._initial_arc_angle + 0.5 * math.pi
+                )
+        else:
+            s -= initial_length + middle_length
+            turn = final_direction.value
+            origin = self.final_center_position
+            vector = self.final_tangent_position - origin
+            angle = math.atan2(vector[1], vector[0])
+
+        # Arcs move on the circle around the origin, straights along the heading
+        angle += turn * s / radius
+        scale = s if turn == 0 else radius
+        heading = (angle + turn * 0.5 * math.pi + math.pi) % (2 * math.pi) - math.pi
+        return np.array(
+            (
+                origin[0] + scale * math.cos(angle),
+                origin[1] + scale * math.sin(angle),
+                heading,
+            )
+        )
+
+    def as_batch(self) -> batch2.DubinsPathBatch:
+        """
+        Get the path as a batch of shape (1,), built once and then cached.
+
+        Returns:
+            The DubinsPathBatch holding this path.
+        """
+        if self._batch is None:
+            self._batch = batch2.DubinsPathBatch.from_paths([self])
+        return self._batch
+
+
+def shortest_dubins_path(
+    radius: float,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+    backend: str | None = None,
+) -> DubinsPath:
+    """
+    Find the shortest Dubins path between two poses.
+
+    All the path types are solved together: the four circle centers are
+    computed once and shared, LSR/RSL are skipped as soon as their circles
+    overlap (2*radius > distance), where no inner tangent exists, and RLR/LRL
+    as soon as the circles are too far apart (distance > 4*radius) for a
+    middle circle to touch both. Only the winning path is built as a
+    DubinsPath.
+
+    Args:
+        radius: Radius of the circles.
+        initial_position: Initial position as a 2D numpy array.
+        initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+        final_position: Final position as a 2D numpy array.
+        final_tangent_unit: Final tangent vector as a 2D numpy array.
+        backend: Geometry backend, "numpy" or "math", defaults to the one
+            selected with set_backend.
+
+    Returns:
+        The shortest DubinsPath, or an invalid one if no path type is feasible.
+    """
+    backend = backend or _default_backend
+    if backend == "math":
+        # The geometry of the winning path type is kept, not solved again
+        shortest = scalar2.find_shortest_geometry(
+            radius,
+            scalar2.as_vector(initial_position),
+            scalar2.normalize_vector(scalar2.as_vector(initial_tangent_unit)),
+            scalar2.as_vector(final_position),
+            scalar2.normalize_vector(scalar2.as_vector(final_tangent_unit)),
+        )
+        if shortest is None:
+            return DubinsPath.create_invalid(PathType.LSL)
+        path_type, (positions, *angles_and_lengths) = shortest
+        return DubinsPath.from_geometry(
+            path_type, radius, positions, *angles_and_lengths
+        )
+
+    initial_tangent_unit = normalize_vector(initial_tangent_unit)
+    final_tangent_unit = normalize_vector(final_tangent_unit)
+
+    initial_centers = {
+        direction: compute_center_position(
+            initial_position, initial_tangent_unit, radius, direction
+        )
+        for direction in Direction
+    }
+    final_centers = {
+        direction: compute_center_position(
+            final_position, final_tangent_unit, radius, direction
+        )
+        for direction in Direction
+    }
+
+    best_path_type = None
+    best_length = np.inf
+    for path_type in PathType:
+        initial_direction, final_direction = directions_from_path_type(path_type)
+        initial_center = initial_centers[initial_direction]
+        final_center = final_centers[final_direction]
+
+        distance = np.linalg.norm(final_center - initial_center)
+        if np.isclose(distance, 0.0):
+            continue
+        if (
+            initial_direction != final_direction
+            and scalar2.clamp_ratio(2 * radius / distance) > 1.0
+        ):
+            continue
+        if path_type in CCC_PATH_TYPES and distance > 4 * radius:
+            continue
+
+        initial_tangent, final_tangent = compute_tangent_positions(
+            initial_center, final_center, radius, path_type
+        )
+        if path_type in CCC_PATH_TYPES:
+            middle_length = radius * compute_arc_angle(
+                initial_tangent,
+                final_tangent,
+                compute_middle_center_position(initial_center, initial_tangent),
+                Direction(-initial_direction.value),
+            )
+        else:
+            middle_length = np.linalg.norm(final_tangent - initial_tangent)
+
+        length = (
+            radius
+            * compute_arc_angle(
+                initial_position, initial_tangent, initial_center, initial_direction
+            )
+            + middle_length
+            + radius
+            * compute_arc_angle(
+                final_tangent, final_position, final_center, final_direction
+            )
+        )
+        if length < best_length:
+            best_path_type = path_type
+            best_length = length
+
+    if best_path_type is None:
+        return DubinsPath.create_invalid(PathType.LSL)
+
+    return DubinsPath(
+        best_path_type,
+        radius,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+        backend,
+    )
+
+
+def try_dubins_path(
+    path_type: PathType,
+    radius: float,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+    backend: str | None = None,
+) -> DubinsPath:
+    """
+    Build a Dubins path, or an invalid one, without raising nor warning.
+
+    The circle centers are checked with scalar2.find_invalid_reason first,
+    and infeasible paths are returned without solving their geometry, instead
+    of raising a ValueError for coincident centers, or warning about arc
+    cosines out of range for overlapping or distant circles.
+
+    Args:
+        path_type: Type of the Dubins path.
+        radius: Radius of the circles.
+        initial_position: Initial position as a 2D numpy array.
+        initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+        final_position: Final position as a 2D numpy array.
+        final_tangent_unit: Final tangent vector as a 2D numpy array.
+        backend: Geometry backend of the valid paths, "numpy" or "math",
+            defaults to the one selected with set_backend.
+
+    Returns:
+        The DubinsPath. An invalid path keeps its poses and circle centers,
+        so that its invalid_reason tells why it does not exist, the rest of
+        its geometry being NaN.
+    """
+    initial_direction, final_direction = directions_from_path_type(path_type)
+    poses = (
+        scalar2.as_vector(initial_position),
+        scalar2.normalize_vector(scalar2.as_vector(initial_tangent_unit)),
+        scalar2.as_vector(final_position),
+        scalar2.normalize_vector(scalar2.as_vector(final_tangent_unit)),
+    )
+    initial_center = scalar2.compute_center_position(
+        poses[0], poses[1], radius, initial_direction
+    )
+    final_center = scalar2.compute_center_position(
+        poses[2], poses[3], radius, final_direction
+    )
+
+    reason = scalar2.find_invalid_reason(
+        initial_center, final_center, radius, path_type
+    )
+    if reason == InvalidReason.NONE:
+        if (backend or _default_backend) == "math":
+            # Reuse the centers instead of solving the path from scratch
+            return DubinsPath.from_geometry(
+                path_type,
+                radius,
+                *scalar2.compute_geometry_from_centers(
+                    path_type, radius, *poses, initial_center, final_center
+                ),
+            )
+        return DubinsPath(
+            path_type,
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+            backend,
+        )
+
+    positions = invalid_positions.copy()
+    positions[: len(poses)] = poses
+    positions[DubinsPath._INITIAL_CENTER_POSITION] = initial_center
+    positions[DubinsPath._FINAL_CENTER_POSITION] = final_center
+    return DubinsPath.from_geometry(
+        path_type, radius, positions, np.nan, np.nan, np.nan, np.nan
+    )
 
 
 if __name__ == "__main__":
@@ -326,7 +997,7 @@ if __name__ == "__main__":
 
     for i, (row, col) in enumerate(np.ndindex((rows, cols))):
         ax = fig.add_subplot(rows, cols, i + 1)
-        path_type = PathType(i % len(PathType))
+        path_type = CSC_PATH_TYPES[i % len(CSC_PATH_TYPES)]
         initial_position = np.random.uniform(0.0, 2.0, 2)
         final_position = np.random.uniform(4.0, 6.0, 2)
 
@@ -357,45 +1028,9 @@ if __name__ == "__main__":
         ax.plot(*path.initial_center_position, "x", color=color)
         ax.plot(*path.final_center_position, "x", color=color)
 
-        initial_direction, final_direction = directions_from_path_type(path.path_type)
-
-        # Draw the arc from the initial positions to the initial tangent position
-        initial_arc_angles = np.linspace(
-            0.0, initial_direction * path.initial_arc_angle, num=100
-        )
-        initial_positions = np.array(
-            [
-                rotate_vector(
-                    path.initial_position - path.initial_center_position, angle
-                )
-                + path.initial_center_position
-                for angle in initial_arc_angles
-            ]
-        )
-        ax.plot(initial_positions[:, 0], initial_positions[:, 1], "-", color=color)
-
-        # Draw the arc from the final tangent position to the final position
-        final_arc_angles = np.linspace(
-            0.0, final_direction * path.final_arc_angle, num=100
-        )
-        final_positions = np.array(
-            [
-                rotate_vector(
-                    path.final_tangent_position - path.final_center_position, angle
-                )
-                + path.final_center_position
-                for angle in final_arc_angles
-            ]
-        )
-        ax.plot(final_positions[:, 0], final_positions[:, 1], "-", color=color)
-
-        # Plot the straight line segment
-        ax.plot(
-            [path.initial_tangent_position[0], path.final_tangent_position[0]],
-            [path.initial_tangent_position[1], path.final_tangent_position[1]],
-            "-",
-            color=color,
-        )
+        # Draw the arcs and the straight segment from evenly spaced samples
+        samples = path.sample(n=300)
+        ax.plot(samples[:, 0], samples[:, 1], "-", color=color)
 
         # Plot the quiver
         ax.quiver(
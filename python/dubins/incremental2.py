@@ -0,0 +1,192 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Incremental 2D Dubins solver for a fixed start pose and moving goals.
+
+When a vehicle tracks a moving target, every control tick solves a new path
+from the same start pose. The start circle centers only depend on the start
+pose, so they are computed once when the solver is created, and each goal
+only costs its own circle centers, the tangents and the arc angles. The
+paths are solved by the scalar and batch solvers themselves, given the
+precomputed centers.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+
+from . import scalar2
+from .path_type import PathType, Direction
+from .dubins2 import DubinsPath
+from .batch2 import (
+    DubinsPathBatch,
+    compute_center_positions,
+    iterate_dubins_paths,
+    normalize_vectors,
+    reduce_shortest_lengths,
+    select_shortest_paths,
+)
+
+
+class IncrementalDubinsSolver:
+    """
+    Dubins solver bound to a start pose and a radius.
+
+    Single goals are solved with the pure Python scalar geometry, for the
+    lowest latency per tick, and batches of goals with the vectorized one.
+    """
+
+    def __init__(
+        self,
+        radius: float,
+        initial_position: np.ndarray,
+        initial_tangent_unit: np.ndarray,
+    ):
+        """
+        Precompute the start-side geometry for both turn directions.
+
+        Args:
+            radius: Radius of the circles.
+            initial_position: Initial position as a 2D numpy array.
+            initial_tangent_unit: Initial tangent vector as a 2D numpy array.
+        """
+        self.radius = radius
+        self.initial_position = np.asarray(initial_position, dtype=float)
+        self.initial_tangent_unit = normalize_vectors(
+            np.asarray(initial_tangent_unit, dtype=float)
+        )
+
+        # Start circle centers, as pairs of floats and as arrays
+        self._position = scalar2.as_vector(self.initial_position)
+        self._tangent_unit = scalar2.as_vector(self.initial_tangent_unit)
+        self._centers = {
+            direction: scalar2.compute_center_position(
+                self._position, self._tangent_unit, radius, direction
+            )
+            for direction in Direction
+        }
+        self._center_arrays = {
+            direction: compute_center_positions(
+                self.initial_position, self.initial_tangent_unit, radius, direction
+            )
+            for direction in Direction
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"IncrementalDubinsSolver: radius={self.radius}, "
+            f"initial_position={self.initial_position}"
+        )
+
+    def shortest_path(
+        self, final_position: np.ndarray, final_tangent_unit: np.ndarray
+    ) -> DubinsPath:
+        """
+        Find the shortest Dubins path from the start pose to a goal pose.
+
+        The path types are solved like shortest_dubins_path with the math
+        backend, and the geometry of the winning type is kept to build the
+        DubinsPath, without solving it again.
+
+        Args:
+            final_position: Final position as a 2D numpy array.
+            final_tangent_unit: Final tangent vector as a 2D numpy array.
+
+        Returns:
+            The shortest DubinsPath, or an invalid one if no path type is
+            feasible.
+        """
+        shortest = scalar2.find_shortest_geometry(
+            self.radius,
+            self._position,
+            self._tangent_unit,
+            scalar2.as_vector(final_position),
+            scalar2.normalize_vector(scalar2.as_vector(final_tangent_unit)),
+            self._centers,
+        )
+        if shortest is None:
+            return DubinsPath.create_invalid(PathType.LSL)
+
+        path_type, (positions, *angles_and_lengths) = shortest
+        return DubinsPath.from_geometry(
+            path_type, self.radius, positions, *angles_and_lengths
+        )
+
+    def solve_batch(
+        self,
+        final_position: np.ndarray,
+        final_tangent_unit: np.ndarray,
+        path_types: tuple[PathType, ...] = tuple(PathType),
+    ) -> DubinsPathBatch:
+        """
+        Compute the Dubins paths of every requested type to a batch of goals.
+
+        Args:
+            final_position: Final positions as a (N, 2) numpy array.
+            final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+            path_types: Path types to compute, all of them by default.
+
+        Returns:
+            The batch of Dubins paths, of shape (len(path_types), N), like
+            solve_dubins_batch.
+        """
+        return DubinsPathBatch.stack(
+            list(self._iterate_paths(final_position, final_tangent_unit, path_types))
+        )
+
+    def shortest_lengths(
+        self, final_position: np.ndarray, final_tangent_unit: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the type and length of the shortest Dubins path to each goal.
+
+        Args:
+            final_position: Final positions as a (N, 2) numpy array.
+            final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+
+        Returns:
+            A tuple containing the PathType value of the shortest path of each
+            row, as an int8 array, and its length, like
+            shortest_dubins_lengths.
+        """
+        return reduce_shortest_lengths(
+            self._iterate_paths(final_position, final_tangent_unit)
+        )
+
+    def shortest_batch(
+        self, final_position: np.ndarray, final_tangent_unit: np.ndarray
+    ) -> DubinsPathBatch:
+        """
+        Compute the full geometry of the shortest Dubins path to each goal.
+
+        Args:
+            final_position: Final positions as a (N, 2) numpy array.
+            final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+
+        Returns:
+            The batch of the shortest Dubins paths, of shape (N,), like
+            shortest_dubins_batch.
+        """
+        return select_shortest_paths(
+            self.solve_batch(final_position, final_tangent_unit)
+        )
+
+    def _iterate_paths(
+        self,
+        final_position: np.ndarray,
+        final_tangent_unit: np.ndarray,
+        path_types: tuple[PathType, ...] = tuple(PathType),
+    ) -> Iterator[DubinsPathBatch]:
+        """Iterate over the batches of paths to the goals, per path type."""
+        return iterate_dubins_paths(
+            self.radius,
+            self.initial_position,
+            self.initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+            path_types,
+            self._center_arrays,
+        )
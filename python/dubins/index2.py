@@ -0,0 +1,320 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Spatial index of stored 2D Dubins paths.
+
+The arcs and straight segments of the stored paths are hashed into a uniform
+grid by their tight bounding boxes. A query only gathers the segments of the
+grid cells overlapping its area, by binary searches in the sorted cell keys,
+then checks them exactly with the closed form geometry of collision2, so its
+cost depends on the number of segments around the query, not on the number
+of stored paths.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .batch2 import DubinsPathBatch
+from .collision2 import gather_segments, segment_box_touches, segment_point_distances
+
+
+def segment_bounding_boxes(
+    turn: np.ndarray,
+    length: np.ndarray,
+    angle: np.ndarray,
+    origin: np.ndarray,
+    radius: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the tight bounding boxes of path segments.
+
+    The box of a straight segment is the box of its ends. The box of an arc
+    is the box of its ends and of the axis-extreme points of its circle which
+    are within its sweep.
+
+    Args:
+        turn: Segment turns as a (K, n) array.
+        length: Segment lengths as a (K, n) array.
+        angle: CCW start angles of the arcs and headings of the straight
+            segments as a (K, n) array, see collision2.gather_segments.
+        origin: Segment origins as a (K, n, 2) array.
+        radius: Path radii as a (K, 1) array.
+
+    Returns:
+        The (x_min, y_min, x_max, y_max) boxes as a (K, n, 4) array.
+    """
+    direction = np.stack((np.cos(angle), np.sin(angle)), axis=-1)
+    is_straight = (turn == 0)[..., np.newaxis]
+    radius = radius[..., np.newaxis]
+
+    # Straight segments start at the origin, arcs at radius from the center
+    sweep = length / radius[..., 0]
+    start = np.where(is_straight, origin, origin + radius * direction)
+    end = np.where(
+        is_straight,
+        origin + length[..., np.newaxis] * direction,
+        origin
+        + radius * np.stack((np.cos(angle + sweep), np.sin(angle + sweep)), axis=-1),
+    )
+    lower = np.minimum(start, end)
+    upper = np.maximum(start, end)
+
+    # Extend the arcs to the extreme points of their circle within the sweep
+    for quarter in range(4):
+        extreme_angle = quarter * 0.5 * np.pi
+        extreme = origin + radius * (np.cos(extreme_angle), np.sin(extreme_angle))
+        is_swept = (~is_straight[..., 0]) & (
+            np.mod(extreme_angle - angle, 2 * np.pi) <= sweep
+        )
+        lower = np.where(is_swept[..., np.newaxis], np.minimum(lower, extreme), lower)
+        upper = np.where(is_swept[..., np.newaxis], np.maximum(upper, extreme), upper)
+
+    return np.concatenate((lower, upper), axis=-1)
+
+
+def _unique(indices: np.ndarray) -> np.ndarray:
+    """Get the sorted unique values of an index array, faster than np.unique."""
+    indices = np.sort(indices)
+    is_first = np.ones(len(indices), dtype=bool)
+    is_first[1:] = indices[1:] != indices[:-1]
+    return indices[is_first]
+
+
+class DubinsPathIndex:
+    """
+    Grid index of the segments of a set of Dubins paths.
+
+    The paths are flattened into a batch of shape (N,), and query results are
+    indices into it. Invalid paths and zero length segments are not indexed.
+    """
+
+    def __init__(self, batch: DubinsPathBatch, cell_size: float | None = None):
+        """
+        Index the segments of a batch of paths.
+
+        Args:
+            batch: Batch of Dubins paths of any shape, e.g. the output of
+                shortest_dubins_batch.
+            cell_size: Size of the grid cells, defaults to the median size of
+                the segment bounding boxes.
+        """
+        self.batch = batch[np.ones(batch.shape, dtype=bool)]
+        path_index = np.nonzero(self.batch.is_valid)[0]
+
+        turn, length, angle, origin, radius = gather_segments(self.batch, path_index)
+        boxes = segment_bounding_boxes(turn, length, angle, origin, radius)
+        is_indexed = length > 0.0
+        self._path_index = np.broadcast_to(path_index[:, np.newaxis], turn.shape)[
+            is_indexed
+        ]
+        self._turn = turn[is_indexed]
+        self._length = length[is_indexed]
+        self._angle = angle[is_indexed]
+        self._origin = origin[is_indexed]
+        self._radius = np.broadcast_to(radius, turn.shape)[is_indexed]
+        self._boxes = boxes[is_indexed]
+
+        if cell_size is None:
+            sizes = self._boxes[:, 2:] - self._boxes[:, :2]
+            cell_size = float(np.median(sizes)) if len(sizes) else 1.0
+        self.cell_size = max(cell_size, np.finfo(float).tiny)
+        self._build_grid()
+
+    @staticmethod
+    def from_paths(paths: list, cell_size: float | None = None) -> DubinsPathIndex:
+        """
+        Index a list of DubinsPath objects.
+
+        Args:
+            paths: DubinsPath instances.
+            cell_size: Size of the grid cells, see DubinsPathIndex.
+
+        Returns:
+            The index, whose path indices are the list indices.
+        """
+        return DubinsPathIndex(DubinsPathBatch.from_paths(paths), cell_size)
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+    def _cells(self, boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the lower and upper grid cells of boxes, clamped to the grid."""
+        lower = np.floor(boxes[..., :2] / self.cell_size).astype(np.int64)
+        upper = np.floor(boxes[..., 2:] / self.cell_size).astype(np.int64)
+        return (
+            np.clip(lower, self._grid_lower, self._grid_upper),
+            np.clip(upper, self._grid_lower, self._grid_upper),
+        )
+
+    def _cell_keys(self, cells: np.ndarray) -> np.ndarray:
+        """Get the flat keys of grid cells."""
+        offset = cells - self._grid_lower
+        return offset[..., 0] * self._grid_rows + offset[..., 1]
+
+    def _build_grid(self) -> None:
+        """Hash every segment into the grid cells its bounding box overlaps."""
+        if len(self._boxes) == 0:
+            self._grid_lower = np.zeros(2, dtype=np.int64)
+            self._grid_upper = np.zeros(2, dtype=np.int64)
+        else:
+            self._grid_lower = np.floor(
+                self._boxes[:, :2].min(axis=0) / self.cell_size
+            ).astype(np.int64)
+            self._grid_upper = np.floor(
+                self._boxes[:, 2:].max(axis=0) / self.cell_size
+            ).astype(np.int64)
+        self._grid_rows = self._grid_upper[1] - self._grid_lower[1] + 1
+
+        # Enumerate the covered cells of every segment without a Python loop
+        lower, upper = self._cells(self._boxes)
+        extent = upper - lower + 1
+        counts = extent[:, 0] * extent[:, 1]
+        segment = np.repeat(np.arange(len(self._boxes)), counts)
+        rank = np.arange(len(segment)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = lower[segment] + np.stack(
+            (rank // extent[segment, 1], rank % extent[segment, 1]), axis=-1
+        )
+
+        keys = self._cell_keys(cells)
+        order = np.argsort(keys, kind="stable")
+        self._cell_segments = segment[order]
+        self._keys, self._cell_starts = np.unique(keys[order], return_index=True)
+        self._cell_starts = np.append(self._cell_starts, len(order))
+
+    def _candidate_segments(self, box: np.ndarray) -> np.ndarray:
+        """
+        Gather the indexed segments whose bounding boxes overlap a box.
+
+        Args:
+            box: Query box (x_min, y_min, x_max, y_max).
+
+        Returns:
+            The unique indices of the candidate segments.
+        """
+        box = np.asarray(box, dtype=float)
+        if (
+            len(self._keys) == 0
+            or np.any(box[2:] < self._grid_lower * self.cell_size)
+            or np.any(box[:2] >= (self._grid_upper + 1) * self.cell_size)
+        ):
+            return np.empty(0, dtype=np.intp)
+
+        lower, upper = self._cells(box)
+        rows, cols = np.meshgrid(
+            np.arange(lower[0], upper[0] + 1),
+            np.arange(lower[1], upper[1] + 1),
+            indexing="ij",
+        )
+        keys = self._cell_keys(np.stack((rows.ravel(), cols.ravel()), axis=-1))
+
+        # Binary search the occupied cells, empty cells are not stored
+        position = np.searchsorted(self._keys, keys)
+        is_found = position < len(self._keys)
+        is_found[is_found] = self._keys[position[is_found]] == keys[is_found]
+        position = position[is_found]
+        segments = np.concatenate(
+            [
+                self._cell_segments[self._cell_starts[p] : self._cell_starts[p + 1]]
+                for p in position
+            ]
+            or [np.empty(0, dtype=np.intp)]
+        )
+        segments = _unique(segments)
+
+        boxes = self._boxes[segments]
+        overlaps = (
+            (boxes[:, 0] <= box[2])
+            & (box[0] <= boxes[:, 2])
+            & (boxes[:, 1] <= box[3])
+            & (box[1] <= boxes[:, 3])
+        )
+        return segments[overlaps]
+
+    def _segment_arguments(self, segments: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Get the geometry of segments as (K, 1) arrays for collision2."""
+        return (
+            self._turn[segments, np.newaxis],
+            self._length[segments, np.newaxis],
+            self._angle[segments, np.newaxis],
+            self._origin[segments, np.newaxis],
+            self._radius[segments, np.newaxis],
+        )
+
+    def paths_near_point(self, point: np.ndarray, distance: float) -> np.ndarray:
+        """
+        Find the paths passing within a distance of a point.
+
+        Args:
+            point: Query point as a 2D array.
+            distance: Maximum distance from the point.
+
+        Returns:
+            The sorted indices of the paths.
+        """
+        point = np.asarray(point, dtype=float)
+        segments = self._candidate_segments(
+            np.concatenate((point - distance, point + distance))
+        )
+        distances = segment_point_distances(
+            *self._segment_arguments(segments), point[np.newaxis, np.newaxis]
+        )
+        return _unique(self._path_index[segments[distances[:, 0] <= distance]])
+
+    def paths_in_box(self, box: np.ndarray) -> np.ndarray:
+        """
+        Find the paths touching or entering a box.
+
+        Args:
+            box: Query box (x_min, y_min, x_max, y_max).
+
+        Returns:
+            The sorted indices of the paths.
+        """
+        box = np.asarray(box, dtype=float)
+        segments = self._candidate_segments(box)
+        touches = segment_box_touches(
+            *self._segment_arguments(segments), box[np.newaxis, np.newaxis]
+        )
+        return _unique(self._path_index[segments[touches[:, 0]]])
+
+    def nearest_path(self, point: np.ndarray) -> tuple[int, float]:
+        """
+        Find the path passing the closest to a point.
+
+        The search distance starts at one cell and doubles until a path is
+        found within it, which is then the nearest one.
+
+        Args:
+            point: Query point as a 2D array.
+
+        Returns:
+            The index of the nearest path and its distance to the point, or -1
+            and infinity if no path is indexed.
+        """
+        if len(self._keys) == 0:
+            return -1, np.inf
+
+        point = np.asarray(point, dtype=float)
+        grid_lower = self._grid_lower * self.cell_size
+        grid_upper = (self._grid_upper + 1) * self.cell_size
+        # Distance from the point to the farthest grid corner, covering it all
+        max_distance = np.linalg.norm(
+            np.maximum(np.abs(point - grid_lower), np.abs(point - grid_upper))
+        )
+
+        distance = self.cell_size
+        while True:
+            segments = self._candidate_segments(
+                np.concatenate((point - distance, point + distance))
+            )
+            distances = segment_point_distances(
+                *self._segment_arguments(segments), point[np.newaxis, np.newaxis]
+            )[:, 0]
+            if len(segments) and np.min(distances) <= distance:
+                best = np.argmin(distances)
+                return int(self._path_index[segments[best]]), float(distances[best])
+            if distance >= max_distance:
+                return -1, np.inf
+            distance *= 2
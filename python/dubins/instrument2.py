@@ -0,0 +1,243 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Opt-in counters and timing histograms of the dubins hot paths.
+
+Instrumentation is disabled by default, and then costs one global flag test
+per instrumented call. Once enabled, with enable(), profile() or the
+DUBINS_INSTRUMENT=1 environment variable, the instrumented functions record:
+
+- batch.compute_paths, batch.tangents, batch.pose_at: call counts and timing
+  histograms,
+- path.count and path.invalid: DubinsPath objects created and invalid ones,
+- batch.paths and batch.invalid: batch rows solved and invalid ones,
+- batch.samples: poses evaluated along batches.
+
+Timings are bucketed by powers of two of microseconds, so that latency
+regressions show up as shifted histograms. snapshot() exports everything
+as a JSON serializable dict.
+
+Only the vectorized functions are timed: a timing wrapper costs about as
+much as the scalar geometry itself, even when disabled, so single paths are
+only counted.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+logger = logging.getLogger("dubins")
+
+# Upper bounds of the timing buckets: 1 us, 2 us, 4 us, ... about 34 s
+histogram_bounds = tuple(1e-6 * 2.0**exponent for exponent in range(26))
+
+_enabled = os.environ.get("DUBINS_INSTRUMENT", "") not in ("", "0")
+_lock = threading.Lock()
+# Number of running profiles, and whether recording was enabled before them
+_profile_depth = 0
+_enabled_before_profiles = _enabled
+_counters: dict[str, int] = {}
+_timings: dict[str, list] = {}
+
+
+def enable() -> None:
+    """Start recording counters and timings."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording, the recorded values are kept until reset."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Check whether the instrumentation is recording."""
+    return _enabled
+
+
+def reset() -> None:
+    """Clear all the recorded counters and timings."""
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+
+
+def increment(name: str, count: int = 1) -> None:
+    """
+    Add to a counter, if the instrumentation is enabled.
+
+    Args:
+        name: Name of the counter.
+        count: Value to add.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + int(count)
+
+
+def record_time(name: str, seconds: float) -> None:
+    """
+    Add a duration to a timing histogram, if the instrumentation is enabled.
+
+    Args:
+        name: Name of the timing.
+        seconds: Measured duration.
+    """
+    if not _enabled:
+        return
+    bucket = min(
+        max(0, math.ceil(math.log2(max(seconds, 1e-12) * 1e6))),
+        len(histogram_bounds) - 1,
+    )
+    with _lock:
+        timing = _timings.get(name)
+        if timing is None:
+            # Call count, total, minimum and maximum seconds, bucket counts
+            timing = _timings[name] = [
+                0,
+                0.0,
+                math.inf,
+                0.0,
+                [0] * len(histogram_bounds),
+            ]
+        timing[0] += 1
+        timing[1] += seconds
+        timing[2] = min(timing[2], seconds)
+        timing[3] = max(timing[3], seconds)
+        timing[4][bucket] += 1
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorate a function to record its call durations under a name.
+
+    Args:
+        name: Name of the timing.
+
+    Returns:
+        The decorator. The decorated function only tests a global flag when
+        the instrumentation is disabled.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record_time(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> dict:
+    """
+    Export the recorded values.
+
+    Returns:
+        A JSON serializable dict with the counters, and for each timing its
+        call count, total, mean, minimum and maximum seconds, and its
+        non-empty histogram buckets keyed by their upper bound in seconds.
+    """
+    with _lock:
+        timings = {
+            name: {
+                "count": count,
+                "total_seconds": total,
+                "mean_seconds": total / count,
+                "min_seconds": minimum,
+                "max_seconds": maximum,
+                "histogram": {
+                    f"{bound:.6g}": bucket_count
+                    for bound, bucket_count in zip(histogram_bounds, buckets)
+                    if bucket_count
+                },
+            }
+            for name, (count, total, minimum, maximum, buckets) in _timings.items()
+        }
+        return {"counters": dict(_counters), "timings": timings}
+
+
+def snapshot_json(indent: int | None = 2) -> str:
+    """Export the recorded values as a JSON string, see snapshot."""
+    return json.dumps(snapshot(), indent=indent, sort_keys=True)
+
+
+def _merge(counters: dict[str, int], timings: dict[str, list]) -> None:
+    """Add recorded values to the current ones, the lock being held."""
+    for name, count in counters.items():
+        _counters[name] = _counters.get(name, 0) + count
+    for name, (count, total, minimum, maximum, buckets) in timings.items():
+        timing = _timings.get(name)
+        if timing is None:
+            _timings[name] = [count, total, minimum, maximum, buckets]
+            continue
+        timing[0] += count
+        timing[1] += total
+        timing[2] = min(timing[2], minimum)
+        timing[3] = max(timing[3], maximum)
+        timing[4] = [a + b for a, b in zip(timing[4], buckets)]
+
+
+@contextmanager
+def profile() -> Iterator[dict]:
+    """
+    Record the counters and timings of a block of code.
+
+    The instrumentation is enabled within the block, and the report only
+    holds the values recorded since the block started, e.g.:
+
+        with instrument2.profile() as report:
+            shortest_dubins_batch(...)
+        print(report["timings"])
+
+    The values recorded before the block are kept aside and added back on
+    exit, so enclosing profiles and enable() users still see everything.
+    Profiles nest. Profiles running in several threads at once are not
+    isolated, as the values are global: a report holds the calls of the
+    other threads, and misses those made before an overlapping profile
+    started in another thread.
+
+    Yields:
+        A dict filled with the snapshot of the block when it exits, which is
+        also logged at the debug level.
+    """
+    global _enabled, _enabled_before_profiles, _profile_depth
+    with _lock:
+        if _profile_depth == 0:
+            _enabled_before_profiles = _enabled
+        _profile_depth += 1
+        _enabled = True
+        saved_counters = dict(_counters)
+        saved_timings = dict(_timings)
+        _counters.clear()
+        _timings.clear()
+
+    report = {}
+    try:
+        yield report
+    finally:
+        report.update(snapshot())
+        with _lock:
+            _merge(saved_counters, saved_timings)
+            _profile_depth -= 1
+            if _profile_depth == 0:
+                _enabled = _enabled_before_profiles
+        logger.debug("Dubins profile: %s", json.dumps(report, sort_keys=True))
@@ -0,0 +1,144 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Pairwise shortest Dubins distance matrices between sets of 2D poses."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+
+from .batch2 import shortest_dubins_lengths
+
+# Number of pose pairs solved at once, which bounds the peak memory
+default_block_size = 1 << 16
+
+
+def _solve_block(
+    radius: float,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray,
+    final_tangent_unit: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Solve the shortest paths between every pair of a block of poses.
+
+    Args:
+        radius: Radius of the circles.
+        initial_position: Initial positions as a (R, 2) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a (R, 2) numpy array.
+        final_position: Final positions as a (C, 2) numpy array.
+        final_tangent_unit: Final tangent vectors as a (C, 2) numpy array.
+
+    Returns:
+        The (R, C) shortest path types and lengths.
+    """
+    return shortest_dubins_lengths(
+        radius,
+        initial_position[:, np.newaxis],
+        initial_tangent_unit[:, np.newaxis],
+        final_position[np.newaxis],
+        final_tangent_unit[np.newaxis],
+    )
+
+
+def _iterate_blocks(rows: int, cols: int, block_size: int) -> list[tuple[slice, slice]]:
+    """
+    Split a (rows, cols) matrix into tiles of at most block_size entries.
+
+    Args:
+        rows: Number of rows of the matrix.
+        cols: Number of columns of the matrix.
+        block_size: Maximum number of entries per tile.
+
+    Returns:
+        The row and column slices of each tile, in row-major order.
+    """
+    block_cols = min(cols, block_size)
+    block_rows = max(1, block_size // max(block_cols, 1))
+    return [
+        (slice(i, min(i + block_rows, rows)), slice(j, min(j + block_cols, cols)))
+        for i in range(0, rows, block_rows)
+        for j in range(0, cols, block_cols)
+    ]
+
+
+def dubins_distance_matrix(
+    radius: float,
+    initial_position: np.ndarray,
+    initial_tangent_unit: np.ndarray,
+    final_position: np.ndarray | None = None,
+    final_tangent_unit: np.ndarray | None = None,
+    block_size: int = default_block_size,
+    workers: int | None = None,
+    return_path_types: bool = False,
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the shortest Dubins lengths between every pair of poses.
+
+    The matrix is solved by tiles of at most block_size pose pairs, each tile
+    being a single vectorized call, so the peak memory does not depend on the
+    matrix size. Tiles can be spread over a process pool for large matrices.
+
+    Args:
+        radius: Radius of the circles.
+        initial_position: Initial positions as a (N, 2) numpy array.
+        initial_tangent_unit: Initial tangent vectors as a (N, 2) numpy array.
+        final_position: Final positions as a (M, 2) numpy array, defaults to
+            the initial positions for a square matrix with a zero diagonal.
+        final_tangent_unit: Final tangent vectors as a (M, 2) numpy array,
+            defaults to the initial tangent vectors.
+        block_size: Maximum number of pose pairs solved at once.
+        workers: Number of worker processes, tiles are solved in the calling
+            process if None or 1.
+        return_path_types: Whether to also return the optimal path types.
+
+    Returns:
+        The (N, M) matrix of shortest lengths from the i-th initial pose to
+        the j-th final pose and, if requested, the (N, M) int8 matrix of their
+        PathType values.
+    """
+    initial_position = np.asarray(initial_position, dtype=float)
+    initial_tangent_unit = np.asarray(initial_tangent_unit, dtype=float)
+    if final_position is None:
+        final_position = initial_position
+        final_tangent_unit = initial_tangent_unit
+    final_position = np.asarray(final_position, dtype=float)
+    final_tangent_unit = np.asarray(final_tangent_unit, dtype=float)
+
+    shape = (len(initial_position), len(final_position))
+    lengths = np.empty(shape)
+    path_types = np.empty(shape, dtype=np.int8)
+
+    blocks = _iterate_blocks(*shape, block_size)
+    arguments = zip(
+        *(
+            (
+                radius,
+                initial_position[rows],
+                initial_tangent_unit[rows],
+                final_position[cols],
+                final_tangent_unit[cols],
+            )
+            for rows, cols in blocks
+        )
+    )
+
+    with ExitStack() as stack:
+        if workers is None or workers <= 1:
+            results = map(_solve_block, *arguments)
+        else:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = executor.map(_solve_block, *arguments)
+
+        for (rows, cols), (block_types, block_lengths) in zip(blocks, results):
+            path_types[rows, cols] = block_types
+            lengths[rows, cols] = block_lengths
+
+    if return_path_types:
+        return lengths, path_types
+    return lengths
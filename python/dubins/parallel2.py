@@ -0,0 +1,169 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Multi-process execution of batched 2D Dubins queries over shared memory."""
+
+from __future__ import annotations
+
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .batch2 import shortest_dubins_lengths
+
+# Layout of a pose pair: initial position, initial tangent, final position,
+# final tangent and radius, packed in a single row
+pose_pair_columns = 9
+result_dtype = np.dtype([("length", np.float64), ("path_type", np.int8)])
+
+
+def _solve_chunk(
+    input_name: str,
+    output_name: str,
+    size: int,
+    start: int,
+    stop: int,
+) -> int:
+    """
+    Solve the shortest paths of a chunk of rows of the shared arrays.
+
+    Args:
+        input_name: Name of the shared (size, 9) pose pairs array.
+        output_name: Name of the shared (size,) results array.
+        size: Number of rows of the shared arrays.
+        start: First row of the chunk.
+        stop: Row after the last one of the chunk.
+
+    Returns:
+        The number of solved rows.
+    """
+    input_memory = SharedMemory(name=input_name)
+    output_memory = SharedMemory(name=output_name)
+    poses = results = chunk = None
+    try:
+        poses = np.ndarray((size, pose_pair_columns), buffer=input_memory.buf)
+        results = np.ndarray((size,), dtype=result_dtype, buffer=output_memory.buf)
+
+        chunk = poses[start:stop]
+        path_types, lengths = shortest_dubins_lengths(
+            chunk[:, 8], chunk[:, 0:2], chunk[:, 2:4], chunk[:, 4:6], chunk[:, 6:8]
+        )
+        results["path_type"][start:stop] = path_types
+        results["length"][start:stop] = lengths
+    except BaseException as error:
+        # The frames of the traceback hold views of the shared memory too
+        traceback.clear_frames(error.__traceback__)
+        raise
+    finally:
+        # Release the views before closing the shared memory, even on error
+        del poses, results, chunk
+        input_memory.close()
+        output_memory.close()
+
+    return stop - start
+
+
+class ParallelDubinsExecutor:
+    """
+    Process pool solving large batches of Dubins queries.
+
+    The pose pairs are copied once into a shared memory block, which the
+    workers read without any pickling. Each worker solves contiguous chunks of
+    rows and writes them into a shared result block at the same rows, so the
+    output order is deterministic whatever the scheduling of the chunks.
+
+    The executor can be used as a context manager, which shuts the pool down
+    on exit.
+    """
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 1 << 16):
+        """
+        Start the process pool.
+
+        Args:
+            workers: Number of worker processes, defaults to the CPU count.
+            chunk_size: Number of pose pairs solved per task.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self) -> ParallelDubinsExecutor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut the process pool down."""
+        self._pool.shutdown()
+
+    def shortest_lengths(
+        self,
+        radius: float | np.ndarray,
+        initial_position: np.ndarray,
+        initial_tangent_unit: np.ndarray,
+        final_position: np.ndarray,
+        final_tangent_unit: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find the type and length of the shortest Dubins path for N pose pairs.
+
+        Args:
+            radius: Radius of the circles, a scalar or a (N,) array of row
+                radii.
+            initial_position: Initial positions as a (N, 2) numpy array.
+            initial_tangent_unit: Initial tangent vectors as a (N, 2) array.
+            final_position: Final positions as a (N, 2) numpy array.
+            final_tangent_unit: Final tangent vectors as a (N, 2) numpy array.
+
+        Returns:
+            The same as batch2.shortest_dubins_lengths: the int8 PathType
+            values of the shortest paths and their lengths.
+        """
+        size = len(initial_position)
+        input_memory = SharedMemory(
+            create=True, size=max(size * pose_pair_columns * 8, 1)
+        )
+        output_memory = SharedMemory(
+            create=True, size=max(size * result_dtype.itemsize, 1)
+        )
+        poses = results = None
+        try:
+            poses = np.ndarray((size, pose_pair_columns), buffer=input_memory.buf)
+            poses[:, 0:2] = initial_position
+            poses[:, 2:4] = initial_tangent_unit
+            poses[:, 4:6] = final_position
+            poses[:, 6:8] = final_tangent_unit
+            poses[:, 8] = radius
+
+            futures = [
+                self._pool.submit(
+                    _solve_chunk,
+                    input_memory.name,
+                    output_memory.name,
+                    size,
+                    start,
+                    min(start + self.chunk_size, size),
+                )
+                for start in range(0, size, self.chunk_size)
+            ]
+            for future in futures:
+                future.result()
+
+            results = np.ndarray((size,), dtype=result_dtype, buffer=output_memory.buf)
+            path_types = results["path_type"].copy()
+            lengths = results["length"].copy()
+        finally:
+            # Release the views before closing the shared memory, even on error
+            del poses, results
+            input_memory.close()
+            input_memory.unlink()
+            output_memory.close()
+            output_memory.unlink()
+
+        return path_types, lengths
@@ -15,19 +15,41 @@ class Direction(IntEnum):
 
 
 class PathType(IntEnum):
-    """Dubins path types for CSC configurations."""
+    """Dubins path types for CSC and CCC configurations."""
 
     LSL = 0  # Left-Straight-Left (CCW-S-CCW)
     LSR = 1  # Left-Straight-Right (CCW-S-CW)
     RSL = 2  # Right-Straight-Left (CW-S-CCW)
     RSR = 3  # Right-Straight-Right (CW-S-CW)
+    RLR = 4  # Right-Left-Right (CW-CCW-CW)
+    LRL = 5  # Left-Right-Left (CCW-CW-CCW)
+
+
+class InvalidReason(IntEnum):
+    """
+    Reasons why a Dubins path of a given type does not exist.
+
+    A path is valid, i.e. its lengths are non-negative numbers, exactly when
+    its reason is NONE, for DubinsPath as well as for DubinsPathBatch rows.
+    The reasons only depend on the circle centers, the radius and the type.
+    """
+
+    NONE = 0  # The path exists
+    INVALID_INPUT = 1  # NaN or infinite pose or radius
+    COINCIDENT_CENTERS = 2  # Initial and final circles share their center
+    OVERLAPPING_CIRCLES = 3  # LSR/RSL: no inner tangent, distance < 2*radius
+    DISTANT_CIRCLES = 4  # RLR/LRL: no middle circle, distance > 4*radius
+
+
+CSC_PATH_TYPES = (PathType.LSL, PathType.LSR, PathType.RSL, PathType.RSR)
+CCC_PATH_TYPES = (PathType.RLR, PathType.LRL)
 
 
 def path_type_from_directions(
     initial_direction: Direction, final_direction: Direction
 ) -> PathType:
     """
-    Convert initial and final arc directions to Dubins path type.
+    Convert initial and final arc directions to CSC Dubins path type.
 
     Args:
         initial_direction: Direction of the initial arc (LEFT or RIGHT).
@@ -63,7 +85,8 @@ def directions_from_path_type(
         path_type: The type of the Dubins path.
 
     Returns:
-        A tuple containing the initial and final arc directions.
+        A tuple containing the initial and final arc directions. The middle
+        arc of a CCC path turns in the opposite direction.
     """
     if path_type == PathType.LSL:
         return (Direction.LEFT, Direction.LEFT)
@@ -73,5 +96,9 @@ def directions_from_path_type(
         return (Direction.RIGHT, Direction.LEFT)
     elif path_type == PathType.RSR:
         return (Direction.RIGHT, Direction.RIGHT)
+    elif path_type == PathType.RLR:
+        return (Direction.RIGHT, Direction.RIGHT)
+    elif path_type == PathType.LRL:
+        return (Direction.LEFT, Direction.LEFT)
 
     raise ValueError(f"Invalid Dubins path type: {path_type}")
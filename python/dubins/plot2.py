@@ -2,17 +2,30 @@
 #
 # Copyright (c) 2026 Alexandre Loeblein Heinen
 
-"""Plotting utilities for 2D Dubins paths."""
+"""Plotting utilities for 2D Dubins paths.
+
+Matplotlib is only imported when a plotting function is first called, so that
+importing this module does not slow the start of the geometry-only users down.
+
+The demonstration plots the CSC paths between two poses. Like every module of
+the package, it uses relative imports and is run as a module from the python
+directory: `python -m dubins.plot2`, not `python plot2.py`.
+"""
 
 from __future__ import annotations
 
-from matplotlib import pyplot
+from typing import TYPE_CHECKING
 import numpy as np
 import os
 import logging
 
-from path_type import Direction, PathType, directions_from_path_type
-from dubins2 import DubinsPath, rotate_vector
+from .path_type import CSC_PATH_TYPES, PathType
+from .dubins2 import DubinsPath, shortest_dubins_path
+from .batch2 import DubinsPathBatch, sample_dubins_paths
+
+if TYPE_CHECKING:
+    from matplotlib import pyplot
+    from matplotlib.collections import LineCollection
 
 logger = logging.getLogger("dubins")
 
@@ -25,8 +38,10 @@ def plot_dubins_path(ax: pyplot.Axes, path: DubinsPath) -> None:
         ax: Matplotlib Axes to plot on.
         path: DubinsPath instance to plot.
     """
+    import matplotlib
+
     # Get a color from colormap
-    cm = pyplot.get_cmap("tab10")
+    cm = matplotlib.colormaps["tab10"]
     color = cm(path.path_type.value)
     
     # Plot the initial and final positions
@@ -41,45 +56,9 @@ def plot_dubins_path(ax: pyplot.Axes, path: DubinsPath) -> None:
     ax.plot(*path.initial_center_position, "x", color=color)
     ax.plot(*path.final_center_position, "x", color=color)
     
-    initial_direction, final_direction = directions_from_path_type(path.path_type)
-    
-    # Draw the arc from the initial position to the initial tangent position
-    initial_arc_angles = np.linspace(
-        0.0, initial_direction * path.initial_arc_angle, num=100
-    )
-    initial_positions = np.array(
-        [
-            rotate_vector(
-                path.initial_position - path.initial_center_position, angle
-            )
-            + path.initial_center_position
-            for angle in initial_arc_angles
-        ]
-    )
-    ax.plot(initial_positions[:, 0], initial_positions[:, 1], "-", color=color)
-    
-    # Draw the arc from the final tangent position to the final position
-    final_arc_angles = np.linspace(
-        0.0, final_direction * path.final_arc_angle, num=100
-    )
-    final_positions = np.array(
-        [
-            rotate_vector(
-                path.final_tangent_position - path.final_center_position, angle
-            )
-            + path.final_center_position
-            for angle in final_arc_angles
-        ]
-    )
-    ax.plot(final_positions[:, 0], final_positions[:, 1], "-", color=color)
-    
-    # Plot the straight line segment
-    ax.plot(
-        [path.initial_tangent_position[0], path.final_tangent_position[0]],
-        [path.initial_tangent_position[1], path.final_tangent_position[1]],
-        "-",
-        color=color,
-    )
+    # Draw the arcs and the middle segment from evenly spaced samples
+    samples = path.sample(n=300)
+    ax.plot(samples[:, 0], samples[:, 1], "-", color=color)
     
     # Plot the tangent vectors
     ax.quiver(
@@ -100,6 +79,138 @@ def plot_dubins_path(ax: pyplot.Axes, path: DubinsPath) -> None:
     )
 
 
+def compute_pixel_size(ax: pyplot.Axes) -> float:
+    """
+    Compute the size of a screen pixel in data units on the given Axes.
+
+    Args:
+        ax: Matplotlib Axes, with its final limits already set.
+
+    Returns:
+        The largest of the pixel width and height, in data units.
+    """
+    bbox = ax.get_window_extent()
+    x_min, x_max = ax.get_xlim()
+    y_min, y_max = ax.get_ylim()
+    return max(abs(x_max - x_min) / bbox.width, abs(y_max - y_min) / bbox.height)
+
+
+def plot_dubins_batch(
+    ax: pyplot.Axes,
+    batch: DubinsPathBatch,
+    samples: int = 100,
+    pixel_size: float | None = None,
+    linewidth: float = 1.0,
+) -> list[LineCollection]:
+    """
+    Plot a batch of Dubins paths on the given Axes with one artist per type.
+
+    All the paths are sampled in a single vectorized call and drawn with one
+    LineCollection per PathType color, instead of several plot calls per
+    path. Invalid paths are skipped.
+
+    Args:
+        ax: Matplotlib Axes to plot on.
+        batch: Batch of Dubins paths of any shape.
+        samples: Maximum number of samples per path.
+        pixel_size: Size of a pixel in data units. If given, the number of
+            samples is decimated so that the chord of an arc between two
+            samples deviates from the arc by less than a quarter of pixel.
+        linewidth: Width of the lines.
+
+    Returns:
+        The LineCollection of each plotted PathType.
+    """
+    import matplotlib
+    from matplotlib.collections import LineCollection
+
+    batch = batch[batch.is_valid]
+    if batch.shape[0] == 0:
+        return []
+
+    if pixel_size is not None:
+        # The sagitta of a chord of length h on a circle of radius r is about
+        # h**2 / (8 r), keep it below a quarter of pixel
+        step = np.sqrt(2 * np.min(batch.radius) * pixel_size)
+        needed = int(np.ceil(np.max(batch.total_length) / step)) + 1
+        samples = min(samples, max(needed, 2))
+
+    points = sample_dubins_paths(batch, samples)[..., :2]
+    colormap = matplotlib.colormaps["tab10"]
+
+    collections = []
+    for path_type in PathType:
+        is_path_type = batch.path_type == path_type
+        if not np.any(is_path_type):
+            continue
+        collection = LineCollection(
+            points[is_path_type],
+            colors=[colormap(path_type.value)],
+            linewidths=linewidth,
+            label=path_type.name,
+        )
+        ax.add_collection(collection)
+        collections.append(collection)
+
+    ax.autoscale_view()
+    return collections
+
+
+def render_dubins_batch(
+    batch: DubinsPathBatch,
+    file_path: str,
+    samples: int = 200,
+    size: tuple[float, float] = (8.0, 8.0),
+    dpi: int = 100,
+) -> None:
+    """
+    Render a batch of Dubins paths to an image file without any GUI.
+
+    The figure is drawn with the Agg canvas directly, bypassing pyplot and its
+    interactive backend, so it works on headless machines and does not keep
+    figures alive between images. The paths are decimated to the pixel size
+    of the image.
+
+    Args:
+        batch: Batch of Dubins paths of any shape.
+        file_path: Path of the output image.
+        samples: Maximum number of samples per path.
+        size: Size of the figure in inches.
+        dpi: Resolution of the image.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=size, dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot(1, 1, 1)
+    ax.set_aspect("equal", adjustable="datalim")
+    ax.grid(True)
+
+    # Fit the limits to the circles of the paths before computing the pixel size
+    valid = batch[batch.is_valid]
+    if valid.shape[0] > 0:
+        centers = np.concatenate(
+            [
+                valid.initial_center_position,
+                valid.final_center_position,
+                valid.middle_center_position,
+            ]
+        )
+        radii = np.tile(valid.radius, 3)[:, np.newaxis]
+        corners = np.concatenate([centers - radii, centers + radii])
+        corners = corners[np.all(np.isfinite(corners), axis=-1)]
+        ax.update_datalim(corners)
+        ax.autoscale_view()
+    figure.canvas.draw()
+
+    plot_dubins_batch(ax, batch, samples, compute_pixel_size(ax))
+    ax.legend()
+    figure.savefig(file_path)
+
+    logger.info("Dubins paths rendered to %s", file_path)
+
+
 def plot_dubins_paths(
     paths: list[DubinsPath],
     title: str = "Dubins Paths",
@@ -113,6 +224,8 @@ def plot_dubins_paths(
         title: Title of the plot.
         file_name: Name of the output file.
     """
+    from matplotlib import pyplot
+
     fig = pyplot.figure()
     ax = fig.add_subplot(1, 1, 1)
     ax.set_title(title)
@@ -156,5 +269,6 @@ if __name__ == "__main__":
         final_tangent_unit=final_tangent_unit,
         radius=radius,)
     
-    paths = [DubinsPath(path_type=pt, **args) for pt in PathType]
+    paths = [DubinsPath(path_type=pt, **args) for pt in CSC_PATH_TYPES]
+    logger.info("Shortest path: %s", shortest_dubins_path(**args))
     plot_dubins_paths(paths)
\ No newline at end of file
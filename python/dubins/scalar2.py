@@ -0,0 +1,518 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Pure Python scalar backend for 2D Dubins path generation.
+
+This module mirrors the NumPy geometry of dubins2 using plain floats and the
+math module. For a single query, the per-call overhead of NumPy on 2-element
+arrays dominates the actual computation, so this backend has a much lower
+latency while giving the same results, up to floating point rounding.
+"""
+
+from __future__ import annotations
+
+import math
+
+from .path_type import (
+    CCC_PATH_TYPES,
+    InvalidReason,
+    PathType,
+    Direction,
+    directions_from_path_type,
+)
+
+Vector = tuple[float, float]
+
+# Same absolute tolerance as np.isclose(value, 0.0)
+zero_tolerance = 1e-8
+invalid_vector = (math.nan, math.nan)
+
+# Turn directions of every path type, resolved once instead of at every call
+_path_type_directions = {
+    path_type: directions_from_path_type(path_type) for path_type in PathType
+}
+
+
+def as_vector(v) -> Vector:
+    """
+    Convert a 2D sequence, such as a numpy array, to a pair of floats.
+
+    Args:
+        v: Input 2D sequence.
+
+    Returns:
+        The vector as a pair of floats.
+    """
+    return (float(v[0]), float(v[1]))
+
+
+def normalize_vector(v: Vector) -> Vector:
+    """
+    Normalize a 2D vector.
+
+    Args:
+        v: Input vector as a pair of floats.
+
+    Returns:
+        Normalized vector as a pair of floats.
+    """
+    norm = math.hypot(v[0], v[1])
+
+    if abs(norm) <= zero_tolerance:
+        return (0.0, 0.0)
+
+    return (v[0] / norm, v[1] / norm)
+
+
+def rotate_vector(v: Vector, angle: float) -> Vector:
+    """
+    Rotate a 2D vector by a given angle.
+
+    Args:
+        v: Input vector as a pair of floats.
+        angle: Angle in radians to rotate the vector.
+
+    Returns:
+        Rotated vector as a pair of floats.
+    """
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    return (cos * v[0] - sin * v[1], sin * v[0] + cos * v[1])
+
+
+def compute_center_position(
+    position: Vector,
+    tangent_unit: Vector,
+    radius: float,
+    direction: Direction,
+) -> Vector:
+    """
+    Compute the center position of the circle.
+
+    Args:
+        position: Position as a pair of floats.
+        tangent_unit: Tangent unit vector as a pair of floats.
+        radius: Radius of the circle.
+        direction: Direction of turn (LEFT=CCW, RIGHT=CW).
+
+    Returns:
+        Center position as a pair of floats.
+    """
+    # Same as the cross product of the tangent with the unit z vector
+    scale = direction.value * radius
+    return (
+        position[0] - scale * tangent_unit[1],
+        position[1] + scale * tangent_unit[0],
+    )
+
+
+def compute_tangent_positions(
+    initial_center: Vector,
+    final_center: Vector,
+    radius: float,
+    path_type: PathType,
+) -> tuple[Vector, Vector]:
+    """
+    Compute the tangent positions between two circles.
+
+    Infeasible configurations give NaN positions, like np.arccos would.
+
+    Args:
+        initial_center: Center of the initial circle as a pair of floats.
+        final_center: Center of the final circle as a pair of floats.
+        radius: Radius of the circles.
+        path_type: Type of the Dubins path.
+
+    Returns:
+        A tuple containing the initial and final tangent positions.
+    """
+    offset_x = final_center[0] - initial_center[0]
+    offset_y = final_center[1] - initial_center[1]
+    distance = math.hypot(offset_x, offset_y)
+
+    if abs(distance) <= zero_tolerance:
+        raise ValueError("Initial and final circle centers are too close.")
+
+    match path_type:
+        case PathType.LSL:
+            initial_relative_azimuth = -0.5 * math.pi
+            final_relative_azimuth = -0.5 * math.pi
+
+        case PathType.LSR:
+            belt_azimuth = _arccos(clamp_ratio(2 * radius / distance))
+            initial_relative_azimuth = -belt_azimuth
+            final_relative_azimuth = math.pi - belt_azimuth
+
+        case PathType.RSL:
+            belt_azimuth = _arccos(clamp_ratio(2 * radius / distance))
+            initial_relative_azimuth = belt_azimuth
+            final_relative_azimuth = -math.pi + belt_azimuth
+
+        case PathType.RSR:
+            initial_relative_azimuth = 0.5 * math.pi
+            final_relative_azimuth = 0.5 * math.pi
+
+        case PathType.RLR:
+            triangle_azimuth = _arccos(distance / (4 * radius))
+            initial_relative_azimuth = -triangle_azimuth
+            final_relative_azimuth = math.pi + triangle_azimuth
+
+        case PathType.LRL:
+            triangle_azimuth = _arccos(distance / (4 * radius))
+            initial_relative_azimuth = triangle_azimuth
+            final_relative_azimuth = math.pi - triangle_azimuth
+
+        case _:
+            raise ValueError(f"Invalid Dubins path type: {path_type}")
+
+    offset_unit = (offset_x / distance, offset_y / distance)
+    initial_x, initial_y = rotate_vector(offset_unit, initial_relative_azimuth)
+    final_x, final_y = rotate_vector(offset_unit, final_relative_azimuth)
+    return (
+        (
+            initial_x * radius + initial_center[0],
+            initial_y * radius + initial_center[1],
+        ),
+        (final_x * radius + final_center[0], final_y * radius + final_center[1]),
+    )
+
+
+def find_invalid_reason(
+    initial_center: Vector,
+    final_center: Vector,
+    radius: float,
+    path_type: PathType,
+) -> InvalidReason:
+    """
+    Find why the path between two circles does not exist, without raising.
+
+    The checks are the ones of compute_tangent_positions, which raises for
+    coincident centers and gives NaN positions for the other reasons.
+
+    Args:
+        initial_center: Center of the initial circle as a pair of floats.
+        final_center: Center of the final circle as a pair of floats.
+        radius: Radius of the circles.
+        path_type: Type of the Dubins path.
+
+    Returns:
+        The reason, NONE if the path exists.
+    """
+    distance = math.hypot(
+        final_center[0] - initial_center[0], final_center[1] - initial_center[1]
+    )
+    if not (math.isfinite(distance) and math.isfinite(radius)):
+        return InvalidReason.INVALID_INPUT
+    if abs(distance) <= zero_tolerance:
+        return InvalidReason.COINCIDENT_CENTERS
+    if (
+        path_type in (PathType.LSR, PathType.RSL)
+        and clamp_ratio(2 * radius / distance) > 1.0
+    ):
+        return InvalidReason.OVERLAPPING_CIRCLES
+    if path_type in CCC_PATH_TYPES and distance / (4 * radius) > 1.0:
+        return InvalidReason.DISTANT_CIRCLES
+    return InvalidReason.NONE
+
+
+def clamp_ratio(ratio: float) -> float:
+    """
+    Clamp a feasibility ratio to 1 for circles tangent up to rounding errors.
+
+    The circles of a pose and of itself are tangent, at a distance of exactly
+    2 * radius, which rounding errors make slightly smaller or larger: the
+    belt would be infeasible, or its arc cosine a spurious small angle making
+    both arcs full turns.
+
+    Args:
+        ratio: Ratio of 2 * radius to the distance between the circle centers.
+
+    Returns:
+        The ratio, 1 if it is within the zero tolerance of 1.
+    """
+    if abs(ratio - 1.0) <= zero_tolerance:
+        return 1.0
+    return ratio
+
+
+def wrap_arc_angle(angle: float) -> float:
+    """
+    Wrap an arc angle into [0, 2*pi).
+
+    Angles within the zero tolerance of a full turn are snapped to 0, so that
+    a degenerate arc does not turn into a full circle by rounding errors.
+
+    Args:
+        angle: Signed swept angle in radians.
+
+    Returns:
+        Swept angle in radians, within [0, 2*pi).
+    """
+    angle %= 2 * math.pi
+    if angle >= 2 * math.pi - zero_tolerance:
+        return 0.0
+    return angle
+
+
+def _arccos(value: float) -> float:
+    """Arc cosine returning NaN out of [-1, 1] instead of raising."""
+    if -1.0 <= value <= 1.0:
+        return math.acos(value)
+    return math.nan
+
+
+def compute_arc_angle(
+    initial_position: Vector,
+    final_position: Vector,
+    center_position: Vector,
+    direction: Direction,
+) -> float:
+    """
+    Compute the angle swept by an arc from one position to another.
+
+    Args:
+        initial_position: Initial position as a pair of floats.
+        final_position: Final position as a pair of floats.
+        center_position: Center position as a pair of floats.
+        direction: Direction of turn (LEFT=CCW, RIGHT=CW).
+
+    Returns:
+        Swept angle in radians, within [0, 2*pi).
+    """
+    initial_angle = math.atan2(
+        initial_position[1] - center_position[1],
+        initial_position[0] - center_position[0],
+    )
+    final_angle = math.atan2(
+        final_position[1] - center_position[1],
+        final_position[0] - center_position[0],
+    )
+    return wrap_arc_angle(direction.value * (final_angle - initial_angle))
+
+
+def compute_path_geometry(
+    path_type: PathType,
+    radius: float,
+    initial_position: Vector,
+    initial_tangent_unit: Vector,
+    final_position: Vector,
+    final_tangent_unit: Vector,
+) -> tuple[tuple[Vector, ...], float, float, float, float]:
+    """
+    Compute the whole geometry of a Dubins path.
+
+    Args:
+        path_type: Type of the Dubins path.
+        radius: Radius of the circles.
+        initial_position: Initial position as a pair of floats.
+        initial_tangent_unit: Initial tangent vector as a pair of floats.
+        final_position: Final position as a pair of floats.
+        final_tangent_unit: Final tangent vector as a pair of floats.
+
+    Returns:
+        A tuple containing the positions in the DubinsPath packing order
+        (initial position, initial tangent unit, final position, final tangent
+        unit, initial, final and middle centers, initial and final tangent
+        positions), then the initial arc angle, the straight length, the
+        middle arc angle and the final arc angle.
+    """
+    initial_position = as_vector(initial_position)
+    final_position = as_vector(final_position)
+    initial_tangent_unit = normalize_vector(as_vector(initial_tangent_unit))
+    final_tangent_unit = normalize_vector(as_vector(final_tangent_unit))
+
+    initial_direction, final_direction = directions_from_path_type(path_type)
+    initial_center = compute_center_position(
+        initial_position, initial_tangent_unit, radius, initial_direction
+    )
+    final_center = compute_center_position(
+        final_position, final_tangent_unit, radius, final_direction
+    )
+    return compute_geometry_from_centers(
+        path_type,
+        radius,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+        initial_center,
+        final_center,
+    )
+
+
+def compute_geometry_from_centers(
+    path_type: PathType,
+    radius: float,
+    initial_position: Vector,
+    initial_tangent_unit: Vector,
+    final_position: Vector,
+    final_tangent_unit: Vector,
+    initial_center: Vector,
+    final_center: Vector,
+) -> tuple[tuple[Vector, ...], float, float, float, float]:
+    """
+    Compute the geometry of a Dubins path whose circle centers are known.
+
+    Args:
+        path_type: Type of the Dubins path.
+        radius: Radius of the circles.
+        initial_position: Initial position as a pair of floats.
+        initial_tangent_unit: Initial unit tangent as a pair of floats.
+        final_position: Final position as a pair of floats.
+        final_tangent_unit: Final unit tangent as a pair of floats.
+        initial_center: Center of the initial circle as a pair of floats.
+        final_center: Center of the final circle as a pair of floats.
+
+    Returns:
+        The same as compute_path_geometry.
+    """
+    initial_direction, final_direction = _path_type_directions[path_type]
+    initial_tangent, final_tangent = compute_tangent_positions(
+        initial_center, final_center, radius, path_type
+    )
+
+    if path_type in CCC_PATH_TYPES:
+        middle_center = (
+            2 * initial_tangent[0] - initial_center[0],
+            2 * initial_tangent[1] - initial_center[1],
+        )
+        middle_arc_angle = compute_arc_angle(
+            initial_tangent,
+            final_tangent,
+            middle_center,
+            Direction(-initial_direction.value),
+        )
+        straight_length = 0.0
+    else:
+        middle_center = invalid_vector
+        middle_arc_angle = 0.0
+        straight_length = math.hypot(
+            final_tangent[0] - initial_tangent[0],
+            final_tangent[1] - initial_tangent[1],
+        )
+
+    return (
+        (
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+            initial_center,
+            final_center,
+            middle_center,
+            initial_tangent,
+            final_tangent,
+        ),
+        compute_arc_angle(
+            initial_position, initial_tangent, initial_center, initial_direction
+        ),
+        straight_length,
+        middle_arc_angle,
+        compute_arc_angle(final_tangent, final_position, final_center, final_direction),
+    )
+
+
+def find_shortest_geometry(
+    radius: float,
+    initial_position: Vector,
+    initial_tangent_unit: Vector,
+    final_position: Vector,
+    final_tangent_unit: Vector,
+    initial_centers: dict[Direction, Vector] | None = None,
+) -> tuple[PathType, tuple] | None:
+    """
+    Find the shortest Dubins path between two poses, with its geometry.
+
+    Path types whose circles cannot be joined are skipped, see
+    find_invalid_reason, and the geometry of the others is computed from the
+    circle centers, shared by the path types turning in the same direction.
+
+    Args:
+        radius: Radius of the circles.
+        initial_position: Initial position as a pair of floats.
+        initial_tangent_unit: Initial unit tangent as a pair of floats.
+        final_position: Final position as a pair of floats.
+        final_tangent_unit: Final unit tangent as a pair of floats.
+        initial_centers: Optional precomputed initial circle centers, by turn
+            direction, e.g. for many goals from the same start pose.
+
+    Returns:
+        The type of the shortest path and its geometry, as returned by
+        compute_geometry_from_centers, or None if no path type is feasible.
+    """
+    if initial_centers is None:
+        initial_centers = {
+            direction: compute_center_position(
+                initial_position, initial_tangent_unit, radius, direction
+            )
+            for direction in Direction
+        }
+    final_centers = {
+        direction: compute_center_position(
+            final_position, final_tangent_unit, radius, direction
+        )
+        for direction in Direction
+    }
+
+    best = None
+    best_length = math.inf
+    for path_type in PathType:
+        initial_direction, final_direction = _path_type_directions[path_type]
+        initial_center = initial_centers[initial_direction]
+        final_center = final_centers[final_direction]
+        if find_invalid_reason(initial_center, final_center, radius, path_type):
+            continue
+
+        geometry = compute_geometry_from_centers(
+            path_type,
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+            initial_center,
+            final_center,
+        )
+        _, initial_arc_angle, straight_length, middle_arc_angle, final_arc_angle = (
+            geometry
+        )
+        length = (
+            radius * (initial_arc_angle + middle_arc_angle + final_arc_angle)
+            + straight_length
+        )
+        if length < best_length:
+            best = (path_type, geometry)
+            best_length = length
+
+    return best
+
+
+def find_shortest_path_type(
+    radius: float,
+    initial_position: Vector,
+    initial_tangent_unit: Vector,
+    final_position: Vector,
+    final_tangent_unit: Vector,
+) -> PathType | None:
+    """
+    Find the type of the shortest Dubins path between two poses.
+
+    Args:
+        radius: Radius of the circles.
+        initial_position: Initial position as a pair of floats.
+        initial_tangent_unit: Initial tangent vector as a pair of floats.
+        final_position: Final position as a pair of floats.
+        final_tangent_unit: Final tangent vector as a pair of floats.
+
+    Returns:
+        The type of the shortest path, or None if no path type is feasible.
+    """
+    shortest = find_shortest_geometry(
+        radius,
+        as_vector(initial_position),
+        normalize_vector(as_vector(initial_tangent_unit)),
+        as_vector(final_position),
+        normalize_vector(as_vector(final_tangent_unit)),
+    )
+    return None if shortest is None else shortest[0]
@@ -0,0 +1,255 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Compact binary serialization of large sets of 2D Dubins paths.
+
+Paths are stored as fixed-width records of their path type, radius and poses,
+optionally followed by their solved geometry: circle centers, tangent
+positions, arc angles and straight length. Records are aligned numpy
+structured arrays, saved as .npy files or as raw bytes after a short header,
+so loading them is a memory map or a np.frombuffer call, without parsing.
+
+Records holding the geometry are loaded without any copy, the fields of the
+DubinsPathBatch being views of the record fields. Records holding the poses
+only are about half the size, and are solved again when their batch is first
+needed, one vectorized call per path type. In both cases the
+DubinsPath objects are only created when the records are indexed one by one.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .path_type import PathType
+from .dubins2 import DubinsPath, try_dubins_path
+from .batch2 import DubinsPathBatch, compute_dubins_paths
+
+_vector = (np.float64, (2,))
+
+pose_record_dtype = np.dtype(
+    [
+        ("radius", np.float64),
+        ("initial_position", *_vector),
+        ("initial_tangent_unit", *_vector),
+        ("final_position", *_vector),
+        ("final_tangent_unit", *_vector),
+        ("path_type", np.int8),
+    ],
+    align=True,
+)
+
+path_record_dtype = np.dtype(
+    [
+        ("radius", np.float64),
+        ("initial_position", *_vector),
+        ("initial_tangent_unit", *_vector),
+        ("final_position", *_vector),
+        ("final_tangent_unit", *_vector),
+        ("initial_center_position", *_vector),
+        ("final_center_position", *_vector),
+        ("middle_center_position", *_vector),
+        ("initial_tangent_position", *_vector),
+        ("final_tangent_position", *_vector),
+        ("initial_arc_angle", np.float64),
+        ("straight_length", np.float64),
+        ("middle_arc_angle", np.float64),
+        ("final_arc_angle", np.float64),
+        ("path_type", np.int8),
+    ],
+    align=True,
+)
+
+# Magic bytes and format version, followed by one byte flagging the geometry
+_magic = b"DUBINS\x01"
+_header_size = len(_magic) + 1
+
+# Packed position rows of DubinsPath, in the order of its row indices
+_position_fields = DubinsPathBatch.fields[2:11]
+
+
+def has_geometry(records: np.ndarray) -> bool:
+    """Check whether records hold the solved geometry or the poses only."""
+    return records.dtype.names == path_record_dtype.names
+
+
+def batch_to_records(batch: DubinsPathBatch, geometry: bool = True) -> np.ndarray:
+    """
+    Pack a batch of paths into fixed-width records.
+
+    Args:
+        batch: Batch of Dubins paths of any shape, flattened in C order.
+        geometry: Whether to store the solved geometry, for zero-copy loads,
+            or the poses only, for records about half the size.
+
+    Returns:
+        The records as a (N,) structured array of path_record_dtype, or of
+        pose_record_dtype without geometry.
+    """
+    dtype = path_record_dtype if geometry else pose_record_dtype
+    records = np.empty(int(np.prod(batch.shape)), dtype=dtype)
+    for name in dtype.names:
+        records[name] = np.reshape(getattr(batch, name), records[name].shape)
+    return records
+
+
+def records_to_batch(records: np.ndarray) -> DubinsPathBatch:
+    """
+    Unpack records into a batch of paths.
+
+    Args:
+        records: Records of path_record_dtype, whose fields are viewed without
+            any copy, or of pose_record_dtype, which are solved again.
+
+    Returns:
+        The batch of Dubins paths, of shape (N,).
+    """
+    if not has_geometry(records):
+        records = _solve_records(records)
+    return DubinsPathBatch(*(records[name] for name in DubinsPathBatch.fields))
+
+
+def _solve_records(records: np.ndarray) -> np.ndarray:
+    """Solve the geometry of pose records, per path type."""
+    solved = np.empty(len(records), dtype=path_record_dtype)
+    for name in pose_record_dtype.names:
+        solved[name] = records[name]
+
+    # Rows sharing a path type are solved at once, each with its own radius
+    path_types = records["path_type"]
+    for path_type in np.unique(path_types):
+        rows = path_types == path_type
+        with np.errstate(invalid="ignore"):
+            batch = compute_dubins_paths(
+                PathType(path_type),
+                records["radius"][rows],
+                records["initial_position"][rows],
+                records["initial_tangent_unit"][rows],
+                records["final_position"][rows],
+                records["final_tangent_unit"][rows],
+            )
+        for name in path_record_dtype.names:
+            solved[name][rows] = getattr(batch, name)
+    return solved
+
+
+class DubinsPathRecords:
+    """
+    Sequence of Dubins paths backed by fixed-width records.
+
+    Indexing with an integer materializes a single DubinsPath, indexing with
+    a slice or an index array gives the records of a subset, and the batch
+    property gives the whole set as a DubinsPathBatch.
+    """
+
+    def __init__(self, records: np.ndarray):
+        """
+        Wrap records, e.g. a memory map, without copying them.
+
+        Args:
+            records: Records of path_record_dtype or pose_record_dtype.
+        """
+        self.records = records
+        self._batch = None
+
+    def __repr__(self) -> str:
+        kind = "paths" if has_geometry(self.records) else "poses"
+        return f"DubinsPathRecords: size={len(self)}, records={kind}"
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index) -> DubinsPath | DubinsPathRecords:
+        if isinstance(index, (int, np.integer)):
+            return _record_to_path(self.records[index])
+        return DubinsPathRecords(self.records[index])
+
+    @property
+    def batch(self) -> DubinsPathBatch:
+        """Get the paths as a batch, solved on first access for pose records."""
+        if self._batch is None:
+            self._batch = records_to_batch(self.records)
+        return self._batch
+
+
+def _record_to_path(record: np.void) -> DubinsPath:
+    """Create the DubinsPath of a single record."""
+    path_type = PathType(int(record["path_type"]))
+    radius = float(record["radius"])
+    if not has_geometry(record):
+        # Infeasible stored rows give invalid paths, without raising nor warning
+        return try_dubins_path(
+            path_type,
+            radius,
+            record["initial_position"],
+            record["initial_tangent_unit"],
+            record["final_position"],
+            record["final_tangent_unit"],
+        )
+    return DubinsPath.from_geometry(
+        path_type,
+        radius,
+        np.array([record[name] for name in _position_fields]),
+        record["initial_arc_angle"],
+        record["straight_length"],
+        record["middle_arc_angle"],
+        record["final_arc_angle"],
+    )
+
+
+def save_paths(file_path: str, batch: DubinsPathBatch, geometry: bool = True) -> None:
+    """
+    Save a batch of paths as a .npy file of records.
+
+    Args:
+        file_path: Path of the .npy file.
+        batch: Batch of Dubins paths of any shape, flattened in C order.
+        geometry: Whether to store the solved geometry, see batch_to_records.
+    """
+    np.save(file_path, batch_to_records(batch, geometry))
+
+
+def load_paths(file_path: str, mmap: bool = True) -> DubinsPathRecords:
+    """
+    Load paths saved with save_paths.
+
+    Args:
+        file_path: Path of the .npy file.
+        mmap: Whether to memory map the file read-only instead of reading it.
+
+    Returns:
+        The paths, backed by the loaded records.
+    """
+    return DubinsPathRecords(np.load(file_path, mmap_mode="r" if mmap else None))
+
+
+def paths_to_bytes(batch: DubinsPathBatch, geometry: bool = True) -> bytes:
+    """
+    Serialize a batch of paths, e.g. to send it to another process.
+
+    Args:
+        batch: Batch of Dubins paths of any shape, flattened in C order.
+        geometry: Whether to store the solved geometry, see batch_to_records.
+
+    Returns:
+        A header followed by the raw records, in native byte order.
+    """
+    return _magic + bytes((geometry,)) + batch_to_records(batch, geometry).tobytes()
+
+
+def paths_from_bytes(buffer: bytes | memoryview) -> DubinsPathRecords:
+    """
+    Deserialize paths serialized with paths_to_bytes, without copying them.
+
+    Args:
+        buffer: Buffer holding the serialized paths, the records being
+            read-only views of it.
+
+    Returns:
+        The paths, backed by the buffer.
+    """
+    buffer = memoryview(buffer)
+    if bytes(buffer[: len(_magic)]) != _magic or len(buffer) < _header_size:
+        raise ValueError("Buffer does not hold serialized Dubins paths")
+    dtype = path_record_dtype if buffer[len(_magic)] else pose_record_dtype
+    return DubinsPathRecords(np.frombuffer(buffer, dtype=dtype, offset=_header_size))
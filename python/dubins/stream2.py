@@ -0,0 +1,215 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Streaming shortest Dubins lengths of pose pair files of any size.
+
+Pose pairs are rows of 6 columns: x1, y1, theta1, x2, y2, theta2, headings
+being in radians. They are read from a .npy file, which is memory mapped, or
+from a CSV file, read line by line, by chunks of a fixed number of rows. Each
+chunk is solved with one vectorized call and its results are written before
+the next chunk is read, so the peak memory only depends on the chunk size.
+
+The results are rows of the PathType value of the shortest path, -1 if none
+is feasible, and its length, written as a structured .npy file of
+parallel2.result_dtype records or as a CSV file.
+
+Usage, from the python directory:
+    python -m dubins.stream2 poses.csv results.npy --radius 2.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import os
+import time
+from typing import Iterator, TextIO
+
+import numpy as np
+
+from .batch2 import shortest_dubins_lengths
+from .parallel2 import result_dtype
+
+logger = logging.getLogger("dubins")
+
+pose_pair_columns = 6
+default_chunk_size = 1 << 16
+
+
+def _is_csv(file_path: str) -> bool:
+    """Check whether a file is a CSV file rather than a .npy file."""
+    return os.path.splitext(file_path)[1].lower() != ".npy"
+
+
+def _iterate_csv_lines(file: TextIO) -> Iterator[str]:
+    """Iterate over the non-empty lines of a CSV file, skipping its header."""
+    lines = (line for line in file if line.strip())
+    first_line = next(lines, None)
+    if first_line is None:
+        return
+    try:
+        [float(value) for value in first_line.split(",")]
+    except ValueError:
+        pass
+    else:
+        yield first_line
+    yield from lines
+
+
+def count_pose_pairs(file_path: str) -> int:
+    """
+    Count the pose pairs of a file without loading them.
+
+    Args:
+        file_path: Path of a .npy or CSV pose pairs file.
+
+    Returns:
+        The number of pose pairs.
+    """
+    if not _is_csv(file_path):
+        return len(np.load(file_path, mmap_mode="r"))
+    with open(file_path) as file:
+        return sum(1 for _ in _iterate_csv_lines(file))
+
+
+def iterate_pose_pair_chunks(
+    file_path: str, chunk_size: int = default_chunk_size
+) -> Iterator[np.ndarray]:
+    """
+    Read a pose pairs file by chunks.
+
+    Args:
+        file_path: Path of a .npy file of shape (N, 6), or of a CSV file of 6
+            columns with an optional header line.
+        chunk_size: Maximum number of pose pairs per chunk.
+
+    Yields:
+        The pose pairs of each chunk as a (n, 6) array, with n <= chunk_size.
+    """
+    if not _is_csv(file_path):
+        poses = np.load(file_path, mmap_mode="r")
+        if poses.ndim != 2 or poses.shape[1] != pose_pair_columns:
+            raise ValueError(f"Invalid pose pairs shape: {poses.shape}")
+        for start in range(0, len(poses), chunk_size):
+            yield np.asarray(poses[start : start + chunk_size], dtype=float)
+        return
+
+    with open(file_path) as file:
+        lines = _iterate_csv_lines(file)
+        while chunk_lines := list(itertools.islice(lines, chunk_size)):
+            yield np.loadtxt(
+                chunk_lines, delimiter=",", ndmin=2, usecols=range(pose_pair_columns)
+            )
+
+
+def solve_pose_pair_chunks(
+    chunks: Iterator[np.ndarray], radius: float
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Solve the shortest Dubins paths of chunks of pose pairs.
+
+    Args:
+        chunks: Pose pairs chunks as (n, 6) arrays.
+        radius: Radius of the circles.
+
+    Yields:
+        The int8 PathType values and the lengths of each chunk, see
+        shortest_dubins_lengths.
+    """
+    for chunk in chunks:
+        initial_heading = chunk[:, 2]
+        final_heading = chunk[:, 5]
+        yield shortest_dubins_lengths(
+            radius,
+            chunk[:, 0:2],
+            np.stack((np.cos(initial_heading), np.sin(initial_heading)), axis=-1),
+            chunk[:, 3:5],
+            np.stack((np.cos(final_heading), np.sin(final_heading)), axis=-1),
+        )
+
+
+def stream_shortest_lengths(
+    input_path: str,
+    output_path: str,
+    radius: float,
+    chunk_size: int = default_chunk_size,
+) -> dict[str, float]:
+    """
+    Solve the shortest Dubins lengths of a pose pairs file into a results file.
+
+    A .npy output is preallocated as a memory map, which needs the number of
+    pose pairs, counted with an extra reading pass for a CSV input. A CSV
+    output is appended chunk by chunk.
+
+    Args:
+        input_path: Path of a .npy or CSV pose pairs file.
+        output_path: Path of the .npy or CSV results file.
+        radius: Radius of the circles.
+        chunk_size: Maximum number of pose pairs held in memory at once.
+
+    Returns:
+        The number of pose pairs, the elapsed seconds and the throughput in
+        pose pairs per second.
+    """
+    start_time = time.perf_counter()
+    results = solve_pose_pair_chunks(
+        iterate_pose_pair_chunks(input_path, chunk_size), radius
+    )
+
+    size = 0
+    if _is_csv(output_path):
+        with open(output_path, "w") as file:
+            file.write("path_type,length\n")
+            for path_types, lengths in results:
+                np.savetxt(
+                    file,
+                    np.column_stack((path_types, lengths)),
+                    fmt=("%d", "%.17g"),
+                    delimiter=",",
+                )
+                size += len(lengths)
+    else:
+        output = np.lib.format.open_memmap(
+            output_path,
+            mode="w+",
+            dtype=result_dtype,
+            shape=(count_pose_pairs(input_path),),
+        )
+        for path_types, lengths in results:
+            output["path_type"][size : size + len(lengths)] = path_types
+            output["length"][size : size + len(lengths)] = lengths
+            size += len(lengths)
+        output.flush()
+        del output
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        "pairs": size,
+        "seconds": elapsed,
+        "pairs_per_second": size / elapsed if elapsed > 0.0 else np.inf,
+    }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(
+        description="Solve the shortest Dubins lengths of a pose pairs file."
+    )
+    parser.add_argument("input", help="Pose pairs .npy or CSV file")
+    parser.add_argument("output", help="Results .npy or CSV file")
+    parser.add_argument("--radius", type=float, default=1.0)
+    parser.add_argument("--chunk-size", type=int, default=default_chunk_size)
+    args = parser.parse_args()
+
+    stats = stream_shortest_lengths(
+        args.input, args.output, args.radius, args.chunk_size
+    )
+    logger.info(
+        "%d pose pairs solved in %.2f s, %.3g pairs per second",
+        stats["pairs"],
+        stats["seconds"],
+        stats["pairs_per_second"],
+    )
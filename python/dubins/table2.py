@@ -0,0 +1,377 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Precomputed lookup table of shortest 2D Dubins lengths.
+
+The shortest lengths and path types are solved once on a regular grid of
+canonical queries (dx, dy, theta), see canonical2, and queries are then
+answered by trilinear interpolation of the lengths, and nearest neighbor
+lookup of the path types, which only costs a few array gathers per query.
+
+The shortest Dubins length is not a smooth function of the query: it jumps
+where the optimal path switches to a path with an extra loop, which mostly
+happens when the final position is within a few radii of the initial one.
+The interpolation error is therefore measured when the table is built, at the
+center of every grid cell, where trilinear interpolation errors peak, and is
+reported separately for the cells closer than near_distance radii to the
+origin and for the others. These bounds are estimates, not guarantees, and the
+table is meant for approximate lengths such as search heuristics.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+
+from .batch2 import shortest_dubins_lengths
+from .canonical2 import canonical_poses, canonical_queries, canonical_query
+
+record_dtype = np.dtype([("length", np.float32), ("path_type", np.int8)])
+
+# Canonical distance, in radii, under which lengths may be discontinuous
+near_distance = 4.0
+
+
+class DubinsLengthTable:
+    """
+    Lookup table of the shortest Dubins lengths on a canonical query grid.
+
+    The grid spans [-extent, extent] radii along dx and dy, with an even
+    number of nodes so that the degenerate query (0, 0, 0) is not a node, and
+    [0, 2*pi) along theta, which wraps around. Queries out of the dx and dy
+    span are solved exactly.
+    """
+
+    def __init__(
+        self,
+        records: np.ndarray,
+        extent: float,
+        near_error: float = np.nan,
+        far_error: float = np.nan,
+    ):
+        """
+        Wrap a grid of records into a table.
+
+        Args:
+            records: (nx, ny, ntheta) array of record_dtype, possibly memory
+                mapped.
+            extent: Half width of the dx and dy span, in radii.
+            near_error: Estimated maximum lookup error, in radii, close to the
+                origin.
+            far_error: Estimated maximum lookup error, in radii, elsewhere.
+        """
+        self.records = records
+        self.extent = float(extent)
+        self.near_error = float(near_error)
+        self.far_error = float(far_error)
+
+        self._lengths = records["length"]
+        self._path_types = records["path_type"]
+        # Flat view of the lengths, for single index gathers
+        self._flat_lengths = self._lengths.reshape(-1)
+        nx, ny, ntheta = records.shape
+        self._steps = np.array(
+            (2 * self.extent / (nx - 1), 2 * self.extent / (ny - 1), 2 * np.pi / ntheta)
+        )
+        self._scalar_steps = tuple(self._steps.tolist())
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Get the number of grid nodes along dx, dy and theta."""
+        return self.records.shape
+
+    @staticmethod
+    def build(
+        extent: float = 8.0,
+        shape: tuple[int, int, int] = (160, 160, 72),
+    ) -> DubinsLengthTable:
+        """
+        Solve the shortest Dubins paths of every grid node.
+
+        The grid is solved by theta slices, so that the peak memory is the one
+        of a single slice.
+
+        Args:
+            extent: Half width of the dx and dy span, in radii.
+            shape: Number of grid nodes along dx, dy and theta. The numbers of
+                dx and dy nodes should be even.
+
+        Returns:
+            The new table, with its estimated lookup errors.
+        """
+        nx, ny, ntheta = shape
+        dx = np.linspace(-extent, extent, nx)
+        dy = np.linspace(-extent, extent, ny)
+        theta = np.arange(ntheta) * (2 * np.pi / ntheta)
+
+        records = np.empty(shape, dtype=record_dtype)
+        for k in range(ntheta):
+            path_types, lengths = _solve_canonical(
+                *np.meshgrid(dx, dy, theta[k], indexing="ij")
+            )
+            records["path_type"][:, :, k] = path_types[..., 0]
+            records["length"][:, :, k] = lengths[..., 0]
+
+        table = DubinsLengthTable(records, extent)
+        table.near_error, table.far_error = table._measure_errors()
+        return table
+
+    def _measure_errors(self) -> tuple[float, float]:
+        """
+        Measure the maximum lookup error at the center of every grid cell.
+
+        Returns:
+            The maximum errors, in radii, of the cells closer than
+            near_distance to the origin, and of the other ones.
+        """
+        half_steps = self._steps / 2
+        dx = np.linspace(-self.extent, self.extent, self.shape[0])[:-1] + half_steps[0]
+        dy = np.linspace(-self.extent, self.extent, self.shape[1])[:-1] + half_steps[1]
+        theta = np.arange(self.shape[2]) * self._steps[2] + half_steps[2]
+        grid_dx, grid_dy = np.meshgrid(dx, dy, indexing="ij")
+        is_near = np.hypot(grid_dx, grid_dy) < near_distance
+
+        near_error = 0.0
+        far_error = 0.0
+        for value in theta:
+            query = np.stack(np.broadcast_arrays(grid_dx, grid_dy, value), axis=-1)
+            _, lengths = _solve_canonical(*np.moveaxis(query, -1, 0))
+            errors = np.abs(self._interpolate(self._grid_positions(query)) - lengths)
+            near_error = max(near_error, np.nanmax(errors[is_near], initial=0.0))
+            far_error = max(far_error, np.nanmax(errors[~is_near], initial=0.0))
+        return float(near_error), float(far_error)
+
+    def _grid_positions(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Convert canonical queries to fractional grid indices.
+
+        The dx and dy indices are clamped to the grid, the queries out of the
+        span being solved exactly by the callers.
+
+        Args:
+            queries: Canonical queries as a S+(3,) array.
+
+        Returns:
+            The fractional indices along dx, dy and theta, as a S+(3,) array.
+        """
+        positions = (queries - (-self.extent, -self.extent, 0.0)) / self._steps
+        np.clip(positions[..., 0], 0, self.shape[0] - 1, out=positions[..., 0])
+        np.clip(positions[..., 1], 0, self.shape[1] - 1, out=positions[..., 1])
+        return positions
+
+    def _interpolate(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the lengths at fractional grid indices.
+
+        Args:
+            positions: Fractional grid indices as a S+(3,) array.
+
+        Returns:
+            The interpolated lengths, in radii, as a S array.
+        """
+        nx, ny, ntheta = self.shape
+        i = np.minimum(positions[..., 0].astype(np.intp), nx - 2)
+        j = np.minimum(positions[..., 1].astype(np.intp), ny - 2)
+        k = np.floor(positions[..., 2])
+        wx = positions[..., 0] - i
+        wy = positions[..., 1] - j
+        wt = positions[..., 2] - k
+        k0 = k.astype(np.intp) % ntheta
+        k1 = (k0 + 1) % ntheta
+
+        # Gather the corners of the cell from flat indices, and weight each one
+        # by the opposite sub-volume
+        row = (i * ny + j) * ntheta
+        interpolated = np.zeros(positions.shape[:-1])
+        for offset_i, weight_i in ((0, 1 - wx), (ny * ntheta, wx)):
+            for offset_j, weight_j in ((0, 1 - wy), (ntheta, wy)):
+                weight = weight_i * weight_j
+                corner = row + (offset_i + offset_j)
+                interpolated += weight * (
+                    (1 - wt) * self._flat_lengths[corner + k0]
+                    + wt * self._flat_lengths[corner + k1]
+                )
+        return interpolated
+
+    def lookup_canonical(self, queries: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Look the shortest lengths of canonical queries up.
+
+        Args:
+            queries: Canonical queries (dx, dy, theta) as a S+(3,) array.
+
+        Returns:
+            The int8 PathType values of the nearest grid nodes, and the
+            interpolated lengths in radii, as S arrays. Queries out of the dx
+            and dy span are solved exactly.
+        """
+        queries = np.asarray(queries, dtype=float)
+        positions = self._grid_positions(queries)
+
+        nearest = np.rint(positions).astype(np.intp)
+        path_types = np.array(
+            self._path_types[
+                nearest[..., 0], nearest[..., 1], nearest[..., 2] % self.shape[2]
+            ]
+        )
+        lengths = self._interpolate(positions)
+
+        is_outside = np.any(np.abs(queries[..., :2]) > self.extent, axis=-1)
+        if np.any(is_outside):
+            path_types[is_outside], lengths[is_outside] = _solve_canonical(
+                *np.moveaxis(queries[is_outside], -1, 0)
+            )
+
+        return path_types, lengths
+
+    def lookup(
+        self,
+        radius: float | np.ndarray,
+        initial_position: np.ndarray,
+        initial_tangent_unit: np.ndarray,
+        final_position: np.ndarray,
+        final_tangent_unit: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Look the approximate shortest Dubins lengths of a batch of queries up.
+
+        Args:
+            radius: Radius of the circles, a scalar or an array broadcastable to
+                the batch shape S.
+            initial_position: Initial positions as a S+(2,) numpy array.
+            initial_tangent_unit: Initial tangent vectors as a S+(2,) array.
+            final_position: Final positions as a S+(2,) numpy array.
+            final_tangent_unit: Final tangent vectors as a S+(2,) numpy array.
+
+        Returns:
+            The int8 PathType values and the approximate lengths, as S arrays,
+            see shortest_dubins_lengths. The length error is about radius
+            times the near_error or far_error of the table.
+        """
+        queries = canonical_queries(
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+        path_types, lengths = self.lookup_canonical(queries)
+        return path_types, lengths * radius
+
+    def lookup_length(
+        self,
+        radius: float,
+        initial_position,
+        initial_tangent_unit,
+        final_position,
+        final_tangent_unit,
+    ) -> float:
+        """
+        Look the approximate shortest Dubins length of a single query up.
+
+        This is the same interpolation as lookup, written with plain floats,
+        since the per-call overhead of NumPy would dominate a single query.
+
+        Args:
+            radius: Radius of the circles.
+            initial_position: Initial position as a 2D sequence.
+            initial_tangent_unit: Initial tangent vector as a 2D sequence.
+            final_position: Final position as a 2D sequence.
+            final_tangent_unit: Final tangent vector as a 2D sequence.
+
+        Returns:
+            The approximate length, NaN if no path type is feasible.
+        """
+        dx, dy, theta = canonical_query(
+            radius,
+            initial_position,
+            initial_tangent_unit,
+            final_position,
+            final_tangent_unit,
+        )
+        if abs(dx) > self.extent or abs(dy) > self.extent:
+            _, length = _solve_canonical(dx, dy, theta)
+            return float(length) * radius
+
+        nx, ny, ntheta = self.shape
+        step_x, step_y, step_theta = self._scalar_steps
+        x = (dx + self.extent) / step_x
+        y = (dy + self.extent) / step_y
+        t = theta / step_theta
+        i = min(int(x), nx - 2)
+        j = min(int(y), ny - 2)
+        k = int(t)
+        wx = x - i
+        wy = y - j
+        wt = t - k
+        k0 = k % ntheta
+        k1 = (k0 + 1) % ntheta
+
+        # Read the corners as Python floats, NumPy scalar arithmetic is slower
+        lengths = self._flat_lengths
+        row = (i * ny + j) * ntheta
+        corners = [
+            (
+                float(lengths[row + offset + k0]),
+                float(lengths[row + offset + k1]),
+            )
+            for offset in (0, ntheta, ny * ntheta, ny * ntheta + ntheta)
+        ]
+        (a0, a1), (b0, b1), (c0, c1), (d0, d1) = corners
+        low = (1 - wx) * ((1 - wy) * a0 + wy * b0) + wx * ((1 - wy) * c0 + wy * d0)
+        high = (1 - wx) * ((1 - wy) * a1 + wy * b1) + wx * ((1 - wy) * c1 + wy * d1)
+        return ((1 - wt) * low + wt * high) * radius
+
+    def save(self, file_path: str) -> None:
+        """
+        Save the table to a .npy file and its grid metadata to a .json file.
+
+        Args:
+            file_path: Path of the .npy file, the .json file is saved next to
+                it with the same name.
+        """
+        np.save(file_path, self.records)
+        metadata = {
+            "extent": self.extent,
+            "near_error": self.near_error,
+            "far_error": self.far_error,
+        }
+        with open(_metadata_path(file_path), "w") as file:
+            json.dump(metadata, file, indent=2)
+
+    @staticmethod
+    def load(file_path: str, mmap: bool = True) -> DubinsLengthTable:
+        """
+        Load a table saved with save.
+
+        With memory mapping, loading only reads the file header, and the
+        processes mapping the same file share its pages in the OS page cache.
+
+        Args:
+            file_path: Path of the .npy file.
+            mmap: Whether to memory map the file read-only instead of reading
+                it.
+
+        Returns:
+            The loaded table.
+        """
+        records = np.load(file_path, mmap_mode="r" if mmap else None)
+        with open(_metadata_path(file_path)) as file:
+            metadata = json.load(file)
+        return DubinsLengthTable(records, **metadata)
+
+
+def _metadata_path(file_path: str) -> str:
+    """Get the path of the .json metadata of a .npy table file."""
+    return os.path.splitext(file_path)[0] + ".json"
+
+
+def _solve_canonical(
+    dx: np.ndarray, dy: np.ndarray, theta: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Solve the shortest paths of canonical queries exactly, in radii."""
+    with np.errstate(invalid="ignore"):
+        return shortest_dubins_lengths(1.0, *canonical_poses(dx, dy, theta))
@@ -0,0 +1,84 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""The batch solver agrees with the scalar DubinsPath for every path type."""
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import (
+    DubinsPathBatch,
+    pose_at,
+    shortest_dubins_batch,
+    shortest_dubins_lengths,
+    solve_dubins_batch,
+)
+from dubins.dubins2 import DubinsPath, shortest_dubins_path
+from dubins.path_type import PathType
+
+RADIUS = 1.5
+TOLERANCE = 1e-9
+
+
+def random_poses(size: int):
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, (2, size))
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    # Close poses, so that CCC paths are often feasible and sometimes shortest
+    position = rng.uniform(-3.0, 3.0, (2, size, 2))
+    return position[0], tangent[0], position[1], tangent[1]
+
+
+@pytest.fixture(scope="module")
+def poses():
+    return random_poses(200)
+
+
+@pytest.fixture(scope="module")
+def batch(poses):
+    return solve_dubins_batch(RADIUS, *poses)
+
+
+@pytest.mark.parametrize("backend", ["math", "numpy"])
+@pytest.mark.parametrize("path_type", list(PathType))
+def test_matches_scalar_paths(poses, batch, path_type, backend):
+    rows = batch[path_type]
+    with np.errstate(invalid="ignore"):
+        paths = [
+            DubinsPath(path_type, RADIUS, *pose, backend=backend)
+            for pose in zip(*poses)
+        ]
+    expected = DubinsPathBatch.from_paths(paths)
+    assert np.array_equal(rows.is_valid, expected.is_valid)
+    # Invalid rows and the missing middle arcs of CSC paths are NaN in both
+    for name in DubinsPathBatch.fields:
+        assert np.allclose(
+            getattr(rows, name),
+            getattr(expected, name),
+            atol=TOLERANCE,
+            equal_nan=True,
+        ), name
+
+
+@pytest.mark.parametrize("path_type", list(PathType))
+def test_paths_end_at_final_poses(poses, batch, path_type):
+    rows = batch[path_type]
+    valid = rows.is_valid
+    end = pose_at(rows, rows.total_length[:, np.newaxis])[:, 0]
+    heading = np.arctan2(poses[3][:, 1], poses[3][:, 0])
+    assert np.allclose(end[valid, :2], poses[2][valid], atol=TOLERANCE)
+    # Compare headings on the unit circle to ignore the wrapping
+    assert np.allclose(np.cos(end[valid, 2]), np.cos(heading[valid]), atol=1e-7)
+    assert np.allclose(np.sin(end[valid, 2]), np.sin(heading[valid]), atol=1e-7)
+
+
+def test_shortest_paths(poses, batch):
+    shortest = shortest_dubins_batch(RADIUS, *poses)
+    path_type, lengths = shortest_dubins_lengths(RADIUS, *poses)
+    assert np.allclose(shortest.total_length, np.nanmin(batch.total_length, axis=0))
+    assert np.allclose(lengths, shortest.total_length)
+    assert np.array_equal(path_type, shortest.path_type)
+    for index, pose in enumerate(zip(*poses)):
+        path = shortest_dubins_path(RADIUS, *pose, backend="math")
+        assert path.total_length == pytest.approx(shortest.total_length[index])
@@ -0,0 +1,99 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Cache counters, evictions, and hits of rigidly transformed queries."""
+
+import numpy as np
+import pytest
+
+from dubins.cache2 import CacheInfo, DubinsPathCache
+from dubins.dubins2 import DubinsPath, shortest_dubins_path
+from dubins.path_type import PathType
+
+RADIUS = 1.0
+TOLERANCE = 1e-9
+
+
+def random_queries(size: int):
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, (2, size))
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    position = rng.uniform(-5.0, 5.0, (2, size, 2))
+    return list(zip(position[0], tangent[0], position[1], tangent[1]))
+
+
+def rotation(angle: float) -> np.ndarray:
+    return np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+
+
+def transform(query, angle: float, offset, scale: float = 1.0):
+    p, t, q, u = query
+    matrix = rotation(angle)
+    return (
+        scale * matrix @ p + offset,
+        matrix @ t,
+        scale * matrix @ q + offset,
+        matrix @ u,
+    )
+
+
+def test_hits_and_misses():
+    cache = DubinsPathCache()
+    queries = random_queries(10)
+    for query in queries:
+        cache.shortest_path(RADIUS, *query)
+    assert cache.cache_info() == CacheInfo(0, 10, 0, 10, 4096)
+
+    for query in queries:
+        path = cache.shortest_path(RADIUS, *query)
+        expected = shortest_dubins_path(RADIUS, *query)
+        assert path.total_length == pytest.approx(expected.total_length, abs=TOLERANCE)
+    # Path types and shortest paths are distinct entries
+    cache.path(PathType.LSL, RADIUS, *queries[0])
+    assert cache.cache_info() == CacheInfo(10, 11, 0, 11, 4096)
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(0, 0, 0, 0, 4096)
+
+
+def test_least_recently_used_eviction():
+    cache = DubinsPathCache(maxsize=3)
+    queries = random_queries(4)
+    for query in queries[:3]:
+        cache.path(PathType.RSR, RADIUS, *query)
+    # Use the oldest entry, so that the second one is evicted next
+    cache.path(PathType.RSR, RADIUS, *queries[0])
+    cache.path(PathType.RSR, RADIUS, *queries[3])
+    assert cache.cache_info() == CacheInfo(1, 4, 1, 3, 3)
+
+    cache.path(PathType.RSR, RADIUS, *queries[0])
+    cache.path(PathType.RSR, RADIUS, *queries[1])
+    assert cache.cache_info() == CacheInfo(2, 5, 2, 3, 3)
+
+
+@pytest.mark.parametrize("path_type", [None, *PathType])
+def test_rigid_transforms_hit(path_type):
+    cache = DubinsPathCache(position_resolution=1e-6, heading_resolution=1e-6)
+    rng = np.random.default_rng(1)
+    for query in random_queries(10):
+        cache.clear()
+        for index in range(5):
+            angle = rng.uniform(0.0, 2 * np.pi)
+            offset = rng.uniform(-100.0, 100.0, 2)
+            scale = 1.0 if index == 0 else rng.uniform(0.5, 2.0)
+            moved = transform(query, angle, offset, scale)
+            if path_type is None:
+                path = cache.shortest_path(scale * RADIUS, *moved)
+                expected = shortest_dubins_path(scale * RADIUS, *moved)
+            else:
+                # Infeasible path types warn on the numpy backend
+                with np.errstate(invalid="ignore"):
+                    path = cache.path(path_type, scale * RADIUS, *moved)
+                    expected = DubinsPath(path_type, scale * RADIUS, *moved)
+            assert path.is_valid == expected.is_valid
+            if expected.is_valid:
+                assert path.total_length == pytest.approx(expected.total_length)
+                assert np.allclose(path.initial_position, moved[0])
+                assert np.allclose(path.final_position, moved[2])
+        assert cache.cache_info()[:2] == (4, 1)
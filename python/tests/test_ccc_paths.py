@@ -0,0 +1,84 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""RLR and LRL lengths match the classic closed form of Shkel and Lumelsky."""
+
+import math
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import solve_dubins_batch
+from dubins.dubins2 import DubinsPath
+from dubins.path_type import PathType
+
+RADIUS = 1.5
+TOLERANCE = 1e-9
+
+
+def reference_length(
+    path_type, radius, position, tangent, final_position, final_tangent
+):
+    """Length of a CCC path in the normalized frame of the line between poses."""
+    dx, dy = (final_position - position) / radius
+    d = math.hypot(dx, dy)
+    theta = math.atan2(dy, dx)
+    alpha = (math.atan2(tangent[1], tangent[0]) - theta) % (2 * math.pi)
+    beta = (math.atan2(final_tangent[1], final_tangent[0]) - theta) % (2 * math.pi)
+    sa, sb = math.sin(alpha), math.sin(beta)
+    ca, cb = math.cos(alpha), math.cos(beta)
+    if path_type == PathType.RLR:
+        ratio = (6 - d * d + 2 * math.cos(alpha - beta) + 2 * d * (sa - sb)) / 8
+        phi = math.atan2(ca - cb, d - sa + sb)
+    else:
+        ratio = (6 - d * d + 2 * math.cos(alpha - beta) + 2 * d * (sb - sa)) / 8
+        phi = math.atan2(ca - cb, d + sa - sb)
+    if abs(ratio) > 1:
+        return math.nan
+    p = (2 * math.pi - math.acos(ratio)) % (2 * math.pi)
+    if path_type == PathType.RLR:
+        t = (alpha - phi + p / 2) % (2 * math.pi)
+        q = (alpha - beta - t + p) % (2 * math.pi)
+    else:
+        t = (-alpha - phi + p / 2) % (2 * math.pi)
+        q = (beta - alpha - t + p) % (2 * math.pi)
+    return radius * (t + p + q)
+
+
+def random_poses(size: int):
+    rng = np.random.default_rng(1)
+    heading = rng.uniform(0.0, 2 * np.pi, (2, size))
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    # Circles closer than 4 radii for most pairs, so that CCC paths exist
+    position = rng.uniform(-2.0, 2.0, (2, size, 2))
+    return position[0], tangent[0], position[1], tangent[1]
+
+
+@pytest.mark.parametrize("path_type", [PathType.RLR, PathType.LRL])
+def test_lengths_match_reference(path_type):
+    poses = random_poses(500)
+    batch = solve_dubins_batch(RADIUS, *poses, path_types=(path_type,))[0]
+    expected = np.array(
+        [reference_length(path_type, RADIUS, *pose) for pose in zip(*poses)]
+    )
+    assert np.count_nonzero(np.isnan(expected)) < len(expected)
+    assert np.array_equal(np.isnan(batch.total_length), np.isnan(expected))
+    assert np.allclose(batch.total_length, expected, atol=TOLERANCE, equal_nan=True)
+    for backend in ("math", "numpy"):
+        with np.errstate(invalid="ignore"):
+            lengths = [
+                DubinsPath(path_type, RADIUS, *pose, backend=backend).total_length
+                for pose in zip(*poses)
+            ]
+        assert np.allclose(lengths, expected, atol=TOLERANCE, equal_nan=True)
+
+
+@pytest.mark.parametrize("path_type", [PathType.RLR, PathType.LRL])
+def test_distant_circles(path_type):
+    # Same heading, 10 radii apart: the circles can not be joined by a third
+    tangent = np.array([[1.0, 0.0]])
+    batch = solve_dubins_batch(
+        RADIUS, np.zeros((1, 2)), tangent, [[10 * RADIUS, 0.0]], tangent, (path_type,)
+    )
+    assert not batch.is_valid[0, 0]
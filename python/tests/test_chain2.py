@@ -0,0 +1,83 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Planned chains are the shortest ones among the candidate headings."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from dubins.chain2 import candidate_headings, plan_dubins_chain, sample_dubins_chain
+from dubins.dubins2 import shortest_dubins_path
+
+RADIUS = 1.0
+HEADING_COUNT = 6
+
+
+def tangent(heading: float) -> np.ndarray:
+    return np.array([np.cos(heading), np.sin(heading)])
+
+
+def brute_force(positions, headings):
+    """Find the shortest chain length over every combination of headings."""
+    best_length = np.inf
+    for chosen in itertools.product(*(np.unique(row) for row in headings)):
+        length = sum(
+            shortest_dubins_path(
+                RADIUS, p, tangent(a), q, tangent(b), backend="math"
+            ).total_length
+            for p, a, q, b in zip(
+                positions[:-1], chosen[:-1], positions[1:], chosen[1:]
+            )
+        )
+        best_length = min(best_length, length)
+    return best_length
+
+
+@pytest.fixture(scope="module")
+def positions():
+    # Close waypoints, where the headings matter the most
+    return np.random.default_rng(0).uniform(-2.0, 2.0, (4, 2))
+
+
+@pytest.mark.parametrize(
+    "initial_heading, final_heading",
+    [(None, None), (0.3, None), (None, 2.0), (1.0, -1.0)],
+)
+def test_matches_brute_force(positions, initial_heading, final_heading):
+    chain = plan_dubins_chain(
+        RADIUS, positions, HEADING_COUNT, initial_heading, final_heading
+    )
+    headings = candidate_headings(
+        len(positions), HEADING_COUNT, initial_heading, final_heading
+    )
+    assert chain.total_length == pytest.approx(brute_force(positions, headings))
+    assert chain.total_length == pytest.approx(np.sum(chain.lengths))
+    assert np.allclose(chain.paths.total_length, chain.lengths)
+    if initial_heading is not None:
+        assert chain.headings[0] == initial_heading
+    if final_heading is not None:
+        assert chain.headings[-1] == final_heading
+
+
+@pytest.mark.parametrize("max_pairs", [1, 40, 1 << 16])
+def test_chunks(positions, max_pairs):
+    chain = plan_dubins_chain(RADIUS, positions, HEADING_COUNT, max_pairs=max_pairs)
+    expected = plan_dubins_chain(RADIUS, positions, HEADING_COUNT)
+    assert chain.total_length == pytest.approx(expected.total_length)
+
+
+def test_samples_are_continuous(positions):
+    chain = plan_dubins_chain(RADIUS, positions, HEADING_COUNT)
+    samples = sample_dubins_chain(chain, 50)
+    assert samples.shape == (3 * 49 + 1, 3)
+    assert np.allclose(samples[::49, :2], positions)
+    assert np.allclose(np.cos(samples[::49, 2]), np.cos(chain.headings))
+    assert np.allclose(np.sin(samples[::49, 2]), np.sin(chain.headings))
+
+
+def test_invalid_positions():
+    with pytest.raises(ValueError):
+        plan_dubins_chain(RADIUS, np.zeros((1, 2)))
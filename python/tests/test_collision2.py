@@ -0,0 +1,69 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Collision checks of path batches without any obstacle."""
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import shortest_dubins_batch, solve_dubins_batch
+from dubins.collision2 import any_collision, collide_boxes, collide_circles
+from dubins.path_type import PathType
+
+
+@pytest.fixture
+def batch():
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, (2, 20))
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    position = rng.uniform(-5.0, 5.0, (2, 20, 2))
+    return shortest_dubins_batch(1.0, position[0], tangent[0], position[1], tangent[1])
+
+
+def test_no_circles(batch):
+    collisions = collide_circles(batch, np.empty((0, 2)), 1.0)
+    assert collisions.shape == (20, 0)
+    assert collisions.dtype == bool
+
+
+def test_no_boxes(batch):
+    collisions = collide_boxes(batch, np.empty((0, 4)))
+    assert collisions.shape == (20, 0)
+    assert collisions.dtype == bool
+
+
+def test_any_collision_without_obstacles(batch):
+    collisions = any_collision(
+        batch,
+        circle_centers=np.empty((0, 2)),
+        circle_radii=np.empty(0),
+        boxes=np.empty((0, 4)),
+    )
+    assert collisions.shape == (20,)
+    assert not np.any(collisions)
+
+
+def test_invalid_paths_never_collide():
+    # Overlapping circles for LSR, too distant circles for RLR and LRL
+    initial_position = np.zeros((2, 2))
+    final_position = np.array([[0.0, 0.5], [10.0, 0.0]])
+    tangent = np.tile([1.0, 0.0], (2, 1))
+    batch = solve_dubins_batch(
+        1.0,
+        initial_position,
+        tangent,
+        final_position,
+        tangent,
+        path_types=(PathType.LSR, PathType.RLR, PathType.LRL),
+    )
+    assert not batch.is_valid[0, 0] and not np.any(batch.is_valid[1:, 1])
+
+    # The obstacles cover every path, feasible or not
+    box_collisions = collide_boxes(batch, [[-100.0, -100.0, 100.0, 100.0]])
+    circle_collisions = collide_circles(batch, [[0.0, 0.0]], 100.0)
+    assert np.array_equal(box_collisions[..., 0], batch.is_valid)
+    assert np.array_equal(circle_collisions[..., 0], batch.is_valid)
+    assert np.array_equal(
+        any_collision(batch, boxes=[[-100.0, -100.0, 100.0, 100.0]]), batch.is_valid
+    )
@@ -0,0 +1,65 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""A pose reaches itself, or a pose displaced by rounding errors, in zero length."""
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import shortest_dubins_batch, shortest_dubins_lengths
+from dubins.dubins2 import DubinsPath, shortest_dubins_path, try_dubins_path
+from dubins.incremental2 import IncrementalDubinsSolver
+from dubins.matrix2 import dubins_distance_matrix
+from dubins.path_type import PathType
+
+RADIUS = 1.0
+TOLERANCE = 1e-7
+
+
+def random_poses(size: int, displacement: float):
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, size)
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    position = rng.uniform(-5.0, 5.0, (size, 2))
+    final_position = position + displacement * rng.standard_normal((size, 2))
+    return position, tangent, final_position, tangent
+
+
+@pytest.mark.parametrize("displacement", [0.0, 1e-12, 1e-9])
+def test_batch_solvers(displacement):
+    poses = random_poses(1000, displacement)
+    _, lengths = shortest_dubins_lengths(RADIUS, *poses)
+    batch = shortest_dubins_batch(RADIUS, *poses)
+    assert np.all(lengths < TOLERANCE)
+    assert np.all(batch.total_length < TOLERANCE)
+
+
+@pytest.mark.parametrize("displacement", [0.0, 1e-12, 1e-9])
+@pytest.mark.parametrize("backend", ["math", "numpy"])
+def test_scalar_solvers(displacement, backend):
+    for pose in zip(*random_poses(50, displacement)):
+        path = shortest_dubins_path(RADIUS, *pose, backend=backend)
+        solver = IncrementalDubinsSolver(RADIUS, *pose[:2])
+        assert path.total_length < TOLERANCE
+        assert solver.shortest_path(*pose[2:]).total_length < TOLERANCE
+
+
+@pytest.mark.parametrize("backend", ["math", "numpy"])
+@pytest.mark.parametrize("path_type", [PathType.LSR, PathType.RSL])
+def test_belt_paths(path_type, backend):
+    for pose in zip(*random_poses(50, 0.0)):
+        path = DubinsPath(path_type, RADIUS, *pose, backend=backend)
+        assert path.total_length < TOLERANCE
+        assert try_dubins_path(path_type, RADIUS, *pose, backend).is_valid
+
+
+def test_distance_matrix_duplicates():
+    position, tangent, _, _ = random_poses(20, 0.0)
+    # Every pose appears twice, so duplicates are off the diagonal too
+    lengths = dubins_distance_matrix(
+        RADIUS, np.concatenate((position, position)), np.concatenate((tangent, tangent))
+    )
+    assert np.all(np.diagonal(lengths) < TOLERANCE)
+    assert np.all(np.diagonal(lengths, offset=20) < TOLERANCE)
+    assert np.all(np.diagonal(lengths, offset=-20) < TOLERANCE)
@@ -0,0 +1,80 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""The incremental solver agrees with the shortest path solvers."""
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import (
+    DubinsPathBatch,
+    shortest_dubins_batch,
+    shortest_dubins_lengths,
+    solve_dubins_batch,
+)
+from dubins.dubins2 import shortest_dubins_path
+from dubins.incremental2 import IncrementalDubinsSolver
+
+RADIUS = 1.0
+TOLERANCE = 1e-9
+
+
+@pytest.fixture(scope="module")
+def start():
+    return np.array([0.5, -0.25]), np.array([0.6, 0.8])
+
+
+@pytest.fixture(scope="module")
+def goals():
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, 200)
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    # Goals close to the start too, where CCC paths are the shortest
+    position = rng.uniform(-3.0, 3.0, (200, 2))
+    return position, tangent
+
+
+def start_batch(start, size: int):
+    return np.tile(start[0], (size, 1)), np.tile(start[1], (size, 1))
+
+
+@pytest.mark.parametrize("backend", ["math", "numpy"])
+def test_shortest_path(start, goals, backend):
+    solver = IncrementalDubinsSolver(RADIUS, *start)
+    for goal in zip(*goals):
+        path = solver.shortest_path(*goal)
+        expected = shortest_dubins_path(RADIUS, *start, *goal, backend=backend)
+        assert path.path_type == expected.path_type
+        assert path.total_length == pytest.approx(expected.total_length, abs=TOLERANCE)
+        assert np.allclose(
+            path.positions, expected.positions, atol=TOLERANCE, equal_nan=True
+        )
+
+
+def test_batches(start, goals):
+    solver = IncrementalDubinsSolver(RADIUS, *start)
+    poses = (*start_batch(start, len(goals[0])), *goals)
+
+    batch = solver.solve_batch(*goals)
+    expected = solve_dubins_batch(RADIUS, *poses)
+    for name in DubinsPathBatch.fields:
+        assert np.allclose(
+            getattr(batch, name), getattr(expected, name), equal_nan=True
+        ), name
+
+    path_type, lengths = solver.shortest_lengths(*goals)
+    expected_type, expected_lengths = shortest_dubins_lengths(RADIUS, *poses)
+    assert np.array_equal(path_type, expected_type)
+    assert np.allclose(lengths, expected_lengths)
+
+    shortest = solver.shortest_batch(*goals)
+    expected = shortest_dubins_batch(RADIUS, *poses)
+    assert np.array_equal(shortest.path_type, expected.path_type)
+    assert np.allclose(shortest.total_length, expected.total_length)
+    assert np.allclose(shortest.final_tangent_position, expected.final_tangent_position)
+
+
+def test_goal_at_start(start):
+    solver = IncrementalDubinsSolver(RADIUS, *start)
+    assert solver.shortest_path(*start).total_length < 1e-7
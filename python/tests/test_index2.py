@@ -0,0 +1,84 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Index queries return the paths found by a linear scan of the batch."""
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import sample_dubins_paths, solve_dubins_batch
+from dubins.collision2 import (
+    collide_boxes,
+    collide_circles,
+    gather_segments,
+    segment_point_distances,
+)
+from dubins.index2 import DubinsPathIndex
+
+RADIUS = 1.0
+
+
+@pytest.fixture(scope="module", params=[None, 0.5, 5.0])
+def index(request):
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, (2, 100))
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    position = rng.uniform(-20.0, 20.0, (2, 100, 2))
+    # Every path type, so that infeasible CCC paths are stored too
+    batch = solve_dubins_batch(RADIUS, position[0], tangent[0], position[1], tangent[1])
+    return DubinsPathIndex(batch, cell_size=request.param)
+
+
+@pytest.fixture(scope="module")
+def points():
+    return np.random.default_rng(1).uniform(-25.0, 25.0, (50, 2))
+
+
+def test_flattened_batch(index):
+    assert len(index) == 600
+    assert not np.all(index.batch.is_valid)
+
+
+def test_paths_near_point(index, points):
+    for distance in (0.1, 1.0, 4.0):
+        expected = collide_circles(index.batch, points, distance)
+        for point, column in zip(points, expected.T):
+            found = index.paths_near_point(point, distance)
+            assert np.array_equal(found, np.nonzero(column)[0])
+
+
+def test_paths_in_box(index, points):
+    sizes = np.random.default_rng(2).uniform(0.0, 6.0, (len(points), 2))
+    boxes = np.concatenate((points, points + sizes), axis=-1)
+    expected = collide_boxes(index.batch, boxes)
+    for box, column in zip(boxes, expected.T):
+        assert np.array_equal(index.paths_in_box(box), np.nonzero(column)[0])
+
+
+def test_nearest_path(index, points):
+    path_index = np.nonzero(index.batch.is_valid)[0]
+    segments = gather_segments(index.batch, path_index)
+    samples = sample_dubins_paths(index.batch[path_index], 200)[..., :2]
+    # Half the largest sample spacing bounds the error of the sampled distance
+    spacing = np.nanmax(index.batch.total_length) / 199
+    for point in points:
+        distances = segment_point_distances(
+            *segments, np.broadcast_to(point, (len(path_index), 1, 2))
+        ).min(axis=-1)
+        found, distance = index.nearest_path(point)
+        assert distance == pytest.approx(distances.min())
+        assert distances[np.searchsorted(path_index, found)] == pytest.approx(distance)
+        # The closed form distance agrees with densely sampled paths
+        sampled = np.linalg.norm(samples - point, axis=-1).min()
+        assert distance <= sampled + 1e-9 <= distance + 0.5 * spacing
+
+
+def test_empty_index():
+    batch = solve_dubins_batch(
+        RADIUS, np.zeros((1, 2)), [[1.0, 0.0]], [[10.0, 0.0]], [[1.0, 0.0]]
+    )
+    index = DubinsPathIndex(batch[4:])
+    assert len(index.paths_near_point([0.0, 0.0], 100.0)) == 0
+    assert len(index.paths_in_box([-100.0, -100.0, 100.0, 100.0])) == 0
+    assert index.nearest_path([0.0, 0.0]) == (-1, np.inf)
@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2026 Alexandre Loeblein Heinen
+
+"""Serialized paths load back as the saved batch, with or without geometry."""
+
+import numpy as np
+import pytest
+
+from dubins.batch2 import DubinsPathBatch, solve_dubins_batch
+from dubins.dubins2 import DubinsPath
+from dubins.path_type import PathType
+from dubins.serialize2 import (
+    has_geometry,
+    load_paths,
+    paths_from_bytes,
+    paths_to_bytes,
+    save_paths,
+)
+
+TOLERANCE = 1e-9
+
+
+@pytest.fixture(scope="module")
+def batch():
+    rng = np.random.default_rng(0)
+    heading = rng.uniform(0.0, 2 * np.pi, (2, 50))
+    tangent = np.stack((np.cos(heading), np.sin(heading)), axis=-1)
+    position = rng.uniform(-3.0, 3.0, (2, 50, 2))
+    radius = rng.uniform(0.5, 1.5, 50)
+    # Every path type, so that infeasible CCC rows are saved too
+    return solve_dubins_batch(radius, position[0], tangent[0], position[1], tangent[1])
+
+
+def assert_same_paths(loaded: DubinsPathBatch, batch: DubinsPathBatch):
+    assert loaded.shape == (np.prod(batch.shape),)
+    for name in DubinsPathBatch.fields:
+        expected = np.reshape(getattr(batch, name), np.shape(getattr(loaded, name)))
+        assert np.allclose(
+            getattr(loaded, name), expected, atol=TOLERANCE, equal_nan=True
+        ), name
+
+
+def serialize(kind: str, batch: DubinsPathBatch, geometry: bool, tmp_path):
+    if kind == "bytes":
+        return paths_from_bytes(paths_to_bytes(batch, geometry))
+    file_path = str(tmp_path / "paths.npy")
+    save_paths(file_path, batch, geometry)
+    return load_paths(file_path, mmap=kind == "mmap")
+
+
+@pytest.mark.parametrize("geometry", [True, False])
+@pytest.mark.parametrize("kind", ["bytes", "file", "mmap"])
+def test_round_trip(batch, kind, geometry, tmp_path):
+    records = serialize(kind, batch, geometry, tmp_path)
+    assert len(records) == batch.total_length.size
+    assert has_geometry(records.records) == geometry
+    assert not np.all(records.batch.is_valid)
+    assert_same_paths(records.batch, batch)
+
+
+@pytest.mark.parametrize("geometry", [True, False])
+def test_single_paths(batch, geometry):
+    records = paths_from_bytes(paths_to_bytes(batch, geometry))
+    flat = batch[np.ones(batch.shape, dtype=bool)]
+    for index in range(0, len(records), 7):
+        path = records[index]
+        assert isinstance(path, DubinsPath)
+        assert path.path_type == PathType(flat.path_type[index])
+        assert path.is_valid == flat.is_valid[index]
+        if path.is_valid:
+            assert path.total_length == pytest.approx(flat.total_length[index])
+            assert np.allclose(
+                path.final_tangent_position, flat.final_tangent_position[index]
+            )
+
+
+def test_subsets(batch):
+    records = paths_from_bytes(paths_to_bytes(batch))
+    assert_same_paths(records[50:100].batch, batch[1])
+
+
+def test_invalid_buffer():
+    with pytest.raises(ValueError):
+        paths_from_bytes(b"NOT DUBINS PATHS")